@@ -1,20 +1,53 @@
 """Входные адаптеры для CLI-команд."""
 
+import json
 import os
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Optional, Tuple
-
-from app.adapters.output import FileOutputWriter
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, ContextManager, Iterable, Iterator, List, Optional, Tuple
+
+from app.adapters.output import FileOutputWriter, FlushPolicy, QueuedSegmentWriter
+from app.adapters.output.audio import DecodedAudioCache
+from app.adapters.output.storage import (
+    JsonCheckpointStore,
+    JsonLemmaCacheStore,
+    JsonProtocolResponseCache,
+    SqliteWordFrequencyIndex,
+    default_protocol_cache_dir,
+)
+from app.application.services.indexed_word_analysis import IndexedWordAnalysisService
+from app.application.services.protocol_cache import CachingProtocolClient
 from app.application.services.word_analysis import WordAnalysisService
-from app.application.ports import ITranscriptionEngine, ITranscriptSegmentWriter
-from app.domain.models.protocol import ProtocolConfig
+from app.application.ports import (
+    ICheckpointStore,
+    ILemmaCacheStore,
+    IProtocolResponseCache,
+    ITranscriptionEngine,
+    ITranscriptSegmentWriter,
+    IWordFrequencyIndex,
+)
+from app.domain.models.batch import BatchItem, BatchReport
+from app.domain.models.protocol import DEFAULT_MAX_CHUNK_CHARS, DEFAULT_MAX_PARALLEL_REQUESTS, ProtocolConfig
 from app.domain.models.word_analysis import WordAnalysisConfig
 from app.factories import (
     create_transcription_adapter,
     create_transcription_service,
+    create_parallel_transcription_service,
+    create_batch_transcription_service,
     create_protocol_client,
     create_protocol_service,
     create_word_analysis_service,
+    create_parallel_word_analysis_service,
+    resolve_model_name,
+    is_faster_whisper_model,
+)
+from app.utils.batch_inputs import (
+    TRANSCRIPT_EXTENSIONS,
+    collect_directory,
+    derive_output_path,
+    expand_input_patterns,
+    read_manifest,
 )
 from app.utils.config import load_config
 
@@ -31,6 +64,14 @@ class ScribeCommandOptions:
     language: str = "ru"
     compute_type: str = "int8"
     verbose: bool = True
+    workers: int = 1
+    resume: bool = False
+    stream_window: Optional[float] = None
+    audio_cache_dir: Optional[str] = None
+    audio_cache_size: Optional[int] = None
+    flush_every: Optional[int] = None
+    flush_interval: Optional[float] = None
+    write_queue: Optional[int] = None
 
 
 class ScribeCommandHandler:
@@ -47,6 +88,15 @@ class ScribeCommandHandler:
         transcript_writer_factory: Optional[
             Callable[[str, bool], ITranscriptSegmentWriter]
         ] = None,
+        parallel_service_factory: Optional[
+            Callable[[str, str, int], Any]
+        ] = None,
+        checkpoint_store_factory: Optional[
+            Callable[[str], ICheckpointStore]
+        ] = None,
+        audio_cache_factory: Optional[
+            Callable[[str, Optional[int]], Any]
+        ] = None,
     ) -> None:
         self._transcription_adapter_factory = (
             transcription_adapter_factory or self._default_adapter_factory
@@ -57,40 +107,304 @@ class ScribeCommandHandler:
         self._transcript_writer_factory = (
             transcript_writer_factory or self._default_writer_factory
         )
+        self._parallel_service_factory = (
+            parallel_service_factory or self._default_parallel_service_factory
+        )
+        self._checkpoint_store_factory = (
+            checkpoint_store_factory or self._default_checkpoint_store_factory
+        )
+        self._audio_cache_factory = (
+            audio_cache_factory or self._default_audio_cache_factory
+        )
 
     def execute(self, options: ScribeCommandOptions) -> None:
-        adapter, model_name = self._transcription_adapter_factory(
-            options.model, options.compute_type
-        )
-        service = self._transcription_service_factory(adapter)
-        writer = self._transcript_writer_factory(options.output_path, options.verbose)
+        if options.resume and options.workers > 1:
+            raise ValueError("Опция --resume несовместима с параллельной транскрипцией (--workers > 1)")
+        if options.stream_window and options.workers > 1:
+            raise ValueError("Опция --stream-window несовместима с параллельной транскрипцией (--workers > 1)")
+        if options.audio_cache_dir and options.workers > 1:
+            raise ValueError("Опция --audio-cache несовместима с параллельной транскрипцией (--workers > 1)")
+
+        transcribe_kwargs = {}
+        writer_kwargs = {}
+        if options.flush_every or options.flush_interval:
+            writer_kwargs["flush_policy"] = FlushPolicy(
+                every_segments=options.flush_every, interval=options.flush_interval
+            )
+        if options.workers > 1:
+            # Воркеры загружают модель сами - адаптер в основном процессе не нужен
+            service = self._parallel_service_factory(
+                options.model, options.compute_type, options.workers
+            )
+            model_name = resolve_model_name(options.model)
+            writer = self._transcript_writer_factory(options.output_path, options.verbose, **writer_kwargs)
+        else:
+            if options.audio_cache_dir:
+                audio_cache = self._audio_cache_factory(options.audio_cache_dir, options.audio_cache_size)
+                adapter, model_name = self._transcription_adapter_factory(
+                    options.model, options.compute_type, audio_cache
+                )
+            else:
+                adapter, model_name = self._transcription_adapter_factory(
+                    options.model, options.compute_type
+                )
+            service = self._transcription_service_factory(adapter)
+            checkpoint_store = self._checkpoint_store_factory(options.output_path)
+            resume_from = checkpoint_store.load() if options.resume else None
+            if options.resume and resume_from is None:
+                print(
+                    f"Контрольная точка для {options.output_path} не найдена, "
+                    "транскрипция начнётся с начала",
+                    file=sys.stderr,
+                )
+            if resume_from is not None and (
+                os.path.abspath(resume_from.input_path) != os.path.abspath(options.input_path)
+            ):
+                raise ValueError(
+                    f"Контрольная точка {options.output_path} относится к другому файлу: "
+                    f"{resume_from.input_path}"
+                )
+            if resume_from is not None:
+                writer_kwargs["resume_offset"] = resume_from.writer_offset
+            writer = self._transcript_writer_factory(options.output_path, options.verbose, **writer_kwargs)
+            transcribe_kwargs = {
+                "checkpoint_store": checkpoint_store,
+                "resume_from": resume_from,
+            }
+            if options.stream_window:
+                transcribe_kwargs["stream_window"] = options.stream_window
+
+        if options.write_queue:
+            # Запись выполняется в фоновом потоке и не тормозит распознавание
+            writer = QueuedSegmentWriter(writer, max_queue=options.write_queue)
 
         try:
-            list(
-                service.transcribe(
-                    input_path=options.input_path,
-                    output_writer=writer,
-                    model_name=model_name,
-                    language=options.language,
-                    verbose=options.verbose,
-                    beam_size=DEFAULT_BEAM_SIZE,
-                )
+            segments = service.transcribe(
+                input_path=options.input_path,
+                output_writer=writer,
+                model_name=model_name,
+                language=options.language,
+                verbose=options.verbose,
+                beam_size=DEFAULT_BEAM_SIZE,
+                **transcribe_kwargs,
             )
         except Exception:
+            # Сервис не успел принять writer (например, не найден ffmpeg) - закрываем сами.
+            # Дальше writer закрывает сервис: повторное закрытие QueuedSegmentWriter
+            # снова пробросило бы ошибку записи вместо исходной
             writer.close()
             raise
+        # Сегменты уже записаны writer'ом - только прогоняем поток, не накапливая его
+        for _ in segments:
+            pass
 
     @staticmethod
-    def _default_adapter_factory(model: str, compute_type: str) -> Tuple[ITranscriptionEngine, str]:
-        return create_transcription_adapter(model=model, compute_type=compute_type)
+    def _default_adapter_factory(
+        model: str, compute_type: str, audio_cache: Optional[DecodedAudioCache] = None
+    ) -> Tuple[ITranscriptionEngine, str]:
+        return create_transcription_adapter(model=model, compute_type=compute_type, audio_cache=audio_cache)
 
     @staticmethod
     def _default_service_factory(engine: ITranscriptionEngine):
         return create_transcription_service(engine=engine)
 
     @staticmethod
-    def _default_writer_factory(output_path: str, verbose: bool) -> ITranscriptSegmentWriter:
-        return FileOutputWriter(output_path=output_path, verbose=verbose)
+    def _default_parallel_service_factory(model: str, compute_type: str, workers: int):
+        return create_parallel_transcription_service(
+            model=model, compute_type=compute_type, workers=workers
+        )
+
+    @staticmethod
+    def _default_writer_factory(
+        output_path: str,
+        verbose: bool,
+        resume_offset: Optional[int] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+    ) -> ITranscriptSegmentWriter:
+        return FileOutputWriter(
+            output_path=output_path,
+            verbose=verbose,
+            resume_offset=resume_offset,
+            flush_policy=flush_policy,
+        )
+
+    @staticmethod
+    def _default_checkpoint_store_factory(output_path: str) -> ICheckpointStore:
+        return JsonCheckpointStore.for_output(output_path)
+
+    @staticmethod
+    def _default_audio_cache_factory(cache_dir: str, max_bytes: Optional[int]) -> DecodedAudioCache:
+        if max_bytes is None:
+            return DecodedAudioCache(cache_dir)
+        return DecodedAudioCache(cache_dir, max_bytes=max_bytes)
+
+
+@dataclass(frozen=True)
+class ScribeBatchCommandOptions:
+    """Структура входных параметров для пакетного режима команды scribe."""
+
+    input_dir: Optional[str] = None
+    manifest_path: Optional[str] = None
+    output_dir: Optional[str] = None
+    report_path: Optional[str] = None
+    model: str = "small"
+    language: str = "ru"
+    compute_type: str = "int8"
+    concurrency: int = 1
+    workers: int = 1
+    verbose: bool = True
+
+
+class ScribeBatchCommandHandler:
+    """Оркестрация пакетного режима команды scribe (каталог или манифест)."""
+
+    REPORT_FILENAME = "scribe-report.json"
+
+    def __init__(
+        self,
+        transcription_adapter_factory: Optional[
+            Callable[[str, str], Tuple[ITranscriptionEngine, str]]
+        ] = None,
+        transcription_service_factory: Optional[
+            Callable[[ITranscriptionEngine], Any]
+        ] = None,
+        parallel_service_factory: Optional[
+            Callable[[str, str, int], Any]
+        ] = None,
+        batch_service_factory: Optional[Callable[..., Any]] = None,
+        transcript_writer_factory: Optional[
+            Callable[[str, bool], ITranscriptSegmentWriter]
+        ] = None,
+        report_writer: Optional[Callable[[str, dict], None]] = None,
+        model_stats_provider: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self._transcription_adapter_factory = (
+            transcription_adapter_factory or ScribeCommandHandler._default_adapter_factory
+        )
+        self._transcription_service_factory = (
+            transcription_service_factory or ScribeCommandHandler._default_service_factory
+        )
+        self._parallel_service_factory = (
+            parallel_service_factory or ScribeCommandHandler._default_parallel_service_factory
+        )
+        self._batch_service_factory = batch_service_factory or create_batch_transcription_service
+        self._transcript_writer_factory = (
+            transcript_writer_factory or ScribeCommandHandler._default_writer_factory
+        )
+        self._report_writer = report_writer or self._default_report_writer
+        self._model_stats_provider = model_stats_provider or self._default_model_stats_provider
+
+    def execute(self, options: ScribeBatchCommandOptions) -> BatchReport:
+        if (
+            options.concurrency > 1
+            and options.workers == 1
+            and not is_faster_whisper_model(options.model)
+        ):
+            # Файлы обрабатываются потоками одним движком, а модель OpenAI Whisper при
+            # декодировании вешает хуки KV-кэша на общий декодер - параллельные файлы
+            # портили бы друг другу результат
+            raise ValueError(
+                "Опция --concurrency > 1 поддерживается только для faster-whisper (-m faster:...) "
+                "или вместе с --workers > 1"
+            )
+        items = self.build_items(options)
+        if not items:
+            raise ValueError("Не найдено файлов для транскрипции")
+        if options.output_dir:
+            os.makedirs(options.output_dir, exist_ok=True)
+
+        if options.workers > 1:
+            # Воркеры загружают модель сами - адаптер в основном процессе не нужен
+            service = self._parallel_service_factory(
+                options.model, options.compute_type, options.workers
+            )
+            model_name = resolve_model_name(options.model)
+        else:
+            # Движок создаётся один раз на весь пакет
+            adapter, model_name = self._transcription_adapter_factory(
+                options.model, options.compute_type
+            )
+            service = self._transcription_service_factory(adapter)
+
+        batch_service = self._batch_service_factory(
+            transcription_service=service,
+            writer_factory=lambda path: self._transcript_writer_factory(path, False),
+            concurrency=options.concurrency,
+        )
+        report = batch_service.run(
+            items,
+            model_name=model_name,
+            language=options.language,
+            verbose=options.verbose,
+            beam_size=DEFAULT_BEAM_SIZE,
+        )
+
+        extra = {"model": options.model, "language": options.language}
+        model_stats = self._model_stats_provider()
+        if model_stats is not None:
+            extra["model_cache"] = asdict(model_stats)
+        report = replace(report, extra=extra)
+
+        self._report_writer(self._resolve_report_path(options), report.to_dict())
+        return report
+
+    @classmethod
+    def build_items(cls, options: ScribeBatchCommandOptions) -> List[BatchItem]:
+        if bool(options.input_dir) == bool(options.manifest_path):
+            raise ValueError("Укажите либо каталог с записями, либо файл манифеста")
+
+        if options.input_dir:
+            output_dir = options.output_dir or options.input_dir
+            items = [
+                BatchItem(input_path=path, output_path=derive_output_path(path, output_dir))
+                for path in collect_directory(options.input_dir)
+            ]
+        else:
+            if not os.path.exists(options.manifest_path):
+                raise FileNotFoundError(f"Файл манифеста не найден: {options.manifest_path}")
+            items = [
+                BatchItem(
+                    input_path=input_path,
+                    output_path=output_path or derive_output_path(input_path, options.output_dir),
+                )
+                for input_path, output_path in read_manifest(options.manifest_path)
+            ]
+        cls._check_unique_outputs(items)
+        return items
+
+    @staticmethod
+    def _check_unique_outputs(items: Iterable[BatchItem]) -> None:
+        """Запрещает запись двух файлов в один результат (a.mp3 и a.wav -> a.txt)."""
+        seen = {}
+        for item in items:
+            key = os.path.normcase(os.path.abspath(item.output_path))
+            if key in seen:
+                raise ValueError(
+                    f"Файлы {seen[key]} и {item.input_path} дают один и тот же результат "
+                    f"{item.output_path}; укажите пути результатов в манифесте"
+                )
+            seen[key] = item.input_path
+
+    @classmethod
+    def _resolve_report_path(cls, options: ScribeBatchCommandOptions) -> str:
+        if options.report_path:
+            return options.report_path
+        directory = (
+            options.output_dir
+            or options.input_dir
+            or os.path.dirname(os.path.abspath(options.manifest_path))
+        )
+        return os.path.join(directory, cls.REPORT_FILENAME)
+
+    @staticmethod
+    def _default_model_stats_provider():
+        from app.adapters.output.whisper import get_default_model_registry
+        return get_default_model_registry().stats()
+
+    @staticmethod
+    def _default_report_writer(report_path: str, report: dict) -> None:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
 
 
 @dataclass(frozen=True)
@@ -98,6 +412,11 @@ class ProtocolCommandOptions:
     transcript_path: str
     output_path: Optional[str]
     config_path: Optional[str]
+    # None - как в конфиге провайдера (ключ stream)
+    stream: Optional[bool] = None
+    use_cache: bool = False
+    # None - каталог кэша по умолчанию (default_protocol_cache_dir)
+    cache_dir: Optional[str] = None
 
 
 class ProtocolCommandHandler:
@@ -112,6 +431,8 @@ class ProtocolCommandHandler:
         protocol_client_factory: Optional[Callable[[ProtocolConfig], Any]] = None,
         protocol_service_factory: Optional[Callable[[Any], Any]] = None,
         output_writer: Optional[Callable[[Optional[str], str], None]] = None,
+        stream_writer_factory: Optional[Callable[[Optional[str]], ContextManager[Callable[[str], None]]]] = None,
+        response_cache_factory: Optional[Callable[[str], IProtocolResponseCache]] = None,
     ) -> None:
         self._config_loader = config_loader or load_config
         self._config_parser = config_parser or self._default_config_parser
@@ -120,6 +441,8 @@ class ProtocolCommandHandler:
         self._protocol_client_factory = protocol_client_factory or create_protocol_client
         self._protocol_service_factory = protocol_service_factory or create_protocol_service
         self._output_writer = output_writer or self._default_output_writer
+        self._stream_writer_factory = stream_writer_factory or self._default_stream_writer
+        self._response_cache_factory = response_cache_factory or JsonProtocolResponseCache
 
     def execute(self, options: ProtocolCommandOptions) -> None:
         if not os.path.exists(options.transcript_path):
@@ -147,6 +470,8 @@ class ProtocolCommandHandler:
             instructions_path = os.path.join(config_dir, instructions_path)
 
         config = self._config_parser(provider_key, provider_section, instructions_path)
+        if options.stream is not None:
+            config = replace(config, stream=options.stream)
 
         instructions_text = ""
         if instructions_path:
@@ -158,12 +483,36 @@ class ProtocolCommandHandler:
         print("Отправка запроса к провайдеру протоколов...", flush=True)
 
         client = self._protocol_client_factory(config)
+        caching_client = None
+        if options.use_cache:
+            # Повторный запуск с тем же промптом и параметрами не обращается к провайдеру
+            cache = self._response_cache_factory(options.cache_dir or default_protocol_cache_dir())
+            client = caching_client = CachingProtocolClient(client, cache)
         service = self._protocol_service_factory(client)
-        response = service.generate_protocol(
-            instructions=instructions_text,
-            transcript=transcript_text,
-            config=config,
-        )
+        try:
+            if config.stream:
+                # Текст пишется в файл (или консоль) по мере генерации, а не после ответа
+                with self._stream_writer_factory(options.output_path) as write_token:
+                    service.generate_protocol(
+                        instructions=instructions_text,
+                        transcript=transcript_text,
+                        config=config,
+                        on_token=write_token,
+                    )
+                return
+
+            response = service.generate_protocol(
+                instructions=instructions_text,
+                transcript=transcript_text,
+                config=config,
+            )
+        finally:
+            # Закрывает пул соединений клиента (у подменённых сервисов close может не быть)
+            close = getattr(service, "close", None)
+            if close is not None:
+                close()
+            if caching_client is not None:
+                print(caching_client.stats().to_text(), file=sys.stderr)
         self._output_writer(options.output_path, response.content)
 
     @staticmethod
@@ -178,7 +527,15 @@ class ProtocolCommandHandler:
 
         model = section.get("model", "deepseek-chat")
         temperature = section.get("temperature", 0.7)
-        known_keys = {"api_key", "model", "instructions", "temperature"}
+        # Параметры разбиения длинных расшифровок не передаются в API провайдера
+        max_chunk_chars = section.get("max_chunk_chars", DEFAULT_MAX_CHUNK_CHARS)
+        max_parallel_requests = section.get("max_parallel_requests", DEFAULT_MAX_PARALLEL_REQUESTS)
+        stream = bool(section.get("stream", False))
+        request_timeout = section.get("request_timeout")
+        known_keys = {
+            "api_key", "model", "instructions", "temperature",
+            "max_chunk_chars", "max_parallel_requests", "stream", "request_timeout",
+        }
         extra_params = {k: v for k, v in section.items() if k not in known_keys}
 
         return ProtocolConfig(
@@ -188,6 +545,10 @@ class ProtocolCommandHandler:
             instructions_path=instructions_path,
             temperature=temperature,
             extra_params=extra_params,
+            max_chunk_chars=max_chunk_chars,
+            max_parallel_requests=max_parallel_requests,
+            stream=stream,
+            request_timeout=request_timeout,
         )
 
     @staticmethod
@@ -203,15 +564,43 @@ class ProtocolCommandHandler:
         else:
             print(content)
 
+    @staticmethod
+    @contextmanager
+    def _default_stream_writer(output_path: Optional[str]) -> Iterator[Callable[[str], None]]:
+        """Отдаёт функцию записи фрагментов протокола в файл или консоль со сбросом буфера."""
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as f:
+                def write_token(token: str) -> None:
+                    f.write(token)
+                    f.flush()
+
+                yield write_token
+        else:
+            yield lambda token: print(token, end="", flush=True)
+            print()
+
 
 @dataclass(frozen=True)
 class TagCommandOptions:
-    transcript_path: str
+    transcript_path: Optional[str]
     output_path: Optional[str]
     limit: int = 50
     lemmatize: bool = False
     stopwords_path: Optional[str] = None
     exclude_names: bool = False
+    lemma_cache_path: Optional[str] = None
+    workers: int = 1
+    transcript_paths: Tuple[str, ...] = ()
+    input_dir: Optional[str] = None
+    manifest_path: Optional[str] = None
+    per_file: bool = False
+    index_path: Optional[str] = None
+    approximate: bool = False
+    error_rate: Optional[float] = None
+    max_counters: Optional[int] = None
+    ngram_sizes: Tuple[int, ...] = ()
+    ngram_min_count: Optional[int] = None
+    tokenizer: Optional[str] = None
 
 
 class TagCommandHandler:
@@ -221,35 +610,109 @@ class TagCommandHandler:
         self,
         file_reader: Optional[Callable[[str], Iterable[str]]] = None,
         stopwords_loader: Optional[Callable[[Optional[str]], Iterable[str]]] = None,
-        analysis_service_factory: Optional[Callable[[], WordAnalysisService]] = None,
+        analysis_service_factory: Optional[Callable[..., WordAnalysisService]] = None,
         output_writer: Optional[Callable[[Optional[str], str], None]] = None,
+        lemma_cache_store_factory: Optional[Callable[[str], ILemmaCacheStore]] = None,
+        parallel_analysis_factory: Optional[Callable[[WordAnalysisService, int], Any]] = None,
+        word_index_factory: Optional[Callable[[str], IWordFrequencyIndex]] = None,
     ) -> None:
         self._file_reader = file_reader or self._default_file_reader
         self._stopwords_loader = stopwords_loader or self._default_stopwords_loader
         self._analysis_service_factory = analysis_service_factory or create_word_analysis_service
         self._output_writer = output_writer or self._default_output_writer
+        self._lemma_cache_store_factory = lemma_cache_store_factory or JsonLemmaCacheStore
+        self._parallel_analysis_factory = parallel_analysis_factory or create_parallel_word_analysis_service
+        self._word_index_factory = word_index_factory or SqliteWordFrequencyIndex
 
     def execute(self, options: TagCommandOptions) -> None:
-        if not os.path.exists(options.transcript_path):
-            raise FileNotFoundError(f"Файл с расшифровкой не найден: {options.transcript_path}")
-
-        lines = self._file_reader(options.transcript_path)
+        if options.approximate and options.index_path:
+            raise ValueError("Приблизительный подсчёт несовместим с индексом частот (--index)")
+        if options.approximate and options.per_file:
+            raise ValueError("Приблизительный подсчёт несовместим с разбивкой по файлам (--per-file)")
+        if options.ngram_sizes and options.index_path:
+            raise ValueError("Подсчёт n-грамм несовместим с индексом частот (--index)")
+        if options.ngram_sizes and options.per_file:
+            raise ValueError("Подсчёт n-грамм несовместим с разбивкой по файлам (--per-file)")
+
+        paths = self._resolve_inputs(options)
         stopwords = self._stopwords_loader(options.stopwords_path)
         config = WordAnalysisConfig(
             lemmatize=options.lemmatize,
             exclude_names=options.exclude_names,
             limit=options.limit,
+            approximate=options.approximate,
+            ngram_sizes=tuple(options.ngram_sizes),
         )
+        # Неуказанные параметры приблизительного режима берутся из значений по умолчанию
+        if options.error_rate is not None:
+            config = replace(config, error_rate=options.error_rate)
+        if options.max_counters is not None:
+            config = replace(config, max_counters=options.max_counters)
+        if options.ngram_min_count is not None:
+            config = replace(config, ngram_min_count=options.ngram_min_count)
+
+        if options.tokenizer:
+            service = self._analysis_service_factory(tokenizer=options.tokenizer)
+        else:
+            service = self._analysis_service_factory()
+        lemma_cache_store = None
+        if options.lemmatize and options.lemma_cache_path:
+            # Разборы словоформ с прошлых запусков: лемматизация стартует «тёплой»
+            lemma_cache_store = self._lemma_cache_store_factory(options.lemma_cache_path)
+            service.lemma_cache.update(lemma_cache_store.load().items())
+        if options.workers > 1:
+            service = self._parallel_analysis_factory(service, options.workers)
+
+        if options.index_path:
+            # Пересчитываются только расшифровки, которых ещё нет в индексе
+            index = self._word_index_factory(options.index_path)
+            try:
+                indexed = IndexedWordAnalysisService(service, index)
+                result = indexed.analyze_paths(
+                    paths, self._file_reader, stopwords=stopwords, config=config, per_file=options.per_file
+                )
+            finally:
+                index.close()
+            print(indexed.stats().to_text(), file=sys.stderr)
+        elif len(paths) == 1 and not options.per_file:
+            result = service.analyze(lines=self._file_reader(paths[0]), stopwords=stopwords, config=config)
+        else:
+            # Файлы читаются по очереди одним сервисом: анализатор и кэш лемм общие
+            files = ((path, self._file_reader(path)) for path in paths)
+            result = service.analyze_files(files, stopwords=stopwords, config=config, per_file=options.per_file)
 
-        service = self._analysis_service_factory()
-        result = service.analyze(lines=lines, stopwords=stopwords, config=config)
+        if lemma_cache_store is not None:
+            lemma_cache_store.save(service.lemma_cache.items())
+            print(service.lemma_cache.stats().to_text(), file=sys.stderr)
         self._output_writer(options.output_path, result.to_text())
 
+    @staticmethod
+    def _resolve_inputs(options: TagCommandOptions) -> List[str]:
+        """Собирает список расшифровок из путей, glob-шаблонов, каталога и манифеста."""
+        paths: List[str] = []
+        if options.transcript_path:
+            paths.append(options.transcript_path)
+        paths.extend(expand_input_patterns(options.transcript_paths))
+        if options.input_dir:
+            paths.extend(collect_directory(options.input_dir, TRANSCRIPT_EXTENSIONS))
+        if options.manifest_path:
+            paths.extend(input_path for input_path, _ in read_manifest(options.manifest_path))
+        # Один файл, попавший под несколько источников, учитывается один раз
+        paths = list(dict.fromkeys(paths))
+
+        if not paths:
+            raise FileNotFoundError("Не найдено ни одного файла с расшифровкой")
+        for path in paths:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Файл с расшифровкой не найден: {path}")
+        return paths
+
     @staticmethod
     def _default_file_reader(path: str) -> Iterable[str]:
+        # Файл читается лениво, по строке: весь текст в памяти не держится
         try:
             with open(path, "r", encoding="utf-8") as f:
-                return f.readlines()
+                yield from f
         except FileNotFoundError:
             raise
         except Exception as exc:
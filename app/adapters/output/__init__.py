@@ -1,8 +1,9 @@
 """Адаптеры для вывода результатов транскрипции."""
 
-from app.adapters.output.file_writer import FileOutputWriter
+from app.adapters.output.file_writer import FileOutputWriter, FlushPolicy
+from app.adapters.output.queued_writer import QueuedSegmentWriter, DEFAULT_WRITE_QUEUE_SIZE
 
-__all__ = ["FileOutputWriter"]
+__all__ = ["FileOutputWriter", "FlushPolicy", "QueuedSegmentWriter", "DEFAULT_WRITE_QUEUE_SIZE"]
 
 
 
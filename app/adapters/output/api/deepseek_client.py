@@ -1,19 +1,26 @@
 """Адаптер для DeepSeek API."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 import json
 
-import requests
-
+from app.adapters.output.api.sse import iter_sse_data
 from app.application.ports import ILLMProtocolClient
 from app.domain.exceptions import ProtocolClientError
 from app.domain.models.protocol import ProtocolRequest, ProtocolResponse
 
 
 class DeepSeekProtocolClient(ILLMProtocolClient):
-    """Реализация порта для DeepSeek API."""
+    """Реализация порта для DeepSeek API.
+
+    Без внешнего http_client клиент создаёт собственную requests.Session с
+    пулом keep-alive соединений: последовательные и параллельные запросы
+    (пакетная генерация, части длинной расшифровки) переиспользуют
+    TCP+TLS-соединения вместо нового рукопожатия на каждый запрос. Сессия
+    закрывается методом close() или при выходе из контекстного менеджера.
+    """
 
     DEFAULT_BASE_URL = "https://api.deepseek.com/v1/chat/completions"
+    DEFAULT_POOL_SIZE = 10
 
     def __init__(
         self,
@@ -21,16 +28,55 @@ class DeepSeekProtocolClient(ILLMProtocolClient):
         http_client: Optional[Any] = None,
         base_url: str = DEFAULT_BASE_URL,
         timeout: int = 300,
+        pool_size: int = DEFAULT_POOL_SIZE,
     ) -> None:
+        """
+        Args:
+            api_key: Ключ DeepSeek API
+            http_client: HTTP-клиент с методом post (по умолчанию собственная сессия с пулом;
+                переданный клиент не закрывается методом close)
+            base_url: Адрес chat completions
+            timeout: Таймаут запроса в секундах
+            pool_size: Максимум одновременно открытых соединений собственной сессии
+        """
         if not api_key:
             raise ValueError("DeepSeek API key is required")
+        if pool_size < 1:
+            raise ValueError("pool_size должен быть не меньше 1")
 
         self._api_key = api_key
-        self._http_client = http_client or requests
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = self._create_session(pool_size)
+        self._http_client = http_client
         self._base_url = base_url
         self._timeout = timeout
 
-    def generate_protocol(self, request: ProtocolRequest) -> ProtocolResponse:
+    @staticmethod
+    def _create_session(pool_size: int) -> Any:
+        """Создаёт requests.Session с пулом соединений на pool_size подключений."""
+        # requests импортируется только при работе с API: tag и scribe не платят за его загрузку
+        import requests  # type: ignore[import]
+        from requests.adapters import HTTPAdapter  # type: ignore[import]
+
+        session = requests.Session()
+        # pool_block: при нехватке соединений запрос ждёт свободное, а не открывает лишнее
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Закрывает собственную сессию и её соединения."""
+        if self._owns_http_client:
+            self._http_client.close()
+
+    def generate_protocol(
+        self,
+        request: ProtocolRequest,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> ProtocolResponse:
+        stream = request.config.stream
         payload: Dict[str, Any] = {
             "model": request.config.model,
             "messages": [
@@ -44,19 +90,25 @@ class DeepSeekProtocolClient(ILLMProtocolClient):
 
         if request.config.extra_params:
             payload.update(request.config.extra_params)
+        if stream:
+            payload["stream"] = True
 
         headers = {
             "Authorization": f"Bearer {self._api_key}",
             "Content-Type": "application/json",
         }
 
+        import requests  # type: ignore[import]
+
+        # request_timeout из конфига перекрывает таймаут клиента: HTTP-запрос обрывается
+        # сам, а не продолжает занимать соединение и поток после истечения срока
+        timeout = request.config.request_timeout or self._timeout
+        post_kwargs: Dict[str, Any] = {"json": payload, "headers": headers, "timeout": timeout}
+        if stream:
+            # Тело читается по мере поступления, а не после завершения генерации
+            post_kwargs["stream"] = True
         try:
-            response = self._http_client.post(
-                self._base_url,
-                json=payload,
-                headers=headers,
-                timeout=self._timeout,
-            )
+            response = self._http_client.post(self._base_url, **post_kwargs)
         except requests.RequestException as exc:
             raise ProtocolClientError(f"Ошибка при отправке запроса в DeepSeek: {exc}") from exc
 
@@ -70,6 +122,9 @@ class DeepSeekProtocolClient(ILLMProtocolClient):
                 f"DeepSeek вернул ошибку {response.status_code}: {error_detail}"
             )
 
+        if stream:
+            return self._read_stream(response, on_token)
+
         try:
             data = response.json()
         except ValueError as exc:
@@ -82,4 +137,55 @@ class DeepSeekProtocolClient(ILLMProtocolClient):
 
         return ProtocolResponse(content=content, provider_raw=data)
 
+    @staticmethod
+    def _read_stream(response: Any, on_token: Optional[Callable[[str], None]]) -> ProtocolResponse:
+        """Собирает ответ из потока SSE, передавая фрагменты текста в on_token.
+
+        provider_raw повторяет форму обычного (непотокового) ответа, так что
+        собранный ProtocolResponse не зависит от режима.
+        """
+        import requests  # type: ignore[import]
 
+        pieces: List[str] = []
+        raw: Dict[str, Any] = {}
+        finish_reason = None
+        done = False
+        try:
+            # chunk_size=None: строки отдаются сразу по приходу данных, без буфера в 512 байт
+            for data in iter_sse_data(response.iter_lines(chunk_size=None)):
+                # После [DONE] поток дочитывается до конца: недочитанный ответ закрыл бы
+                # соединение, а дочитанный возвращает его в пул сессии
+                if done or data == "[DONE]":
+                    done = True
+                    continue
+                try:
+                    event = json.loads(data)
+                    choice = event["choices"][0] if event.get("choices") else {}
+                except (ValueError, KeyError, IndexError, TypeError, AttributeError) as exc:
+                    raise ProtocolClientError(f"Некорректное событие потока DeepSeek: {data}") from exc
+
+                for key in ("id", "object", "created", "model", "system_fingerprint", "usage"):
+                    if event.get(key) is not None:
+                        raw[key] = event[key]
+                finish_reason = choice.get("finish_reason") or finish_reason
+                piece = (choice.get("delta") or {}).get("content")
+                if piece:
+                    pieces.append(piece)
+                    if on_token is not None:
+                        on_token(piece)
+        except requests.RequestException as exc:
+            raise ProtocolClientError(f"Поток ответа DeepSeek прерван: {exc}") from exc
+        finally:
+            response.close()
+
+        if not pieces and finish_reason is None:
+            raise ProtocolClientError("Ответ DeepSeek не содержит контент")
+
+        content = "".join(pieces)
+        raw["object"] = "chat.completion"
+        raw["choices"] = [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": finish_reason,
+        }]
+        return ProtocolResponse(content=content, provider_raw=raw)
@@ -0,0 +1,30 @@
+"""Разбор потока server-sent events (SSE)."""
+
+from typing import Iterable, Iterator, List, Union
+
+
+def iter_sse_data(lines: Iterable[Union[bytes, str]]) -> Iterator[str]:
+    """Отдаёт поле data каждого события SSE по мере поступления строк.
+
+    Событие завершается пустой строкой; несколько строк data одного события
+    склеиваются через перевод строки. Комментарии (строки с ":"), например
+    keep-alive, и прочие поля (event, id, retry) пропускаются. Байтовые строки
+    декодируются как UTF-8, независимо от кодировки, угаданной HTTP-клиентом.
+    """
+    data: List[str] = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.rstrip("\r")
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield "\n".join(data)
@@ -0,0 +1,6 @@
+"""Адаптеры источников аудио."""
+
+from app.adapters.output.audio.decoded_cache import DecodedAudioCache, DEFAULT_AUDIO_CACHE_SIZE
+from app.adapters.output.audio.ffmpeg_source import FFmpegAudioSource
+
+__all__ = ["DecodedAudioCache", "DEFAULT_AUDIO_CACHE_SIZE", "FFmpegAudioSource"]
@@ -0,0 +1,154 @@
+"""Дисковый кэш декодированного аудио."""
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.utils.audio import SAMPLE_RATE, decode_audio
+
+# Ограничение размера кэша по умолчанию (около 20 часов записи в float32, 16 кГц)
+DEFAULT_AUDIO_CACHE_SIZE = 5 * 1024 ** 3
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class DecodedAudioCache:
+    """Кэш декодированных записей (моно float32, 16 кГц) в файлах .npy.
+
+    Ключ - SHA-256 содержимого исходного файла, поэтому переименование или
+    копирование записи не приводит к повторному декодированию, а изменение
+    содержимого - приводит. Записи читаются через memory map без копирования
+    в память процесса; при превышении max_bytes удаляются давно не
+    использованные файлы (LRU по времени последнего обращения).
+    """
+
+    SUFFIX = ".npy"
+
+    def __init__(self,
+                 cache_dir: str,
+                 max_bytes: Optional[int] = DEFAULT_AUDIO_CACHE_SIZE,
+                 decoder: Optional[Callable[..., Any]] = None,
+                 sample_rate: int = SAMPLE_RATE):
+        """
+        Args:
+            cache_dir: Каталог кэша (создаётся при необходимости)
+            max_bytes: Максимальный суммарный размер кэша в байтах (None - без ограничения)
+            decoder: Декодирование файла в массив отсчётов (по умолчанию через ffmpeg)
+            sample_rate: Частота дискретизации кэшируемых отсчётов
+        """
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._decoder = decoder or decode_audio
+        self._sample_rate = sample_rate
+        self._lock = threading.Lock()
+        # Хэши уже прочитанных файлов: (путь, размер, mtime) -> sha256
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def load(self, audio_path: str) -> Any:
+        """Возвращает декодированную запись, при промахе декодирует и сохраняет её.
+
+        Args:
+            audio_path: Путь к аудио/видеофайлу
+
+        Returns:
+            numpy.memmap: Отсчёты записи только для чтения
+        """
+        import numpy as np  # type: ignore[import]
+
+        entry_path = self._entry_path(self.content_key(audio_path))
+        if os.path.exists(entry_path):
+            try:
+                audio = np.load(entry_path, mmap_mode="r")
+            except (OSError, ValueError):
+                # Повреждённая запись кэша - декодируем заново
+                os.remove(entry_path)
+            else:
+                os.utime(entry_path)
+                with self._lock:
+                    self.hits += 1
+                return audio
+
+        with self._lock:
+            self.misses += 1
+        samples = np.asarray(self._decoder(audio_path, sample_rate=self._sample_rate), dtype=np.float32)
+        self._store(entry_path, samples)
+        self._evict(keep=entry_path)
+        return np.load(entry_path, mmap_mode="r")
+
+    def content_key(self, audio_path: str) -> str:
+        """Вычисляет ключ записи: SHA-256 содержимого файла и частота дискретизации."""
+        stat = os.stat(audio_path)
+        identity = (os.path.abspath(audio_path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(identity)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(audio_path, "rb") as f:
+                for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            with self._lock:
+                self._digests[identity] = digest
+        return f"{digest}-{self._sample_rate}"
+
+    def size(self) -> int:
+        """Суммарный размер записей кэша в байтах."""
+        return sum(size for _, _, size in self._entries())
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + self.SUFFIX)
+
+    def _store(self, entry_path: str, samples: Any) -> None:
+        """Атомарно сохраняет отсчёты: временный файл в каталоге кэша и os.replace."""
+        import numpy as np  # type: ignore[import]
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, samples)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _entries(self):
+        if not os.path.isdir(self._cache_dir):
+            return []
+        entries = []
+        for name in os.listdir(self._cache_dir):
+            if not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self._cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        """Удаляет самые давние записи, пока кэш не уложится в max_bytes."""
+        if self._max_bytes is None:
+            return
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,114 @@
+"""Потоковое декодирование аудио через ffmpeg."""
+
+import subprocess
+import tempfile
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from app.application.ports.audio_port import IAudioSource
+from app.domain.models.transcript import AudioChunk
+from app.utils.audio import SAMPLE_RATE
+
+# Размер отсчёта PCM s16le в байтах
+_BYTES_PER_SAMPLE = 2
+
+
+class FFmpegAudioSource(IAudioSource):
+    """Источник аудио, читающий PCM из конвейера ffmpeg окнами фиксированной длины.
+
+    ffmpeg запускается один раз на запись и пишет моно s16le в stdout;
+    адаптер дочитывает из конвейера ровно столько, сколько нужно для
+    очередного окна, и держит в памяти только его (с перекрытием).
+    """
+
+    def __init__(self,
+                 sample_rate: int = SAMPLE_RATE,
+                 process_factory: Optional[Callable[..., Any]] = None):
+        """
+        Args:
+            sample_rate: Частота дискретизации отсчётов
+            process_factory: Запуск процесса ffmpeg (по умолчанию subprocess.Popen)
+        """
+        self._sample_rate = sample_rate
+        self._process_factory = process_factory or subprocess.Popen
+
+    def windows(self,
+                audio_path: str,
+                window_duration: float,
+                overlap: float = 0.0,
+                start: float = 0.0) -> Iterator[Tuple[AudioChunk, Any]]:
+        import numpy as np  # type: ignore[import]
+
+        if window_duration <= 0:
+            raise ValueError("Длительность окна должна быть положительной")
+        if overlap < 0:
+            raise ValueError("Перекрытие не может быть отрицательным")
+
+        rate = self._sample_rate
+        own = int(round(window_duration * rate))
+        pad = int(round(overlap * rate))
+
+        with tempfile.TemporaryFile() as stderr:
+            process = self._process_factory(
+                self._build_command(audio_path, start), stdout=subprocess.PIPE, stderr=stderr
+            )
+            try:
+                # buffer[0] соответствует отсчёту buffer_offset (от момента start)
+                buffer = np.empty(0, dtype=np.float32)
+                buffer_offset = 0
+                eof = False
+                index = 0
+                while True:
+                    own_start = index * own
+                    needed_end = own_start + own + pad
+                    missing = needed_end - (buffer_offset + len(buffer))
+                    if missing > 0 and not eof:
+                        data = process.stdout.read(missing * _BYTES_PER_SAMPLE)
+                        eof = len(data) < missing * _BYTES_PER_SAMPLE
+                        usable = len(data) - len(data) % _BYTES_PER_SAMPLE
+                        samples = np.frombuffer(data[:usable], np.int16).astype(np.float32) / 32768.0
+                        buffer = np.concatenate((buffer, samples))
+
+                    available_end = buffer_offset + len(buffer)
+                    if own_start >= available_end:
+                        break
+
+                    is_last = eof and available_end <= own_start + own
+                    window_start = max(0, own_start - pad)
+                    window_end = min(needed_end, available_end)
+                    own_end = available_end if is_last else own_start + own
+                    chunk = AudioChunk(
+                        index=index,
+                        start=start + window_start / rate,
+                        end=start + window_end / rate,
+                        own_start=start + own_start / rate,
+                        own_end=start + own_end / rate,
+                    )
+                    yield chunk, buffer[window_start - buffer_offset:window_end - buffer_offset]
+
+                    if is_last:
+                        break
+                    # Оставляем только то, что понадобится следующему окну (его левое перекрытие)
+                    keep_from = max(0, own_start + own - pad)
+                    buffer = buffer[keep_from - buffer_offset:]
+                    buffer_offset = keep_from
+                    index += 1
+
+                returncode = process.wait()
+                if returncode != 0:
+                    stderr.seek(0)
+                    message = stderr.read().decode("utf-8", errors="replace").strip()
+                    raise RuntimeError(f"ffmpeg не смог декодировать файл {audio_path}: {message[-500:]}")
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+    def _build_command(self, audio_path: str, start: float) -> list:
+        command = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error"]
+        if start > 0:
+            command += ["-ss", f"{start:.3f}"]
+        command += [
+            "-i", audio_path,
+            "-vn", "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(self._sample_rate), "-",
+        ]
+        return command
@@ -1,10 +1,39 @@
 """Адаптер для записи транскрипции в файл."""
 
-from typing import Optional
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
 from app.application.ports.output_port import ITranscriptSegmentWriter
 from app.domain.models.transcript import Segment
 
 
+@dataclass(frozen=True)
+class FlushPolicy:
+    """Политика сброса буфера FileOutputWriter.
+    
+    Буфер сбрасывается, когда выполнено любое из заданных условий; если не
+    задано ни одно, данные сбрасываются только при checkpoint() и close().
+    
+    Attributes:
+        every_segments: Сбрасывать после каждых N сегментов
+        interval: Сбрасывать, если с прошлого сброса прошло больше T секунд
+        fsync: Вызывать os.fsync при каждом сбросе (по умолчанию сохранность
+            обеспечивают контрольные точки транскрипции)
+    """
+    
+    every_segments: Optional[int] = None
+    interval: Optional[float] = None
+    fsync: bool = False
+    
+    def __post_init__(self) -> None:
+        if self.every_segments is not None and self.every_segments < 1:
+            raise ValueError("every_segments должно быть не меньше 1")
+        if self.interval is not None and self.interval <= 0:
+            raise ValueError("interval должен быть положительным")
+
+
 class FileOutputWriter(ITranscriptSegmentWriter):
     """Адаптер для записи транскрипции в файл с выводом в консоль.
     
@@ -12,15 +41,36 @@ class FileOutputWriter(ITranscriptSegmentWriter):
     к интерфейсу ITranscriptSegmentWriter.
     """
     
-    def __init__(self, output_path: str, verbose: bool = False):
+    def __init__(self,
+                 output_path: str,
+                 verbose: bool = False,
+                 resume_offset: Optional[int] = None,
+                 flush_policy: Optional[FlushPolicy] = None,
+                 clock: Optional[Callable[[], float]] = None):
         """
         Args:
             output_path: Путь к выходному файлу
             verbose: Если True, выводит сегменты на экран в реальном времени
+            resume_offset: Если задано, файл не перезаписывается: он обрезается
+                до этого смещения (из контрольной точки) и дописывается
+            flush_policy: Политика пакетного сброса; None - сброс после каждого
+                сегмента. При заданной политике вывод на экран тоже
+                выполняется пакетами, в момент сброса
+            clock: Источник времени для flush_policy.interval (по умолчанию time.monotonic)
         """
         self._output_path = output_path
         self._verbose = verbose
-        self._file = open(output_path, "w", encoding="utf-8")
+        self._flush_policy = flush_policy
+        self._clock = clock or time.monotonic
+        self._pending_segments = 0
+        self._pending_console: List[str] = []
+        self._last_flush = self._clock()
+        if resume_offset is None:
+            self._file = open(output_path, "w", encoding="utf-8")
+        else:
+            # Отбрасываем хвост, записанный после последней контрольной точки
+            os.truncate(output_path, resume_offset)
+            self._file = open(output_path, "a", encoding="utf-8")
     
     def write_segment(self, segment: Segment) -> None:
         """Записывает сегмент транскрипции в файл и на экран (если verbose=True).
@@ -32,14 +82,51 @@ class FileOutputWriter(ITranscriptSegmentWriter):
         
         # Записываем в файл
         self._file.write(line)
-        # Сбрасываем буфер после каждой записи, чтобы данные не терялись
-        self._file.flush()
         
-        # Выводим на экран в реальном времени, если verbose=True
+        if self._flush_policy is None:
+            # Сбрасываем буфер после каждой записи, чтобы данные не терялись
+            self._file.flush()
+            
+            # Выводим на экран в реальном времени, если verbose=True
+            if self._verbose:
+                print(line.strip())
+            return
+        
+        self._pending_segments += 1
         if self._verbose:
-            print(line.strip())
+            self._pending_console.append(line)
+        if self._should_flush():
+            self._flush(fsync=self._flush_policy.fsync)
+    
+    def _should_flush(self) -> bool:
+        policy = self._flush_policy
+        if policy.every_segments is not None and self._pending_segments >= policy.every_segments:
+            return True
+        if policy.interval is not None and self._clock() - self._last_flush >= policy.interval:
+            return True
+        return False
+    
+    def _flush(self, fsync: bool = False) -> None:
+        """Сбрасывает буфер файла и накопленный вывод на экран."""
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+        if self._pending_console:
+            # Одна запись в терминал на пакет сегментов вместо записи на каждый
+            sys.stdout.write("".join(self._pending_console))
+            sys.stdout.flush()
+            self._pending_console = []
+        self._pending_segments = 0
+        self._last_flush = self._clock()
+    
+    def checkpoint(self) -> Optional[int]:
+        """Сбрасывает данные на диск (fsync) и возвращает текущее смещение в файле."""
+        self._flush(fsync=True)
+        return self._file.tell()
     
     def close(self) -> None:
         """Завершает запись и закрывает файл."""
+        if not self._file.closed:
+            self._flush()
         self._file.close()
 
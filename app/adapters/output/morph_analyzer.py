@@ -0,0 +1,54 @@
+"""Общий для процесса морфологический анализатор pymorphy3 с отложенной загрузкой."""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MORPH_LANG = "ru"
+
+_shared_analyzers: Dict[str, Any] = {}
+_shared_analyzers_lock = threading.Lock()
+
+
+def get_shared_morph_analyzer(lang: str = DEFAULT_MORPH_LANG) -> Any:
+    """Возвращает общий для процесса pymorphy3.MorphAnalyzer (создаётся при первом вызове).
+
+    Загрузка словарей - самая дорогая часть запуска tag, поэтому анализатор
+    создаётся один раз на процесс и переиспользуется всеми сервисами.
+    """
+    with _shared_analyzers_lock:
+        analyzer = _shared_analyzers.get(lang)
+        if analyzer is None:
+            import pymorphy3  # type: ignore[import]
+
+            analyzer = pymorphy3.MorphAnalyzer(lang=lang)
+            _shared_analyzers[lang] = analyzer
+        return analyzer
+
+
+class LazyMorphAnalyzer:
+    """Заместитель MorphAnalyzer: словари загружаются при первом разборе слова.
+
+    Подсчёт частот без лемматизации не вызывает parse и поэтому не платит
+    ни за импорт pymorphy3, ни за загрузку словарей.
+    """
+
+    def __init__(self,
+                 lang: str = DEFAULT_MORPH_LANG,
+                 loader: Optional[Callable[[str], Any]] = None):
+        """
+        Args:
+            lang: Язык анализатора
+            loader: Функция получения анализатора по языку (по умолчанию общий для процесса)
+        """
+        self._lang = lang
+        self._loader = loader or get_shared_morph_analyzer
+        self._analyzer: Optional[Any] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._analyzer is not None
+
+    def parse(self, word: str):
+        if self._analyzer is None:
+            self._analyzer = self._loader(self._lang)
+        return self._analyzer.parse(word)
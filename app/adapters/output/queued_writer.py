@@ -0,0 +1,83 @@
+"""Асинхронная запись сегментов в фоновом потоке."""
+
+import queue
+import threading
+from typing import Optional
+
+from app.application.ports.output_port import ITranscriptSegmentWriter
+from app.domain.models.transcript import Segment
+
+DEFAULT_WRITE_QUEUE_SIZE = 1000
+
+# Маркер завершения очереди
+_CLOSE = object()
+
+
+class QueuedSegmentWriter(ITranscriptSegmentWriter):
+    """Декоратор writer'а, выносящий запись в фоновый поток.
+
+    Поток распознавания только кладёт сегменты в очередь и не ждёт медленного
+    диска или заблокированного stdout. Очередь ограничена max_queue сегментами:
+    если writer не успевает, write_segment блокируется (backpressure), поэтому
+    память не растёт неограниченно. Ошибка записи сохраняется и пробрасывается
+    из следующего write_segment, checkpoint или из close().
+    """
+
+    def __init__(self, inner: ITranscriptSegmentWriter, max_queue: int = DEFAULT_WRITE_QUEUE_SIZE):
+        """
+        Args:
+            inner: Writer, выполняющий фактическую запись
+            max_queue: Максимальное количество сегментов в очереди
+        """
+        if max_queue < 1:
+            raise ValueError("Размер очереди должен быть не меньше 1")
+        self._inner = inner
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        # Вызовы inner из разных потоков не пересекаются
+        self._inner_lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="segment-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _CLOSE:
+                    return
+                if self._error is None:
+                    with self._inner_lock:
+                        self._inner.write_segment(item)
+            except BaseException as exc:
+                # После ошибки продолжаем разбирать очередь, чтобы не заблокировать производителя
+                self._error = exc
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def write_segment(self, segment: Segment) -> None:
+        """Ставит сегмент в очередь на запись (блокируется, если очередь заполнена)."""
+        if self._closed:
+            raise ValueError("Запись в закрытый writer")
+        self._raise_pending_error()
+        self._queue.put(segment)
+
+    def checkpoint(self) -> Optional[int]:
+        """Дожидается записи всех сегментов из очереди и делегирует checkpoint."""
+        self._queue.join()
+        self._raise_pending_error()
+        with self._inner_lock:
+            return self._inner.checkpoint()
+
+    def close(self) -> None:
+        """Дописывает очередь, закрывает вложенный writer и пробрасывает ошибку записи."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_CLOSE)
+            self._thread.join()
+            self._inner.close()
+        self._raise_pending_error()
@@ -0,0 +1,13 @@
+"""Адаптеры хранилищ промежуточного состояния."""
+
+from app.adapters.output.storage.file_storage import JsonCheckpointStore, JsonLemmaCacheStore
+from app.adapters.output.storage.protocol_cache import JsonProtocolResponseCache, default_protocol_cache_dir
+from app.adapters.output.storage.sqlite_index import SqliteWordFrequencyIndex
+
+__all__ = [
+    "JsonCheckpointStore",
+    "JsonLemmaCacheStore",
+    "JsonProtocolResponseCache",
+    "SqliteWordFrequencyIndex",
+    "default_protocol_cache_dir",
+]
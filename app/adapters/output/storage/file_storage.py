@@ -0,0 +1,109 @@
+"""Файловые хранилища промежуточного состояния."""
+
+import json
+import os
+from typing import Dict, Optional
+
+from app.application.ports.storage_port import ICheckpointStore, ILemmaCacheStore
+from app.domain.models.transcript import TranscriptCheckpoint
+from app.domain.models.word_analysis import LemmaInfo
+
+
+def _atomic_write_json(path: str, data) -> None:
+    """Записывает JSON через временный файл и os.replace."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class JsonCheckpointStore(ICheckpointStore):
+    """Хранит контрольную точку транскрипции в JSON-файле рядом со стенограммой.
+
+    Запись атомарна (через временный файл и os.replace), поэтому сбой во время
+    сохранения не портит предыдущую контрольную точку.
+    """
+
+    SUFFIX = ".checkpoint.json"
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Путь к файлу контрольной точки
+        """
+        self._path = path
+
+    @classmethod
+    def for_output(cls, output_path: str) -> "JsonCheckpointStore":
+        """Создаёт хранилище для стенограммы output_path (<output>.checkpoint.json)."""
+        return cls(output_path + cls.SUFFIX)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load(self) -> Optional[TranscriptCheckpoint]:
+        if not os.path.exists(self._path):
+            return None
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                return TranscriptCheckpoint.from_dict(json.load(f))
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError(f"Повреждён файл контрольной точки {self._path}: {exc}") from exc
+
+    def save(self, checkpoint: TranscriptCheckpoint) -> None:
+        _atomic_write_json(self._path, checkpoint.to_dict())
+
+    def clear(self) -> None:
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
+class JsonLemmaCacheStore(ILemmaCacheStore):
+    """Хранит кэш лемм в JSON-файле.
+
+    Повреждённый или несовместимый файл не считается ошибкой: кэш просто
+    начинает работу «холодным» и перезаписывается при сохранении.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Путь к файлу кэша
+        """
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load(self) -> Dict[str, LemmaInfo]:
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return {}
+            return {
+                word: LemmaInfo(pos=pos, grammemes=frozenset(grammemes), normal_form=normal_form)
+                for word, (pos, grammemes, normal_form) in data["entries"].items()
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def save(self, entries: Dict[str, LemmaInfo]) -> None:
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _atomic_write_json(self._path, {
+            "version": self.VERSION,
+            "entries": {
+                word: [info.pos, sorted(info.grammemes), info.normal_form]
+                for word, info in entries.items()
+            },
+        })
@@ -0,0 +1,140 @@
+"""Дисковый кэш ответов LLM для команды protocol."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from app.application.ports.storage_port import IProtocolResponseCache
+from app.domain.models.protocol import ProtocolResponse
+
+# Срок жизни записи по умолчанию (30 дней) и ограничение размера кэша (100 МБ)
+DEFAULT_PROTOCOL_CACHE_TTL = 30 * 24 * 3600
+DEFAULT_PROTOCOL_CACHE_SIZE = 100 * 1024 ** 2
+
+
+def default_protocol_cache_dir() -> str:
+    """Каталог кэша по умолчанию: $XDG_CACHE_HOME/mina/protocol (или ~/.cache/mina/protocol)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "mina", "protocol")
+
+
+class JsonProtocolResponseCache(IProtocolResponseCache):
+    """Кэш ответов в JSON-файлах: одна запись - один файл <ключ>.json.
+
+    Записи старше ttl_seconds не отдаются и удаляются при обращении. При
+    превышении max_bytes удаляются давно не использованные записи (LRU по
+    времени последнего обращения, которое обновляется при попадании).
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(self,
+                 cache_dir: str,
+                 ttl_seconds: Optional[float] = DEFAULT_PROTOCOL_CACHE_TTL,
+                 max_bytes: Optional[int] = DEFAULT_PROTOCOL_CACHE_SIZE,
+                 clock: Optional[Callable[[], float]] = None):
+        """
+        Args:
+            cache_dir: Каталог кэша (создаётся при первой записи)
+            ttl_seconds: Срок жизни записи в секундах (None - бессрочно)
+            max_bytes: Максимальный суммарный размер кэша в байтах (None - без ограничения)
+            clock: Источник текущего времени (для тестов)
+        """
+        self._cache_dir = cache_dir
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._clock = clock or time.time
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def get(self, key: str) -> Optional[ProtocolResponse]:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            created_at = float(entry["created_at"])
+            response = ProtocolResponse(content=entry["content"], provider_raw=entry.get("provider_raw"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            # Повреждённая запись - как промах
+            self._remove(entry_path)
+            return None
+
+        if self._ttl_seconds is not None and self._clock() - created_at > self._ttl_seconds:
+            self._remove(entry_path)
+            return None
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        return response
+
+    def put(self, key: str, response: ProtocolResponse) -> None:
+        entry_path = self._entry_path(key)
+        entry = {
+            "created_at": self._clock(),
+            "content": response.content,
+            "provider_raw": response.provider_raw,
+        }
+        os.makedirs(self._cache_dir, exist_ok=True)
+        # Атомарно: временный файл в каталоге кэша и os.replace
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        with self._lock:
+            self._evict(keep=entry_path)
+
+    def size(self) -> int:
+        """Суммарный размер записей кэша в байтах."""
+        return sum(size for _, _, size in self._entries())
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + self.SUFFIX)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _entries(self) -> List[Tuple[float, str, int]]:
+        if not os.path.isdir(self._cache_dir):
+            return []
+        entries = []
+        for name in os.listdir(self._cache_dir):
+            if not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self._cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        """Удаляет самые давние записи, пока кэш не уложится в max_bytes."""
+        if self._max_bytes is None:
+            return
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            total -= size
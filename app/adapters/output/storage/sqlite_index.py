@@ -0,0 +1,137 @@
+"""Индекс частот слов в SQLite."""
+
+import hashlib
+import os
+import sqlite3
+import time
+from collections import Counter
+from typing import Optional
+
+from app.application.ports.storage_port import IWordFrequencyIndex
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    content_hash TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    indexed_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, variant)
+);
+CREATE TABLE IF NOT EXISTS frequencies (
+    content_hash TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (content_hash, variant, position)
+) WITHOUT ROWID;
+"""
+
+
+class SqliteWordFrequencyIndex(IWordFrequencyIndex):
+    """Индекс частот лемм в файле SQLite.
+
+    Частоты расшифровки хранятся строками (позиция, слово, частота), где
+    позиция - порядок первого появления слова, поэтому слияние сохранённых
+    счётчиков упорядочивает равные частоты так же, как полный пересчёт.
+    Хэши содержимого запоминаются по (путь, размер, mtime): повторный запрос
+    по неизменным файлам не читает их вовсе.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Путь к файлу индекса (каталог создаётся при необходимости)
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._connection = sqlite3.connect(path)
+        self._init_schema()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _init_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, self.SCHEMA_VERSION):
+            # Индекс старого формата - это только кэш: пересоздаём его
+            with self._connection:
+                for table in ("files", "entries", "frequencies"):
+                    self._connection.execute(f"DROP TABLE IF EXISTS {table}")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def content_hash(self, path: str) -> str:
+        """Вычисляет SHA-256 содержимого файла (с запоминанием по размеру и mtime)."""
+        stat = os.stat(path)
+        absolute = os.path.abspath(path)
+        row = self._connection.execute(
+            "SELECT content_hash FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (absolute, stat.st_size, stat.st_mtime_ns),
+        ).fetchone()
+        if row is not None:
+            return row[0]
+
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                sha.update(block)
+        digest = sha.hexdigest()
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (absolute, stat.st_size, stat.st_mtime_ns, digest),
+            )
+        return digest
+
+    def load(self, content_hash: str, variant: str) -> Optional[Counter]:
+        indexed = self._connection.execute(
+            "SELECT 1 FROM entries WHERE content_hash = ? AND variant = ?",
+            (content_hash, variant),
+        ).fetchone()
+        if indexed is None:
+            return None
+        rows = self._connection.execute(
+            "SELECT word, count FROM frequencies WHERE content_hash = ? AND variant = ? ORDER BY position",
+            (content_hash, variant),
+        )
+        return Counter(dict(rows))
+
+    def save(self, content_hash: str, variant: str, counts: Counter) -> None:
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM frequencies WHERE content_hash = ? AND variant = ?",
+                (content_hash, variant),
+            )
+            self._connection.executemany(
+                "INSERT INTO frequencies (content_hash, variant, position, word, count) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (content_hash, variant, position, word, count)
+                    for position, (word, count) in enumerate(counts.items())
+                ),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (content_hash, variant, indexed_at) VALUES (?, ?, ?)",
+                (content_hash, variant, time.time()),
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteWordFrequencyIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -2,8 +2,21 @@
 
 from app.adapters.output.whisper.whisper_adapter import WhisperAdapter
 from app.adapters.output.whisper.faster_whisper_adapter import FasterWhisperAdapter
+from app.adapters.output.whisper.model_registry import (
+    ModelKey,
+    ModelRegistry,
+    ModelRegistryStats,
+    get_default_model_registry,
+)
 
-__all__ = ["WhisperAdapter", "FasterWhisperAdapter"]
+__all__ = [
+    "WhisperAdapter",
+    "FasterWhisperAdapter",
+    "ModelKey",
+    "ModelRegistry",
+    "ModelRegistryStats",
+    "get_default_model_registry",
+]
 
 
 
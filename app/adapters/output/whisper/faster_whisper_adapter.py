@@ -1,6 +1,8 @@
 """Адаптер для faster-whisper."""
 
-from typing import Iterator, Any
+from typing import Iterator, Any, Optional
+from app.adapters.output.audio.decoded_cache import DecodedAudioCache
+from app.adapters.output.whisper.model_registry import ModelKey, ModelRegistry
 from app.application.ports import ITranscriptionEngine
 from app.domain.models.transcript import Segment
 
@@ -12,18 +14,35 @@ class FasterWhisperAdapter(ITranscriptionEngine):
     к нашему интерфейсу ITranscriptionEngine.
     """
     
-    def __init__(self, faster_whisper_model_class, compute_type: str = 'int8'):
+    ENGINE_NAME = 'faster-whisper'
+    
+    def __init__(self,
+                 faster_whisper_model_class,
+                 compute_type: str = 'int8',
+                 model_registry: Optional[ModelRegistry] = None,
+                 device: Optional[str] = None,
+                 audio_cache: Optional[DecodedAudioCache] = None):
         """
         Args:
             faster_whisper_model_class: Класс WhisperModel из faster_whisper
             compute_type: Тип вычислений ('int8', 'float16', 'float32')
+            model_registry: Реестр загруженных моделей (None - модель загружается при каждом вызове)
+            device: Устройство ('cpu', 'cuda'); None - выбор библиотеки по умолчанию ('auto')
+            audio_cache: Кэш декодированного аудио (DecodedAudioCache); если задан,
+                файл декодируется один раз и переиспользуется без копирования (memory map)
         """
         self._faster_whisper_model_class = faster_whisper_model_class
         self._compute_type = compute_type
+        self._model_registry = model_registry
+        self._device = device
+        self._audio_cache = audio_cache
     
     def load_model(self, model_name: str, **kwargs) -> Any:
         """Загружает модель faster-whisper.
         
+        Если задан реестр моделей, повторные вызовы с теми же параметрами
+        возвращают уже загруженную модель.
+        
         Args:
             model_name: Название модели (например, 'base', 'small', 'medium')
             **kwargs: Дополнительные параметры (игнорируются)
@@ -31,7 +50,22 @@ class FasterWhisperAdapter(ITranscriptionEngine):
         Returns:
             Загруженная модель FasterWhisper (WhisperModel)
         """
-        return self._faster_whisper_model_class(model_name, compute_type=self._compute_type)
+        if self._model_registry is None:
+            return self._create_model(model_name)
+        key = ModelKey(
+            engine=self.ENGINE_NAME,
+            model_name=model_name,
+            compute_type=self._compute_type,
+            device=self._device or 'auto',
+        )
+        return self._model_registry.get_or_load(key, lambda: self._create_model(model_name))
+    
+    def _create_model(self, model_name: str) -> Any:
+        if self._device is None:
+            return self._faster_whisper_model_class(model_name, compute_type=self._compute_type)
+        return self._faster_whisper_model_class(
+            model_name, compute_type=self._compute_type, device=self._device
+        )
     
     def transcribe(self,
                    model: Any,
@@ -42,7 +76,7 @@ class FasterWhisperAdapter(ITranscriptionEngine):
         
         Args:
             model: Загруженная модель FasterWhisper (результат load_model)
-            audio_path: Путь к аудиофайлу
+            audio_path: Путь к аудиофайлу или декодированные отсчёты
             language: Код языка транскрипции (ISO 639-1, например 'ru', 'en')
             **kwargs: Дополнительные параметры (beam_size и т.д.)
         
@@ -51,6 +85,11 @@ class FasterWhisperAdapter(ITranscriptionEngine):
         """
         beam_size = kwargs.get('beam_size', 5)
         verbose = kwargs.get('verbose', False)
+        # Окна потокового режима и фрагменты параллельной транскрипции приходят
+        # декодированными отсчётами - предупреждение о длинных записях для них лишнее
+        whole_file = isinstance(audio_path, str)
+        if self._audio_cache is not None and whole_file:
+            audio_path = self._audio_cache.load(audio_path)
         
         # Выполняем транскрипцию через faster-whisper
         # Для длинных видео используем оптимизированные параметры:
@@ -150,12 +189,13 @@ class FasterWhisperAdapter(ITranscriptionEngine):
                           f"Последний сегмент на {last_end_time/60:.1f} минуте.", 
                           file=sys.stderr)
             
-            import sys
-            print(
-                "\n⚠️  ПРЕДУПРЕЖДЕНИЕ: Проверьте результат faster-whisper — при обработке длинных записей "
-                "адаптер может завершить транскрипцию раньше исходного материала. "
-                "Если заметите обрывы, попробуйте модель поменьше (например, small) "
-                "или разбейте запись на части.",
-                file=sys.stderr,
-            )
+            if whole_file:
+                import sys
+                print(
+                    "\n⚠️  ПРЕДУПРЕЖДЕНИЕ: Проверьте результат faster-whisper — при обработке длинных записей "
+                    "адаптер может завершить транскрипцию раньше исходного материала. "
+                    "Если заметите обрывы, попробуйте модель поменьше (например, small) "
+                    "или разбейте запись на части.",
+                    file=sys.stderr,
+                )
 
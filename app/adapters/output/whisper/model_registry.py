@@ -0,0 +1,189 @@
+"""Реестр загруженных моделей транскрипции (кэш уровня процесса)."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+# Примерное количество параметров моделей Whisper (в миллионах)
+MODEL_PARAMETERS_M = {
+    'tiny': 39,
+    'base': 74,
+    'small': 244,
+    'medium': 769,
+    'large': 1550,
+    'turbo': 809,
+}
+
+# Байт на параметр в зависимости от типа вычислений
+BYTES_PER_PARAMETER = {
+    'int8': 1,
+    'int8_float16': 1,
+    'int8_float32': 1,
+    'int8_bfloat16': 1,
+    'int16': 2,
+    'float16': 2,
+    'bfloat16': 2,
+    'float32': 4,
+}
+
+DEFAULT_MAX_MODELS = 2
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    """Ключ модели в реестре."""
+
+    engine: str
+    model_name: str
+    compute_type: str
+    device: str
+
+
+@dataclass(frozen=True)
+class ModelRegistryStats:
+    """Статистика работы реестра моделей."""
+
+    hits: int
+    misses: int
+    evictions: int
+    total_load_time: float
+    cached_models: int
+    cached_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля обращений, обслуженных из кэша."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_text(self) -> str:
+        """Форматирует статистику в одну строку для логов."""
+        return (
+            f"Кэш моделей: попаданий {self.hits}, промахов {self.misses}, "
+            f"вытеснений {self.evictions}, время загрузки {self.total_load_time:.2f} сек, "
+            f"в памяти {self.cached_models} ({self.cached_bytes / 1024 ** 2:.0f} МБ)"
+        )
+
+
+def estimate_model_size(key: ModelKey) -> int:
+    """Оценивает объём памяти, занимаемый моделью, в байтах.
+
+    Оценка строится по числу параметров семейства модели (tiny, base, ...)
+    и типу вычислений. Для неизвестных моделей используется размер large.
+    """
+    tokens = re.split(r'[-_./]', key.model_name.lower())
+    family = next((token for token in tokens if token in MODEL_PARAMETERS_M), 'large')
+    parameters = MODEL_PARAMETERS_M[family]
+    return parameters * 1_000_000 * BYTES_PER_PARAMETER.get(key.compute_type, 4)
+
+
+class ModelRegistry:
+    """LRU-кэш загруженных моделей с ограничением по количеству и памяти.
+
+    Повторные транскрипции в одном процессе переиспользуют уже загруженные
+    веса вместо повторной загрузки модели с диска.
+    Потокобезопасен: параллельные запросы одной модели загрузят её один раз.
+    """
+
+    def __init__(self,
+                 max_models: Optional[int] = DEFAULT_MAX_MODELS,
+                 memory_budget: Optional[int] = None,
+                 size_estimator: Optional[Callable[[ModelKey], int]] = None):
+        """
+        Args:
+            max_models: Максимальное количество моделей в памяти (None - без ограничения)
+            memory_budget: Бюджет памяти в байтах (None - без ограничения)
+            size_estimator: Функция оценки размера модели (по умолчанию estimate_model_size)
+        """
+        self._max_models = max_models
+        self._memory_budget = memory_budget
+        self._size_estimator = size_estimator or estimate_model_size
+        self._models: "OrderedDict[ModelKey, Any]" = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._total_load_time = 0.0
+
+    def get_or_load(self, key: ModelKey, loader: Callable[[], Any]) -> Any:
+        """Возвращает модель из кэша или загружает её через loader.
+
+        Args:
+            key: Ключ модели
+            loader: Функция загрузки модели (вызывается только при промахе)
+
+        Returns:
+            Загруженная модель
+        """
+        with self._lock:
+            if key in self._models:
+                self._hits += 1
+                self._models.move_to_end(key)
+                return self._models[key]
+
+            self._misses += 1
+            started = time.perf_counter()
+            model = loader()
+            self._total_load_time += time.perf_counter() - started
+
+            self._models[key] = model
+            self._sizes[key] = self._size_estimator(key)
+            self._evict()
+            return model
+
+    def _evict(self) -> None:
+        """Вытесняет давно не использованные модели (последнюю загруженную не трогает)."""
+        while len(self._models) > 1 and self._over_limit():
+            key, _ = self._models.popitem(last=False)
+            self._sizes.pop(key, None)
+            self._evictions += 1
+
+    def _over_limit(self) -> bool:
+        if self._max_models is not None and len(self._models) > self._max_models:
+            return True
+        if self._memory_budget is not None and sum(self._sizes.values()) > self._memory_budget:
+            return True
+        return False
+
+    def stats(self) -> ModelRegistryStats:
+        """Возвращает текущую статистику реестра."""
+        with self._lock:
+            return ModelRegistryStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                total_load_time=self._total_load_time,
+                cached_models=len(self._models),
+                cached_bytes=sum(self._sizes.values()),
+            )
+
+    def clear(self) -> None:
+        """Выгружает все модели (статистика сохраняется)."""
+        with self._lock:
+            self._models.clear()
+            self._sizes.clear()
+
+    def __contains__(self, key: ModelKey) -> bool:
+        with self._lock:
+            return key in self._models
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._models)
+
+
+_default_registry: Optional[ModelRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_model_registry() -> ModelRegistry:
+    """Возвращает общий для процесса реестр моделей."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ModelRegistry()
+        return _default_registry
@@ -1,6 +1,9 @@
 """Адаптер для OpenAI Whisper."""
 
-from typing import Iterator, Any
+import warnings
+from typing import Iterator, Any, Optional
+from app.adapters.output.audio.decoded_cache import DecodedAudioCache
+from app.adapters.output.whisper.model_registry import ModelKey, ModelRegistry
 from app.application.ports import ITranscriptionEngine
 from app.domain.models.transcript import Segment
 
@@ -12,16 +15,34 @@ class WhisperAdapter(ITranscriptionEngine):
     к нашему интерфейсу ITranscriptionEngine.
     """
     
-    def __init__(self, whisper_module):
+    ENGINE_NAME = 'whisper'
+    # OpenAI Whisper загружает веса в float32
+    COMPUTE_TYPE = 'float32'
+    
+    def __init__(self,
+                 whisper_module,
+                 model_registry: Optional[ModelRegistry] = None,
+                 device: Optional[str] = None,
+                 audio_cache: Optional[DecodedAudioCache] = None):
         """
         Args:
             whisper_module: Модуль OpenAI Whisper
+            model_registry: Реестр загруженных моделей (None - модель загружается при каждом вызове)
+            device: Устройство ('cpu', 'cuda'); None - выбор библиотеки по умолчанию
+            audio_cache: Кэш декодированного аудио (DecodedAudioCache); если задан,
+                файл декодируется один раз и переиспользуется без копирования (memory map)
         """
         self._whisper = whisper_module
+        self._model_registry = model_registry
+        self._device = device
+        self._audio_cache = audio_cache
     
     def load_model(self, model_name: str, **kwargs) -> Any:
         """Загружает модель OpenAI Whisper.
         
+        Если задан реестр моделей, повторные вызовы с теми же параметрами
+        возвращают уже загруженную модель.
+        
         Args:
             model_name: Название модели (например, 'base', 'small', 'medium')
             **kwargs: Дополнительные параметры (игнорируются для OpenAI Whisper)
@@ -29,7 +50,20 @@ class WhisperAdapter(ITranscriptionEngine):
         Returns:
             Загруженная модель Whisper
         """
-        return self._whisper.load_model(model_name)
+        if self._model_registry is None:
+            return self._create_model(model_name)
+        key = ModelKey(
+            engine=self.ENGINE_NAME,
+            model_name=model_name,
+            compute_type=self.COMPUTE_TYPE,
+            device=self._device or 'auto',
+        )
+        return self._model_registry.get_or_load(key, lambda: self._create_model(model_name))
+    
+    def _create_model(self, model_name: str) -> Any:
+        if self._device is None:
+            return self._whisper.load_model(model_name)
+        return self._whisper.load_model(model_name, device=self._device)
     
     def transcribe(self,
                    model: Any,
@@ -40,7 +74,7 @@ class WhisperAdapter(ITranscriptionEngine):
         
         Args:
             model: Загруженная модель Whisper (результат load_model)
-            audio_path: Путь к аудиофайлу
+            audio_path: Путь к аудиофайлу или декодированные отсчёты
             language: Код языка транскрипции (ISO 639-1, например 'ru', 'en')
             **kwargs: Дополнительные параметры (verbose и т.д.)
         
@@ -48,7 +82,15 @@ class WhisperAdapter(ITranscriptionEngine):
             Segment: Сегменты транскрипции с таймингами
         """
         verbose = kwargs.get('verbose', True)
-        result = model.transcribe(audio_path, language=language, verbose=verbose)
+        if self._audio_cache is not None and isinstance(audio_path, str):
+            audio_path = self._audio_cache.load(audio_path)
+            # Отсчёты из кэша доступны только для чтения; whisper их не изменяет,
+            # поэтому предупреждение torch о неизменяемом массиве не актуально
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", message=".*not writable.*")
+                result = model.transcribe(audio_path, language=language, verbose=verbose)
+        else:
+            result = model.transcribe(audio_path, language=language, verbose=verbose)
         
         # Конвертируем словари OpenAI Whisper в доменные модели Segment
         for segment_dict in result['segments']:
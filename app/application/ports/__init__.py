@@ -4,6 +4,13 @@ from app.application.ports.transcription_port import ITranscriptionEngine
 from app.application.ports.output_port import ITranscriptSegmentWriter
 from app.application.ports.api_port import ILLMProtocolClient
 from app.application.ports.word_analysis_port import ITextSource, IStopwordsProvider
+from app.application.ports.storage_port import (
+    ICheckpointStore,
+    ILemmaCacheStore,
+    IProtocolResponseCache,
+    IWordFrequencyIndex,
+)
+from app.application.ports.audio_port import IAudioSource
 
 __all__ = [
     "ITranscriptionEngine",
@@ -11,6 +18,11 @@ __all__ = [
     "ILLMProtocolClient",
     "ITextSource",
     "IStopwordsProvider",
+    "ICheckpointStore",
+    "ILemmaCacheStore",
+    "IWordFrequencyIndex",
+    "IProtocolResponseCache",
+    "IAudioSource",
 ]
 
 
@@ -1,6 +1,8 @@
 """Порт для провайдеров LLM, генерирующих протоколы."""
 
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
 from app.domain.models.protocol import ProtocolRequest, ProtocolResponse
 
 
@@ -8,11 +10,17 @@ class ILLMProtocolClient(ABC):
     """Абстракция клиента LLM, генерирующего протоколы на основе стенограммы."""
 
     @abstractmethod
-    def generate_protocol(self, request: ProtocolRequest) -> ProtocolResponse:
+    def generate_protocol(
+        self,
+        request: ProtocolRequest,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> ProtocolResponse:
         """Генерирует протокол по переданному запросу.
 
         Args:
             request: Подготовленный запрос (инструкции, стенограмма, конфиг).
+            on_token: Вызывается с каждым фрагментом текста по мере генерации,
+                если провайдер отдаёт ответ потоком (request.config.stream).
 
         Returns:
             ProtocolResponse: сгенерированный текст и, опционально, сырой ответ провайдера.
@@ -22,4 +30,11 @@ class ILLMProtocolClient(ABC):
         """
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Освобождает ресурсы клиента (соединения). По умолчанию ничего не делает."""
+
+    def __enter__(self) -> "ILLMProtocolClient":
+        return self
 
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,35 @@
+"""Порт (интерфейс) для источников аудио."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Tuple
+
+from app.domain.models.transcript import AudioChunk
+
+
+class IAudioSource(ABC):
+    """Источник декодированного аудио, отдающий запись окнами фиксированной длины.
+
+    В отличие от передачи пути к файлу движку транскрипции, источник не держит
+    в памяти всю запись: одновременно декодировано не больше одного окна
+    (вместе с перекрытием), поэтому пиковое потребление памяти не зависит
+    от длительности записи.
+    """
+
+    @abstractmethod
+    def windows(self,
+                audio_path: str,
+                window_duration: float,
+                overlap: float = 0.0,
+                start: float = 0.0) -> Iterator[Tuple[AudioChunk, Any]]:
+        """Последовательно декодирует запись окнами.
+
+        Args:
+            audio_path: Путь к аудио/видеофайлу
+            window_duration: Длительность собственной зоны окна в секундах
+            overlap: Перекрытие с соседними окнами в секундах (с каждой стороны)
+            start: Момент записи, с которого начинать декодирование, в секундах
+
+        Yields:
+            Кортеж (границы окна в абсолютном времени, отсчёты окна - моно float32, 16 кГц)
+        """
+        raise NotImplementedError
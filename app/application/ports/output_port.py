@@ -1,6 +1,7 @@
 """Порт (интерфейс) для записи результатов транскрипции."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 from app.domain.models.transcript import Segment
 
 
@@ -23,6 +24,18 @@ class ITranscriptSegmentWriter(ABC):
         """
         ...
     
+    def checkpoint(self) -> Optional[int]:
+        """Гарантирует сохранность уже записанных сегментов.
+        
+        Используется для контрольных точек транскрипции: после вызова записанные
+        данные не должны теряться при аварийном завершении процесса.
+        
+        Returns:
+            Позиция (смещение в байтах) после последнего записанного сегмента
+            или None, если способ вывода не поддерживает возобновление
+        """
+        return None
+    
     @abstractmethod
     def close(self) -> None:
         """Завершает запись и освобождает ресурсы.
@@ -0,0 +1,85 @@
+"""Порты для хранения промежуточного состояния."""
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, Optional
+
+from app.domain.models.protocol import ProtocolResponse
+from app.domain.models.transcript import TranscriptCheckpoint
+from app.domain.models.word_analysis import LemmaInfo
+
+
+class ICheckpointStore(ABC):
+    """Хранилище контрольной точки транскрипции."""
+
+    @abstractmethod
+    def load(self) -> Optional[TranscriptCheckpoint]:
+        """Возвращает сохранённую контрольную точку или None, если её нет."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, checkpoint: TranscriptCheckpoint) -> None:
+        """Сохраняет контрольную точку (заменяя предыдущую)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Удаляет контрольную точку (после успешного завершения транскрипции)."""
+        raise NotImplementedError
+
+
+class ILemmaCacheStore(ABC):
+    """Постоянное хранилище кэша морфологического разбора словоформ."""
+
+    @abstractmethod
+    def load(self) -> Dict[str, LemmaInfo]:
+        """Возвращает сохранённые разборы (пустой словарь, если хранилище пусто)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, entries: Dict[str, LemmaInfo]) -> None:
+        """Сохраняет разборы (заменяя предыдущее содержимое)."""
+        raise NotImplementedError
+
+
+class IWordFrequencyIndex(ABC):
+    """Постоянный индекс частот лемм по расшифровкам.
+
+    Частоты хранятся по хэшу содержимого расшифровки и варианту анализа
+    (с лемматизацией или без, с исключением имён или без), поэтому
+    переименованный файл не пересчитывается, а изменённый - пересчитывается.
+    """
+
+    @abstractmethod
+    def content_hash(self, path: str) -> str:
+        """Возвращает хэш содержимого файла."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, content_hash: str, variant: str) -> Optional[Counter]:
+        """Возвращает сохранённые частоты (в порядке первого появления) или None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, content_hash: str, variant: str, counts: Counter) -> None:
+        """Сохраняет частоты расшифровки (заменяя предыдущие)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        """Освобождает ресурсы индекса."""
+        raise NotImplementedError
+
+
+class IProtocolResponseCache(ABC):
+    """Постоянный кэш ответов LLM по ключу запроса."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ProtocolResponse]:
+        """Возвращает сохранённый ответ или None (нет записи или она устарела)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, response: ProtocolResponse) -> None:
+        """Сохраняет ответ (заменяя предыдущий с тем же ключом)."""
+        raise NotImplementedError
@@ -40,7 +40,9 @@ class ITranscriptionEngine(ABC):
         
         Args:
             model: Загруженная модель (результат load_model)
-            audio_path: Путь к аудиофайлу
+            audio_path: Путь к аудиофайлу или уже декодированные отсчёты
+                        (numpy.ndarray, моно float32, 16 кГц) - оба движка
+                        принимают такой массив напрямую
             language: Код языка транскрипции (ISO 639-1, например 'ru', 'en')
             **kwargs: Дополнительные параметры (beam_size для faster-whisper и т.д.)
         
@@ -3,8 +3,28 @@
 from app.application.services.transcription import TranscriptionService
 from app.application.services.word_analysis import WordAnalysisService
 from app.application.services.protocol import ProtocolService
+from app.application.services.protocol_cache import CachingProtocolClient, ProtocolCacheStats, protocol_cache_key
+from app.application.services.parallel_transcription import ParallelTranscriptionService
+from app.application.services.batch_transcription import BatchTranscriptionService
+from app.application.services.lemma_cache import LemmaCache, LemmaCacheStats
+from app.application.services.parallel_word_analysis import ParallelWordAnalysisService
+from app.application.services.indexed_word_analysis import IndexedWordAnalysisService, WordIndexStats
 
-__all__ = ["TranscriptionService", "WordAnalysisService", "ProtocolService"]
+__all__ = [
+    "TranscriptionService",
+    "WordAnalysisService",
+    "ProtocolService",
+    "CachingProtocolClient",
+    "ProtocolCacheStats",
+    "protocol_cache_key",
+    "ParallelTranscriptionService",
+    "BatchTranscriptionService",
+    "LemmaCache",
+    "LemmaCacheStats",
+    "ParallelWordAnalysisService",
+    "IndexedWordAnalysisService",
+    "WordIndexStats",
+]
 
 
 
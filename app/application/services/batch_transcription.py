@@ -0,0 +1,126 @@
+"""Сервис пакетной транскрипции.
+
+Прогоняет множество файлов через один сервис транскрипции (и, следовательно,
+через один загруженный движок) с ограниченной параллельностью и собирает
+сводный отчёт по времени обработки каждого файла.
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+from app.application.ports import ITranscriptSegmentWriter
+from app.domain.models.batch import BatchItem, BatchItemResult, BatchReport
+
+
+class BatchTranscriptionService:
+    """Пакетная транскрипция файлов одним сервисом транскрипции.
+
+    Сервис транскрипции создаётся один раз и переиспользуется для всех файлов,
+    поэтому модель загружается однократно (через реестр моделей адаптера).
+    """
+
+    def __init__(self,
+                 transcription_service: Any,
+                 writer_factory: Callable[[str], ITranscriptSegmentWriter],
+                 concurrency: int = 1,
+                 duration_probe: Optional[Callable[[str], float]] = None):
+        """
+        Args:
+            transcription_service: Сервис с методом transcribe (TranscriptionService и совместимые)
+            writer_factory: Фабрика writer'а по пути выходного файла
+            concurrency: Максимальное количество файлов, обрабатываемых одновременно
+            duration_probe: Функция определения длительности записи (для расчёта RTF)
+        """
+        if concurrency < 1:
+            raise ValueError("Параллельность должна быть не меньше 1")
+        self._transcription_service = transcription_service
+        self._writer_factory = writer_factory
+        self._concurrency = concurrency
+        self._duration_probe = duration_probe
+
+    def run(self,
+            items: Iterable[BatchItem],
+            model_name: str,
+            language: str = 'ru',
+            **kwargs) -> BatchReport:
+        """Транскрибирует все файлы пакета.
+
+        Ошибка в одном файле не прерывает обработку остальных: она попадает
+        в отчёт, а пакет продолжает выполняться.
+
+        Args:
+            items: Файлы пакета
+            model_name: Название модели
+            language: Код языка транскрипции
+            **kwargs: Дополнительные параметры для transcribe (beam_size и т.д.);
+                verbose включает вывод прогресса по файлам
+
+        Returns:
+            BatchReport: Сводный отчёт с результатами по каждому файлу
+        """
+        items = list(items)
+        # Посегментный лог при параллельной обработке файлов нечитаем - ведём лог по файлам
+        verbose = kwargs.pop('verbose', False)
+        started = time.perf_counter()
+
+        def _process(indexed_item):
+            index, item = indexed_item
+            result = self._process_item(item, model_name, language, **kwargs)
+            if verbose:
+                status = "готово" if result.succeeded else f"ошибка: {result.error}"
+                print(f"[{index + 1}/{len(items)}] {item.input_path}: {status} "
+                      f"({result.wall_time:.1f} сек)", file=sys.stderr)
+            return result
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            results: List[BatchItemResult] = list(executor.map(_process, enumerate(items)))
+
+        return BatchReport(results=results, total_wall_time=time.perf_counter() - started)
+
+    def _process_item(self, item: BatchItem, model_name: str, language: str, **kwargs) -> BatchItemResult:
+        started = time.perf_counter()
+        segment_count = 0
+        last_end = 0.0
+        writer = None
+        try:
+            writer = self._writer_factory(item.output_path)
+            for segment in self._transcription_service.transcribe(
+                input_path=item.input_path,
+                output_writer=writer,
+                model_name=model_name,
+                language=language,
+                **kwargs,
+            ):
+                segment_count += 1
+                last_end = max(last_end, segment.end)
+        except Exception as exc:
+            return BatchItemResult(
+                item=item,
+                wall_time=time.perf_counter() - started,
+                segment_count=segment_count,
+                error=str(exc) or exc.__class__.__name__,
+            )
+        finally:
+            # Сервис закрывает writer сам, но только если успел начать транскрипцию
+            # (проверка ffmpeg падает ещё до старта) - повторное закрытие безопасно
+            if writer is not None:
+                writer.close()
+
+        wall_time = time.perf_counter() - started
+        audio_duration = self._probe_duration(item.input_path) or last_end
+        return BatchItemResult(
+            item=item,
+            wall_time=wall_time,
+            audio_duration=audio_duration,
+            segment_count=segment_count,
+        )
+
+    def _probe_duration(self, input_path: str) -> float:
+        if self._duration_probe is None:
+            return 0.0
+        try:
+            return self._duration_probe(input_path)
+        except Exception:
+            return 0.0
@@ -0,0 +1,89 @@
+"""Анализ слов с постоянным индексом частот.
+
+Частоты лемм каждой расшифровки сохраняются в индексе по хэшу её
+содержимого. Повторный или сводный запрос пересчитывает только новые и
+изменённые расшифровки, а для остальных сливает сохранённые частоты.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+from app.application.ports import IWordFrequencyIndex
+from app.domain.models.word_analysis import CorpusFrequencyResult, WordAnalysisConfig
+
+
+def index_variant(config: WordAnalysisConfig) -> str:
+    """Вариант анализа, от которого зависят сохранённые частоты."""
+    if not config.lemmatize:
+        return "forms"
+    return "lemmas-no-names" if config.exclude_names else "lemmas"
+
+
+@dataclass(frozen=True)
+class WordIndexStats:
+    """Статистика обращений к индексу частот."""
+
+    hits: int
+    misses: int
+
+    def to_text(self) -> str:
+        """Форматирует статистику в одну строку для логов."""
+        return f"Индекс частот: из индекса {self.hits}, проиндексировано заново {self.misses}"
+
+
+class IndexedWordAnalysisService:
+    """Анализ набора расшифровок через индекс частот."""
+
+    def __init__(self, service: Any, index: IWordFrequencyIndex):
+        """
+        Args:
+            service: Сервис анализа с методами lemma_counts и merge_lemma_counts
+                (WordAnalysisService или ParallelWordAnalysisService)
+            index: Индекс частот
+        """
+        self._service = service
+        self._index = index
+        self._hits = 0
+        self._misses = 0
+
+    def analyze_paths(
+        self,
+        paths: Iterable[str],
+        read_lines: Callable[[str], Iterable[str]],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+        per_file: bool = False,
+    ) -> CorpusFrequencyResult:
+        """Анализирует расшифровки, пересчитывая только отсутствующие в индексе.
+
+        Args:
+            paths: Пути к расшифровкам
+            read_lines: Чтение строк расшифровки (вызывается только при промахе индекса)
+            stopwords: Стоп-слова (применяются при слиянии, в индекс не попадают)
+            config: Конфигурация анализа
+            per_file: Строить ли частотный список для каждого файла
+
+        Returns:
+            CorpusFrequencyResult: Тот же результат, что и без индекса
+        """
+        return self._service.merge_lemma_counts(
+            self._file_counts(paths, read_lines, config), stopwords, config, per_file
+        )
+
+    def _file_counts(self, paths: Iterable[str], read_lines: Callable[[str], Iterable[str]],
+                     config: WordAnalysisConfig) -> Iterator[Tuple[str, Any]]:
+        variant = index_variant(config)
+        for path in paths:
+            content_hash = self._index.content_hash(path)
+            counts = self._index.load(content_hash, variant)
+            if counts is None:
+                self._misses += 1
+                counts = self._service.lemma_counts(read_lines(path), config)
+                self._index.save(content_hash, variant, counts)
+            else:
+                self._hits += 1
+            yield path, counts
+
+    def stats(self) -> WordIndexStats:
+        """Возвращает статистику обращений к индексу."""
+        return WordIndexStats(hits=self._hits, misses=self._misses)
@@ -0,0 +1,125 @@
+"""Кэш морфологического разбора словоформ."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from app.domain.models.word_analysis import LemmaInfo
+
+DEFAULT_LEMMA_CACHE_SIZE = 200_000
+
+
+@dataclass(frozen=True)
+class LemmaCacheStats:
+    """Статистика работы кэша лемм."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля обращений, обслуженных из кэша."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_text(self) -> str:
+        """Форматирует статистику в одну строку для логов."""
+        return (
+            f"Кэш лемм: попаданий {self.hits}, промахов {self.misses} "
+            f"({self.hit_rate:.0%}), вытеснений {self.evictions}, словоформ {self.size}"
+        )
+
+
+class LemmaCache:
+    """Ограниченный LRU-кэш словоформа -> LemmaInfo.
+
+    Живёт вместе с сервисом анализа и переиспользуется между вызовами analyze:
+    морфологический разбор выполняется один раз на словоформу, а не на каждое
+    её вхождение в текст.
+    """
+
+    def __init__(self, max_size: Optional[int] = DEFAULT_LEMMA_CACHE_SIZE):
+        """
+        Args:
+            max_size: Максимальное количество словоформ (None - без ограничения)
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("Размер кэша лемм должен быть не меньше 1")
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, LemmaInfo]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Разобранные вне кэша словоформы, первое обращение к которым ещё не учтено
+        self._unrecorded = set()
+
+    def get_or_compute(self, word: str, compute: Callable[[str], LemmaInfo]) -> LemmaInfo:
+        """Возвращает разбор словоформы из кэша или вычисляет его через compute."""
+        with self._lock:
+            info = self._entries.get(word)
+            if info is not None:
+                if word in self._unrecorded:
+                    self._unrecorded.discard(word)
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                self._entries.move_to_end(word)
+                return info
+            self._misses += 1
+        info = compute(word)
+        with self._lock:
+            self._put(word, info)
+        return info
+
+    def update(self, entries: Iterable[Tuple[str, LemmaInfo]]) -> None:
+        """Добавляет готовые разборы (например, загруженные с диска) без учёта в статистике."""
+        with self._lock:
+            for word, info in entries:
+                self._put(word, info)
+
+    def put_parsed(self, entries: Iterable[Tuple[str, LemmaInfo]]) -> None:
+        """Добавляет разборы, выполненные вне кэша (например, в процессах-воркерах).
+
+        Первое обращение к такой словоформе учитывается как промах - статистика
+        совпадает с той, что дал бы разбор через get_or_compute.
+        """
+        with self._lock:
+            for word, info in entries:
+                if word not in self._entries:
+                    self._unrecorded.add(word)
+                self._put(word, info)
+
+    def items(self) -> Dict[str, LemmaInfo]:
+        """Возвращает копию содержимого кэша (от давних обращений к недавним)."""
+        with self._lock:
+            return dict(self._entries)
+
+    def _put(self, word: str, info: LemmaInfo) -> None:
+        self._entries[word] = info
+        self._entries.move_to_end(word)
+        while self._max_size is not None and len(self._entries) > self._max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._unrecorded.discard(evicted)
+            self._evictions += 1
+
+    def stats(self) -> LemmaCacheStats:
+        """Возвращает текущую статистику кэша."""
+        with self._lock:
+            return LemmaCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def __contains__(self, word: str) -> bool:
+        with self._lock:
+            return word in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
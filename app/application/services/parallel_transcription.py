@@ -0,0 +1,260 @@
+"""Параллельная транскрипция длинных записей по фрагментам.
+
+Запись разбивается по участкам тишины на перекрывающиеся фрагменты, каждый
+фрагмент транскрибируется в отдельном процессе, а результаты сшиваются обратно
+в единый упорядоченный по времени поток сегментов.
+"""
+
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.application.ports import ITranscriptionEngine, ITranscriptSegmentWriter
+from app.domain.models.transcript import AudioChunk, Segment
+from app.utils.audio import decode_audio, detect_silences
+from app.utils.decorators import require_ffmpeg
+
+DEFAULT_CHUNK_DURATION = 600.0
+DEFAULT_CHUNK_OVERLAP = 5.0
+
+# Состояние процесса-воркера: движок и загруженные модели (по одной на имя)
+_worker_state: Dict[str, Any] = {}
+
+
+def plan_chunks(duration: float,
+                silences: Sequence[Tuple[float, float]],
+                chunk_duration: float = DEFAULT_CHUNK_DURATION,
+                overlap: float = DEFAULT_CHUNK_OVERLAP,
+                search_window: Optional[float] = None) -> List[AudioChunk]:
+    """Разбивает запись на фрагменты с границами в паузах.
+
+    Граница очередного фрагмента ищется в окне ±search_window вокруг целевой
+    точки (начало + chunk_duration); из найденных пауз выбирается самая длинная.
+    Если пауз нет, запись режется ровно по целевой точке.
+
+    Args:
+        duration: Длительность записи в секундах
+        silences: Интервалы тишины (start, end)
+        chunk_duration: Желаемая длительность фрагмента в секундах
+        overlap: Перекрытие с соседними фрагментами в секундах
+        search_window: Окно поиска паузы (по умолчанию 20% от chunk_duration)
+
+    Returns:
+        Список фрагментов в порядке следования
+    """
+    if duration <= 0:
+        return []
+    if chunk_duration <= 0:
+        raise ValueError("Длительность фрагмента должна быть положительной")
+
+    window = search_window if search_window is not None else chunk_duration * 0.2
+    cuts = [0.0]
+    while duration - cuts[-1] > chunk_duration:
+        target = cuts[-1] + chunk_duration
+        candidates = [
+            (end - start, start, end)
+            for start, end in silences
+            if cuts[-1] < (start + end) / 2 < duration
+            and abs((start + end) / 2 - target) <= window
+        ]
+        if candidates:
+            _, start, end = max(candidates, key=lambda item: (item[0], -abs((item[1] + item[2]) / 2 - target)))
+            cut = (start + end) / 2
+        else:
+            cut = target
+        cuts.append(cut)
+    cuts.append(duration)
+
+    return [
+        AudioChunk(
+            index=index,
+            start=max(0.0, own_start - overlap),
+            end=min(duration, own_end + overlap),
+            own_start=own_start,
+            own_end=own_end,
+        )
+        for index, (own_start, own_end) in enumerate(zip(cuts, cuts[1:]))
+    ]
+
+
+def is_duplicate_segment(previous: Segment, segment: Segment) -> bool:
+    """Проверяет, что сегмент повторяет предыдущий (результат перекрытия фрагментов)."""
+    overlap = min(previous.end, segment.end) - max(previous.start, segment.start)
+    if overlap <= 0:
+        return False
+    shortest = min(previous.end - previous.start, segment.end - segment.start)
+    if shortest > 0 and overlap / shortest < 0.5:
+        return False
+    previous_text = previous.text.strip().lower()
+    text = segment.text.strip().lower()
+    return bool(text) and (text in previous_text or previous_text in text)
+
+
+def stitch_chunk_segments(chunk: AudioChunk,
+                          segments: Sequence[Segment],
+                          is_last: bool = False) -> List[Segment]:
+    """Переводит сегменты фрагмента в абсолютное время и оставляет только свою зону.
+
+    Args:
+        chunk: Фрагмент, для которого получены сегменты
+        segments: Сегменты с временем относительно начала фрагмента
+        is_last: Является ли фрагмент последним
+
+    Returns:
+        Сегменты в абсолютном времени, упорядоченные по началу
+    """
+    shifted = [
+        Segment(start=segment.start + chunk.start, end=segment.end + chunk.start, text=segment.text)
+        for segment in segments
+    ]
+    owned = [segment for segment in shifted if chunk.owns(segment, is_last=is_last)]
+    owned.sort(key=lambda segment: (segment.start, segment.end))
+    return owned
+
+
+def _init_worker(engine_factory: Callable[[], Tuple[ITranscriptionEngine, str]],
+                 audio_loader: Callable[..., Any]) -> None:
+    """Инициализирует процесс-воркер: создаёт движок один раз на процесс."""
+    engine, _ = engine_factory()
+    _worker_state.clear()
+    _worker_state["engine"] = engine
+    _worker_state["audio_loader"] = audio_loader
+    _worker_state["models"] = {}
+
+
+def _transcribe_chunk(audio_path: str,
+                      chunk: AudioChunk,
+                      is_last: bool,
+                      model_name: str,
+                      language: str,
+                      beam_size: int) -> List[Segment]:
+    """Транскрибирует один фрагмент внутри процесса-воркера."""
+    engine: ITranscriptionEngine = _worker_state["engine"]
+    models: Dict[str, Any] = _worker_state["models"]
+    if model_name not in models:
+        models[model_name] = engine.load_model(model_name)
+
+    audio = _worker_state["audio_loader"](audio_path, start=chunk.start, duration=chunk.duration)
+    segments = list(engine.transcribe(
+        model=models[model_name],
+        audio_path=audio,
+        language=language,
+        beam_size=beam_size,
+        verbose=False,
+    ))
+    return stitch_chunk_segments(chunk, segments, is_last=is_last)
+
+
+class ParallelTranscriptionService:
+    """Сервис параллельной транскрипции по фрагментам.
+
+    Каждый процесс пула создаёт собственный движок через engine_factory
+    (движки и модели не передаются между процессами), поэтому фабрика
+    должна быть сериализуемой (функция уровня модуля или functools.partial).
+    """
+
+    def __init__(self,
+                 engine_factory: Callable[[], Tuple[ITranscriptionEngine, str]],
+                 workers: int,
+                 chunk_duration: float = DEFAULT_CHUNK_DURATION,
+                 overlap: float = DEFAULT_CHUNK_OVERLAP,
+                 silence_detector: Optional[Callable[[str], Tuple[float, List[Tuple[float, float]]]]] = None,
+                 audio_loader: Optional[Callable[..., Any]] = None,
+                 executor_factory: Optional[Callable[..., Executor]] = None):
+        """
+        Args:
+            engine_factory: Фабрика движка, возвращающая (адаптер, имя модели)
+            workers: Количество процессов-воркеров
+            chunk_duration: Желаемая длительность фрагмента в секундах
+            overlap: Перекрытие соседних фрагментов в секундах
+            silence_detector: Поиск пауз (по умолчанию ffmpeg silencedetect)
+            audio_loader: Декодирование участка записи (по умолчанию через ffmpeg)
+            executor_factory: Фабрика пула (по умолчанию ProcessPoolExecutor)
+        """
+        if workers < 1:
+            raise ValueError("Количество воркеров должно быть не меньше 1")
+        self._engine_factory = engine_factory
+        self._workers = workers
+        self._chunk_duration = chunk_duration
+        self._overlap = overlap
+        self._silence_detector = silence_detector or detect_silences
+        self._audio_loader = audio_loader or decode_audio
+        self._executor_factory = executor_factory or ProcessPoolExecutor
+
+    @require_ffmpeg
+    def transcribe(self,
+                   input_path: str,
+                   output_writer: ITranscriptSegmentWriter,
+                   model_name: str,
+                   language: str = 'ru',
+                   **kwargs) -> Iterator[Segment]:
+        """Выполняет параллельную транскрипцию аудиофайла.
+
+        Сигнатура совпадает с TranscriptionService.transcribe. Сегменты
+        записываются в output_writer строго по порядку фрагментов, по мере
+        готовности очередного фрагмента.
+
+        Args:
+            input_path: Путь к аудиофайлу
+            output_writer: Адаптер для записи сегментов транскрипции
+            model_name: Название модели (например, 'base', 'small', 'medium')
+            language: Код языка транскрипции (ISO 639-1, например 'ru', 'en')
+            **kwargs: Дополнительные параметры (beam_size, verbose)
+
+        Yields:
+            Segment: Сегменты транскрипции в абсолютном времени (по мере записи;
+                сервис хранит в памяти только результаты ещё не записанных фрагментов)
+
+        Raises:
+            RuntimeError: Если ffmpeg не найден или не смог обработать файл
+        """
+        beam_size = kwargs.get('beam_size', 5)
+        verbose = kwargs.get('verbose', False)
+
+        try:
+            duration, silences = self._silence_detector(input_path)
+            chunks = plan_chunks(duration, silences, self._chunk_duration, self._overlap)
+            if not chunks:
+                raise RuntimeError(f"Не удалось определить длительность записи: {input_path}")
+
+            if verbose:
+                print(f"Параллельная транскрипция: {len(chunks)} фрагментов, "
+                      f"воркеров: {self._workers}, длительность: {duration/60:.1f} мин",
+                      file=sys.stderr)
+
+            executor = self._executor_factory(
+                max_workers=min(self._workers, len(chunks)),
+                initializer=_init_worker,
+                initargs=(self._engine_factory, self._audio_loader),
+            )
+            futures = []
+            try:
+                futures = [
+                    executor.submit(
+                        _transcribe_chunk,
+                        input_path,
+                        chunk,
+                        chunk.index == len(chunks) - 1,
+                        model_name,
+                        language,
+                        beam_size,
+                    )
+                    for chunk in chunks
+                ]
+                previous: Optional[Segment] = None
+                for chunk, future in zip(chunks, futures):
+                    for segment in future.result():
+                        if previous is not None and is_duplicate_segment(previous, segment):
+                            continue
+                        output_writer.write_segment(segment)
+                        previous = segment
+                        yield segment
+                    if verbose:
+                        print(f"Фрагмент {chunk.index + 1}/{len(chunks)} готов "
+                              f"({chunk.own_end/60:.1f} мин)", file=sys.stderr)
+            finally:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+        finally:
+            output_writer.close()
@@ -0,0 +1,228 @@
+"""Параллельный анализ слов в пуле процессов.
+
+Вход режется на шарды по диапазонам строк. Каждый процесс пула считает
+словоформы своих шардов и разбирает собственную часть различных словоформ
+своим MorphAnalyzer, а частичные Counter'ы сливаются в основном процессе
+в порядке шардов. Поэтому результат совпадает с последовательным
+WordAnalysisService.analyze, включая порядок слов с равной частотой.
+"""
+
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.application.services.lemma_cache import LemmaCache
+from app.application.services.word_analysis import WordAnalysisService
+from app.domain.models.word_analysis import (
+    CorpusFrequencyResult,
+    LemmaInfo,
+    WordAnalysisConfig,
+    WordFrequencyResult,
+)
+from app.utils.text_analysis import get_tokenizer
+
+DEFAULT_SHARD_LINES = 5000
+
+# Состояние процесса-воркера: собственный сервис анализа со своим MorphAnalyzer
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(morph_factory: Callable[[], Any]) -> None:
+    """Инициализирует процесс-воркер (MorphAnalyzer создаётся при первом разборе)."""
+    _worker_state.clear()
+    _worker_state["morph_factory"] = morph_factory
+
+
+def _worker_service() -> WordAnalysisService:
+    """Возвращает сервис анализа процесса-воркера, создавая его один раз на процесс."""
+    service = _worker_state.get("service")
+    if service is None:
+        service = WordAnalysisService(morph_analyzer=_worker_state["morph_factory"]())
+        _worker_state["service"] = service
+    return service
+
+
+def _count_shard(lines: List[str], tokenizer_name: Optional[str] = None) -> Counter:
+    """Считает словоформы шарда внутри процесса-воркера."""
+    return WordAnalysisService.count_words_in_lines(lines, get_tokenizer(tokenizer_name))
+
+
+def _parse_shard(words: List[str]) -> List[Tuple[str, LemmaInfo]]:
+    """Разбирает словоформы внутри процесса-воркера."""
+    return _worker_service().parse_words(words)
+
+
+def _split_lines(lines: Iterable[str], shard_lines: int) -> Iterator[List[str]]:
+    iterator = iter(lines)
+    while True:
+        shard = list(islice(iterator, shard_lines))
+        if not shard:
+            return
+        yield shard
+
+
+class ParallelWordAnalysisService:
+    """Анализ слов с подсчётом и лемматизацией в пуле процессов.
+
+    Интерфейс совпадает с WordAnalysisService (analyze, analyze_files, lemma_counts,
+    merge_lemma_counts, lemma_cache).
+    Разборы из воркеров складываются в кэш лемм основного сервиса, а
+    итоговая свёртка словоформ в леммы выполняется им же, поэтому
+    фильтры и стоп-слова работают так же, как в последовательном режиме.
+    Фабрика анализатора должна быть сериализуемой (функция уровня модуля
+    или functools.partial).
+    """
+
+    def __init__(self,
+                 service: WordAnalysisService,
+                 morph_factory: Callable[[], Any],
+                 workers: int,
+                 shard_lines: int = DEFAULT_SHARD_LINES,
+                 executor_factory: Optional[Callable[..., Executor]] = None):
+        """
+        Args:
+            service: Основной сервис анализа (кэш лемм и свёртка в леммы)
+            morph_factory: Фабрика MorphAnalyzer для процессов-воркеров
+            workers: Количество процессов-воркеров
+            shard_lines: Количество строк входа в одном шарде
+            executor_factory: Фабрика пула (по умолчанию ProcessPoolExecutor)
+        """
+        if workers < 1:
+            raise ValueError("Количество воркеров должно быть не меньше 1")
+        if shard_lines < 1:
+            raise ValueError("Размер шарда должен быть не меньше 1 строки")
+        self._service = service
+        self._morph_factory = morph_factory
+        self._workers = workers
+        self._shard_lines = shard_lines
+        self._executor_factory = executor_factory or ProcessPoolExecutor
+
+    @property
+    def lemma_cache(self) -> LemmaCache:
+        return self._service.lemma_cache
+
+    def analyze(
+        self,
+        lines: Iterable[str],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+    ) -> WordFrequencyResult:
+        if config.approximate or config.ngram_sizes:
+            # Приблизительный подсчёт и n-граммы - один поток с общей таблицей счётчиков
+            # (n-грамма зависит от соседних слов и не делится на шарды)
+            return self._service.analyze(lines, stopwords, config)
+
+        executor = self._executor_factory(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._morph_factory,),
+        )
+        try:
+            word_counts = self._count_words(executor, lines)
+            if not word_counts:
+                raise ValueError("Не найдено слов длиной >= 3 символов")
+            if config.lemmatize:
+                self._parse_words(executor, word_counts)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        counts = self._service.count_lemmas(word_counts, stopwords, config).most_common(config.limit)
+        if not counts:
+            raise ValueError("После фильтрации не осталось слов для анализа")
+
+        return WordFrequencyResult(items=counts)
+
+    def analyze_files(
+        self,
+        files: Iterable[Tuple[str, Iterable[str]]],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+        per_file: bool = False,
+    ) -> CorpusFrequencyResult:
+        """Анализирует несколько файлов (см. WordAnalysisService.analyze_files).
+
+        Строки каждого файла шардируются по пулу, словоформы всего корпуса
+        разбираются в воркерах одним проходом.
+        """
+        if config.approximate or config.ngram_sizes:
+            return self._service.analyze_files(files, stopwords, config, per_file)
+
+        executor = self._executor_factory(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._morph_factory,),
+        )
+        total: Counter = Counter()
+        file_counts: List[Tuple[str, Counter]] = []
+        try:
+            for name, lines in files:
+                counts = self._count_words(executor, lines)
+                total.update(counts)
+                if per_file:
+                    file_counts.append((name, counts))
+            if config.lemmatize:
+                self._parse_words(executor, total)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if not per_file:
+            # Без разбивки по файлам достаточно общего счётчика
+            file_counts = [("", total)]
+        return self._service.fold_file_counts(file_counts, stopwords, config, per_file)
+
+    def lemma_counts(self, lines: Iterable[str], config: WordAnalysisConfig) -> Counter:
+        """Частоты лемм до фильтрации стоп-словами (см. WordAnalysisService.lemma_counts)."""
+        executor = self._executor_factory(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._morph_factory,),
+        )
+        try:
+            word_counts = self._count_words(executor, lines)
+            if config.lemmatize:
+                self._parse_words(executor, word_counts)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return self._service.count_lemmas(word_counts, (), config)
+
+    def merge_lemma_counts(
+        self,
+        file_counts: Iterable[Tuple[str, Counter]],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+        per_file: bool = False,
+    ) -> CorpusFrequencyResult:
+        return self._service.merge_lemma_counts(file_counts, stopwords, config, per_file)
+
+    def _count_words(self, executor: Executor, lines: Iterable[str]) -> Counter:
+        """Считает словоформы по шардам.
+
+        В работе держится не больше двух шардов на воркер, так что вход
+        читается лениво. Частичные счётчики сливаются в порядке шардов:
+        порядок ключей совпадает с порядком первого появления словоформ.
+        """
+        word_counts: Counter = Counter()
+        pending: Deque[Future] = deque()
+        for shard in _split_lines(lines, self._shard_lines):
+            pending.append(executor.submit(_count_shard, shard, self._service.tokenizer_name))
+            if len(pending) >= self._workers * 2:
+                word_counts.update(pending.popleft().result())
+        while pending:
+            word_counts.update(pending.popleft().result())
+        return word_counts
+
+    def _parse_words(self, executor: Executor, word_counts: Counter) -> None:
+        """Разбирает в воркерах словоформы, которых ещё нет в кэше лемм."""
+        cache = self._service.lemma_cache
+        missing = [word for word in word_counts if word not in cache]
+        if not missing:
+            return
+        # Несколько пакетов на воркер выравнивают нагрузку между процессами
+        batch_size = max(1, -(-len(missing) // (self._workers * 4)))
+        futures = [
+            executor.submit(_parse_shard, missing[start:start + batch_size])
+            for start in range(0, len(missing), batch_size)
+        ]
+        for future in futures:
+            cache.put_parsed(future.result())
@@ -1,18 +1,62 @@
 """Сервис для генерации протоколов на основе стенограммы."""
 
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable, List, Optional, Sequence, Tuple
+
 from app.application.ports import ILLMProtocolClient
-from app.domain.models.protocol import ProtocolConfig, ProtocolRequest, ProtocolResponse
+from app.domain.models.protocol import (
+    ProtocolConfig,
+    ProtocolRequest,
+    ProtocolResponse,
+    TranscriptChunk,
+    split_transcript,
+)
+
+CHUNK_INSTRUCTIONS = (
+    "Ниже - {title} расшифровки одной встречи. Составь по правилам выше частичный "
+    "протокол только этой части: он будет объединён с протоколами остальных частей. "
+    "Не додумывай то, что могло прозвучать в других частях."
+)
+
+REDUCE_INSTRUCTIONS = (
+    "Ниже - частичные протоколы последовательных частей одной встречи. Объедини их "
+    "в один итоговый протокол по правилам выше: убери повторы, сведи темы, решения "
+    "и задачи, сохрани хронологию."
+)
 
 
 class ProtocolService:
-    """Оркеструет генерацию протокола через LLM-провайдера."""
+    """Оркеструет генерацию протокола через LLM-провайдера.
 
-    def __init__(self, client: ILLMProtocolClient):
+    Расшифровка длиннее config.max_chunk_chars обрабатывается по схеме
+    map-reduce: делится на части по границам сегментов, по каждой части
+    параллельно строится частичный протокол, затем частичные протоколы
+    сводятся в итоговый (если они сами не помещаются в один запрос -
+    сводятся группами в несколько уровней).
+    """
+
+    def __init__(self,
+                 client: ILLMProtocolClient,
+                 executor_factory: Optional[Callable[..., Executor]] = None):
         """
         Args:
             client: Реализация порта для выбранного провайдера LLM.
+            executor_factory: Фабрика пула для параллельных запросов
+                (по умолчанию ThreadPoolExecutor: запросы ограничены сетью, а не CPU).
         """
         self._client = client
+        self._executor_factory = executor_factory or ThreadPoolExecutor
+
+    def close(self) -> None:
+        """Закрывает клиента провайдера (и его пул соединений)."""
+        self._client.close()
+
+    def __enter__(self) -> "ProtocolService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def build_request(
         self,
@@ -31,11 +75,42 @@ class ProtocolService:
             config=config,
         )
 
+    def build_chunk_request(
+        self,
+        instructions: str,
+        chunk: TranscriptChunk,
+        total: int,
+        config: ProtocolConfig,
+    ) -> ProtocolRequest:
+        """Формирует запрос частичного протокола для одной части расшифровки."""
+        note = CHUNK_INSTRUCTIONS.format(title=chunk.title(total).lower())
+        return ProtocolRequest(
+            instructions=_join_instructions(instructions, note),
+            transcript=chunk.text,
+            config=config,
+        )
+
+    def build_reduce_request(
+        self,
+        instructions: str,
+        partials: Sequence[str],
+        titles: Sequence[str],
+        config: ProtocolConfig,
+    ) -> ProtocolRequest:
+        """Формирует запрос сведения частичных протоколов в один."""
+        return ProtocolRequest(
+            instructions=_join_instructions(instructions, REDUCE_INSTRUCTIONS),
+            transcript=_join_partials(partials, titles),
+            config=config,
+            transcript_title="Частичные протоколы",
+        )
+
     def generate_protocol(
         self,
         instructions: str,
         transcript: str,
         config: ProtocolConfig,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> ProtocolResponse:
         """Генерирует протокол, обращаясь к провайдеру LLM.
 
@@ -43,11 +118,105 @@ class ProtocolService:
             instructions: Текст инструкций для модели.
             transcript: Текст расшифровки встречи.
             config: Конфигурация выбранного провайдера/модели.
+            on_token: Получает текст итогового протокола фрагментами по мере
+                генерации (при config.stream). Частичные протоколы частей
+                длинной расшифровки в него не попадают.
 
         Returns:
             ProtocolResponse: результат генерации протокола.
         """
-        request = self.build_request(instructions, transcript, config)
-        return self._client.generate_protocol(request)
+        if config.max_chunk_chars is None or len(transcript) <= config.max_chunk_chars:
+            request = self.build_request(instructions, transcript, config)
+            return self._send(request, on_token)
+
+        chunks = split_transcript(transcript, config.max_chunk_chars)
+        if len(chunks) == 1:
+            request = self.build_request(instructions, chunks[0].text, config)
+            return self._send(request, on_token)
+
+        # Промежуточные запросы не выводятся, поэтому потоковый режим им не нужен
+        inner_config = replace(config, stream=False)
+        executor = self._executor_factory(max_workers=min(config.max_parallel_requests, len(chunks)))
+        try:
+            # map: частичные протоколы по частям, порядок частей сохраняется
+            partials = list(executor.map(
+                self._client.generate_protocol,
+                [self.build_chunk_request(instructions, chunk, len(chunks), inner_config) for chunk in chunks],
+            ))
+            return self._reduce(executor, instructions, chunks, partials, config, on_token)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _send(self, request: ProtocolRequest, on_token: Optional[Callable[[str], None]]) -> ProtocolResponse:
+        if on_token is None:
+            return self._client.generate_protocol(request)
+        return self._client.generate_protocol(request, on_token=on_token)
+
+    def _reduce(
+        self,
+        executor: Executor,
+        instructions: str,
+        chunks: Sequence[TranscriptChunk],
+        partials: List[ProtocolResponse],
+        config: ProtocolConfig,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> ProtocolResponse:
+        """Сводит частичные протоколы; слишком длинный набор сводится группами по уровням."""
+        inner_config = replace(config, stream=False)
+        # Диапазоны частей (первая, последняя), которые покрывает каждый частичный протокол
+        spans: List[Tuple[int, int]] = [(chunk.index, chunk.index) for chunk in chunks]
+        while True:
+            titles = [_span_title(chunks, first, last) for first, last in spans]
+            contents = [partial.content for partial in partials]
+            if len(_join_partials(contents, titles)) <= config.max_chunk_chars:
+                break
+            groups = _group_partials(contents, titles, config.max_chunk_chars)
+            if len(groups) == len(contents):
+                # Каждый частичный протокол уже занимает целый запрос: сводим попарно
+                groups = [list(range(i, min(i + 2, len(contents)))) for i in range(0, len(contents), 2)]
+            if len(groups) == 1:
+                break
+            requests = [
+                self.build_reduce_request(
+                    instructions, [contents[i] for i in group], [titles[i] for i in group], inner_config
+                )
+                for group in groups
+            ]
+            partials = list(executor.map(self._client.generate_protocol, requests))
+            spans = [(spans[group[0]][0], spans[group[-1]][1]) for group in groups]
+
+        request = self.build_reduce_request(instructions, contents, titles, config)
+        return self._send(request, on_token)
+
+
+def _join_instructions(instructions: str, note: str) -> str:
+    return f"{instructions}\n\n{note}" if instructions else note
+
+
+def _join_partials(contents: Sequence[str], titles: Sequence[str]) -> str:
+    return "\n\n".join(f"## {title}\n\n{content}" for title, content in zip(titles, contents))
+
+
+def _group_partials(contents: Sequence[str], titles: Sequence[str], max_chars: int) -> List[List[int]]:
+    """Группирует подряд идущие частичные протоколы так, чтобы группа помещалась в max_chars."""
+    groups: List[List[int]] = []
+    size = 0
+    for i, (content, title) in enumerate(zip(contents, titles)):
+        length = len(_join_partials([content], [title]))
+        if groups and size + 2 + length <= max_chars:
+            groups[-1].append(i)
+            size += 2 + length
+        else:
+            groups.append([i])
+            size = length
+    return groups
 
 
+def _span_title(chunks: Sequence[TranscriptChunk], first: int, last: int) -> str:
+    """Заголовок частичного протокола, покрывающего части с first по last."""
+    if first == last:
+        return chunks[first].title(len(chunks))
+    title = f"Части {first + 1}-{last + 1} из {len(chunks)}"
+    if chunks[first].start and chunks[last].end:
+        title += f" ({chunks[first].start} - {chunks[last].end})"
+    return title
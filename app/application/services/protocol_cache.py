@@ -0,0 +1,99 @@
+"""Кэширование ответов LLM перед любым клиентом протокола.
+
+Повторная генерация с теми же промптом, моделью и параметрами (другой путь
+вывода, перезапуск упавшего конвейера) берёт ответ из кэша вместо платного
+запроса. Для длинных расшифровок кэшируется каждый запрос map-reduce, так
+что перезапуск повторяет только недошедшие запросы.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.application.ports import ILLMProtocolClient, IProtocolResponseCache
+from app.domain.models.protocol import ProtocolRequest, ProtocolResponse
+
+# Меняется при изменении состава ключа: старые записи перестают совпадать
+CACHE_KEY_VERSION = 1
+
+
+def protocol_cache_key(request: ProtocolRequest) -> str:
+    """SHA-256 от промпта и параметров модели, влияющих на ответ.
+
+    Настройки вывода и транспорта (stream, таймауты, параллелизм) в ключ
+    не входят: они не меняют текст протокола.
+    """
+    config = request.config
+    material = {
+        "version": CACHE_KEY_VERSION,
+        "prompt": request.render_prompt(),
+        "provider": config.provider,
+        "model": config.model,
+        "temperature": config.temperature,
+        "extra_params": config.extra_params,
+    }
+    encoded = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ProtocolCacheStats:
+    """Статистика обращений к кэшу ответов."""
+
+    hits: int
+    misses: int
+
+    def to_text(self) -> str:
+        """Форматирует статистику в одну строку для логов."""
+        return f"Кэш ответов LLM: из кэша {self.hits}, запросов к провайдеру {self.misses}"
+
+
+class CachingProtocolClient(ILLMProtocolClient):
+    """Клиент-обёртка: сначала ищет ответ в кэше, при промахе спрашивает провайдера."""
+
+    def __init__(self, client: ILLMProtocolClient, cache: IProtocolResponseCache):
+        """
+        Args:
+            client: Клиент провайдера LLM
+            cache: Хранилище ответов
+        """
+        self._client = client
+        self._cache = cache
+        # Запросы частей длинной расшифровки идут из нескольких потоков
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def generate_protocol(
+        self,
+        request: ProtocolRequest,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> ProtocolResponse:
+        key = protocol_cache_key(request)
+        cached = self._cache.get(key)
+        if cached is not None:
+            with self._lock:
+                self._hits += 1
+            if on_token is not None:
+                # Потоковый вывод получает сохранённый текст целиком
+                on_token(cached.content)
+            return cached
+
+        with self._lock:
+            self._misses += 1
+        if on_token is None:
+            response = self._client.generate_protocol(request)
+        else:
+            response = self._client.generate_protocol(request, on_token=on_token)
+        self._cache.put(key, response)
+        return response
+
+    def stats(self) -> ProtocolCacheStats:
+        """Возвращает статистику обращений к кэшу."""
+        with self._lock:
+            return ProtocolCacheStats(hits=self._hits, misses=self._misses)
+
+    def close(self) -> None:
+        self._client.close()
@@ -4,11 +4,19 @@
 Использует доменные модели Segment для работы с результатами транскрипции.
 """
 
-from typing import Iterator
-from app.application.ports import ITranscriptionEngine, ITranscriptSegmentWriter
-from app.domain.models.transcript import Segment
+from typing import Any, Callable, Iterator, List, Optional
+from app.application.ports import IAudioSource, ICheckpointStore, ITranscriptionEngine, ITranscriptSegmentWriter
+from app.application.services.parallel_transcription import is_duplicate_segment, stitch_chunk_segments
+from app.domain.models.transcript import Segment, TranscriptCheckpoint
+from app.utils.audio import decode_audio
 from app.utils.decorators import require_ffmpeg
 
+# Как часто (в сегментах) сохранять контрольную точку транскрипции
+DEFAULT_CHECKPOINT_EVERY = 50
+
+# Перекрытие окон при потоковом декодировании (с каждой стороны), в секундах
+DEFAULT_STREAM_OVERLAP = 5.0
+
 
 class TranscriptionService:
     """Сервис транскрипции аудио.
@@ -18,12 +26,26 @@ class TranscriptionService:
     Использует доменные модели Segment.
     """
     
-    def __init__(self, engine: ITranscriptionEngine):
+    def __init__(self,
+                 engine: ITranscriptionEngine,
+                 audio_loader: Optional[Callable[..., Any]] = None,
+                 checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                 audio_source: Optional[IAudioSource] = None,
+                 stream_overlap: float = DEFAULT_STREAM_OVERLAP):
         """
         Args:
             engine: Адаптер движка транскрипции, реализующий ITranscriptionEngine
+            audio_loader: Декодирование записи с заданного момента (для возобновления),
+                по умолчанию через ffmpeg
+            checkpoint_every: Через сколько сегментов сохранять контрольную точку
+            audio_source: Источник аудио для потокового режима (stream_window в transcribe)
+            stream_overlap: Перекрытие окон потокового режима в секундах
         """
         self._engine = engine
+        self._audio_loader = audio_loader or decode_audio
+        self._checkpoint_every = checkpoint_every
+        self._audio_source = audio_source
+        self._stream_overlap = stream_overlap
     
     @require_ffmpeg
     def transcribe(self,
@@ -31,6 +53,9 @@ class TranscriptionService:
                    output_writer: ITranscriptSegmentWriter,
                    model_name: str,
                    language: str = 'ru',
+                   checkpoint_store: Optional[ICheckpointStore] = None,
+                   resume_from: Optional[TranscriptCheckpoint] = None,
+                   stream_window: Optional[float] = None,
                    **kwargs) -> Iterator[Segment]:
         """Выполняет транскрипцию аудиофайла.
         
@@ -39,30 +64,67 @@ class TranscriptionService:
             output_writer: Адаптер для записи сегментов транскрипции (ITranscriptSegmentWriter)
             model_name: Название модели (например, 'base', 'small', 'medium')
             language: Код языка транскрипции (ISO 639-1, например 'ru', 'en')
+            checkpoint_store: Хранилище контрольных точек; если задано, прогресс
+                (время последнего записанного сегмента и смещение writer'а)
+                периодически сохраняется и удаляется после успешного завершения
+            resume_from: Контрольная точка, с которой нужно продолжить: запись
+                декодируется с момента last_end, тайминги сдвигаются на него же
+            stream_window: Если задано, запись не декодируется целиком, а подаётся
+                движку окнами указанной длины (в секундах) из audio_source;
+                пиковая память не зависит от длительности записи
             **kwargs: Дополнительные параметры (beam_size и т.д.)
         
         Yields:
-            Segment: Сегменты транскрипции с таймингами
+            Segment: Сегменты транскрипции с таймингами - по мере записи в output_writer.
+                Транскрипция выполняется, пока результат итерируется; сервис не
+                накапливает сегменты (см. transcribe_to_list, если нужен весь список)
         
         Raises:
-            RuntimeError: Если ffmpeg не найден (проверяется декоратором @require_ffmpeg)
+            RuntimeError: Если ffmpeg не найден (проверяется декоратором @require_ffmpeg
+                сразу при вызове, до начала итерации)
         """
-        # Загружаем модель через адаптер (compute_type уже настроен в адаптере)
-        model = self._engine.load_model(model_name)
+        # При возобновлении передаём движку только необработанный хвост записи
+        time_offset = resume_from.last_end if resume_from is not None else 0.0
         
-        # Выполняем транскрипцию через адаптер (получаем Iterator[Segment])
-        segments = self._engine.transcribe(
-            model=model,
-            audio_path=input_path,
-            language=language,
-            beam_size=kwargs.get('beam_size', 5),
-            verbose=kwargs.get('verbose', False)
-        )
+        try:
+            # Загружаем модель через адаптер (compute_type уже настроен в адаптере)
+            model = self._engine.load_model(model_name)
+            
+            if stream_window:
+                # Окна декодируются по одному, сегменты сразу в абсолютном времени
+                segments = self._transcribe_stream(
+                    model, input_path, stream_window, time_offset, language,
+                    beam_size=kwargs.get('beam_size', 5),
+                    verbose=kwargs.get('verbose', False),
+                )
+            else:
+                audio = input_path
+                if resume_from is not None:
+                    audio = self._audio_loader(input_path, start=time_offset)
+                
+                # Выполняем транскрипцию через адаптер (получаем Iterator[Segment])
+                segments = self._engine.transcribe(
+                    model=model,
+                    audio_path=audio,
+                    language=language,
+                    beam_size=kwargs.get('beam_size', 5),
+                    verbose=kwargs.get('verbose', False)
+                )
+                if time_offset:
+                    segments = self._shift_segments(segments, time_offset)
+        except Exception:
+            # writer уже передан сервису - закрываем его и при ошибке подготовки
+            # (загрузка модели, декодирование хвоста записи при возобновлении)
+            output_writer.close()
+            raise
         
         # Записываем сегменты через адаптер вывода (I/O операции изолированы)
-        segments_list = []
-        segment_count = 0
-        last_segment_time = 0.0
+        # Состояние для статистики прогресса не зависит от длины записи
+        written_count = 0
+        segment_count = resume_from.segment_count if resume_from is not None else 0
+        last_segment_time = time_offset
+        last_written_time = time_offset
+        segments_since_checkpoint = 0
         verbose = kwargs.get('verbose', False)
         generator_completed_normally = False
         
@@ -85,14 +147,21 @@ class TranscriptionService:
                 try:
                     # Записываем сегмент через порт (не знаем, куда именно - файл, консоль, БД и т.д.)
                     output_writer.write_segment(segment)
-                    segments_list.append(segment)
+                    written_count += 1
+                    last_written_time = max(last_written_time, segment.end)
+                    segments_since_checkpoint += 1
+                    if checkpoint_store is not None and segments_since_checkpoint >= self._checkpoint_every:
+                        self._save_checkpoint(checkpoint_store, output_writer, input_path,
+                                              last_written_time, segment_count)
+                        segments_since_checkpoint = 0
                 except Exception as e:
                     # Логируем ошибку, но продолжаем обработку остальных сегментов
                     import sys
                     print(f"Ошибка при записи сегмента [{segment.start:.2f} - {segment.end:.2f}]: {e}", 
                           file=sys.stderr)
-                    # Все равно добавляем сегмент в список для возврата
-                    segments_list.append(segment)
+                
+                # Отдаём сегмент вызывающему коду (даже если запись не удалась)
+                yield segment
             
             # Если цикл завершился без исключения, генератор дошел до конца
             generator_completed_normally = True
@@ -101,12 +170,13 @@ class TranscriptionService:
             # Генератор завершился нормально (это нормально для итераторов)
             generator_completed_normally = True
         except GeneratorExit:
-            # Генератор был закрыт принудительно
+            # Генератор был закрыт принудительно (вызывающий код прекратил итерацию)
             import sys
             print(f"ПРЕДУПРЕЖДЕНИЕ: Генератор был закрыт принудительно "
                   f"(обработано {segment_count} сегментов, последнее время: {last_segment_time:.2f} сек)", 
                   file=sys.stderr)
             generator_completed_normally = False
+            raise
         except Exception as e:
             # Логируем критическую ошибку при обработке генератора
             import sys
@@ -116,12 +186,18 @@ class TranscriptionService:
             generator_completed_normally = False
             raise
         finally:
+            if checkpoint_store is not None and not generator_completed_normally:
+                # Фиксируем прогресс перед закрытием, чтобы можно было продолжить с этого места
+                self._save_checkpoint(checkpoint_store, output_writer, input_path,
+                                      last_written_time, segment_count)
             # Всегда закрываем writer, даже если произошла ошибка
             output_writer.close()
+            if checkpoint_store is not None and generator_completed_normally:
+                checkpoint_store.clear()
             # Логируем итоговую статистику
             import sys
             if verbose or not generator_completed_normally:
-                print(f"Завершена транскрипция: обработано {len(segments_list)} сегментов, "
+                print(f"Завершена транскрипция: обработано {written_count} сегментов, "
                       f"последнее время: {last_segment_time:.2f} сек ({last_segment_time/60:.1f} мин)", 
                       file=sys.stderr)
                 
@@ -133,7 +209,82 @@ class TranscriptionService:
                           f"Последний сегмент на {last_segment_time/60:.1f} минуте. "
                           f"Возможно, транскрипция неполная.", 
                           file=sys.stderr)
+    
+    def transcribe_to_list(self,
+                           input_path: str,
+                           output_writer: ITranscriptSegmentWriter,
+                           model_name: str,
+                           language: str = 'ru',
+                           **kwargs) -> List[Segment]:
+        """Выполняет транскрипцию и возвращает все сегменты списком.
+        
+        Для вызывающего кода, которому нужен весь результат сразу; память
+        растёт с длиной записи. Параметры совпадают с transcribe.
         
-        # Возвращаем итератор сегментов для дальнейшей обработки
-        return iter(segments_list)
+        Returns:
+            List[Segment]: Все записанные сегменты
+        """
+        return list(self.transcribe(input_path, output_writer, model_name, language, **kwargs))
+    
+    def _transcribe_stream(self,
+                           model: Any,
+                           input_path: str,
+                           window_duration: float,
+                           start: float,
+                           language: str,
+                           beam_size: int,
+                           verbose: bool) -> Iterator[Segment]:
+        """Транскрибирует запись окнами из audio_source и сшивает результат.
+
+        Каждое окно распознаётся отдельно; из его сегментов остаются только те,
+        что попадают в собственную зону окна, а дубли на стыках отбрасываются.
+        """
+        if self._audio_source is None:
+            raise ValueError("Для потокового режима сервису нужен источник аудио (audio_source)")
+        
+        previous: Optional[Segment] = None
+        for chunk, samples in self._audio_source.windows(
+            input_path, window_duration, overlap=self._stream_overlap, start=start
+        ):
+            window_segments = list(self._engine.transcribe(
+                model=model,
+                audio_path=samples,
+                language=language,
+                beam_size=beam_size,
+                verbose=verbose,
+            ))
+            # У последнего окна нет правого перекрытия - его зона включает конец записи
+            is_last = chunk.own_end >= chunk.end
+            for segment in stitch_chunk_segments(chunk, window_segments, is_last=is_last):
+                if previous is not None and is_duplicate_segment(previous, segment):
+                    continue
+                previous = segment
+                yield segment
+    
+    @staticmethod
+    def _shift_segments(segments: Iterator[Segment], offset: float) -> Iterator[Segment]:
+        """Сдвигает тайминги сегментов на offset секунд."""
+        for segment in segments:
+            yield Segment(start=segment.start + offset, end=segment.end + offset, text=segment.text)
+    
+    @staticmethod
+    def _save_checkpoint(checkpoint_store: ICheckpointStore,
+                         output_writer: ITranscriptSegmentWriter,
+                         input_path: str,
+                         last_end: float,
+                         segment_count: int) -> None:
+        """Сохраняет контрольную точку; ошибки сохранения не прерывают транскрипцию."""
+        try:
+            offset = output_writer.checkpoint()
+            if offset is None:
+                return
+            checkpoint_store.save(TranscriptCheckpoint(
+                input_path=input_path,
+                last_end=last_end,
+                writer_offset=offset,
+                segment_count=segment_count,
+            ))
+        except Exception as e:
+            import sys
+            print(f"Не удалось сохранить контрольную точку: {e}", file=sys.stderr)
 
@@ -1,35 +1,90 @@
 """Сервис для анализа слов."""
 
 from collections import Counter
-from typing import Iterable, List
+from dataclasses import replace
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Optional, Set, Tuple
 
-import pymorphy3
+from app.application.services.lemma_cache import LemmaCache
+from app.domain.models.word_analysis import (
+    CorpusFrequencyResult,
+    LemmaInfo,
+    WordAnalysisConfig,
+    WordFrequencyResult,
+)
+from app.utils.ngrams import NgramCounter
+from app.utils.space_saving import SpaceSavingCounter
+from app.utils.text_analysis import TIMESTAMP_PATTERN, POS_TO_EXCLUDE, get_tokenizer
 
-from app.domain.models.word_analysis import WordAnalysisConfig, WordFrequencyResult
-from app.utils.text_analysis import WORD_PATTERN, TIMESTAMP_PATTERN, POS_TO_EXCLUDE
+# Сколько строк токенизируется за один вызов (накладные расходы вызова на строку заметны)
+LINES_PER_BATCH = 1000
 
 
 class WordAnalysisService:
     """Чистая бизнес-логика анализа слов (без чтения файлов)."""
 
-    def __init__(self, morph_analyzer: pymorphy3.MorphAnalyzer):
+    def __init__(self,
+                 morph_analyzer: Any,
+                 lemma_cache: Optional[LemmaCache] = None,
+                 tokenizer: Optional[str] = None):
+        """
+        Args:
+            morph_analyzer: Анализатор с методом parse (pymorphy3.MorphAnalyzer или
+                LazyMorphAnalyzer); вызывается только при лемматизации
+            lemma_cache: Кэш разборов словоформ (по умолчанию - новый LemmaCache)
+            tokenizer: Имя токенизатора из text_analysis.TOKENIZERS (по умолчанию
+                DEFAULT_TOKENIZER); результат от выбора не зависит
+        """
         self._morph = morph_analyzer
+        self._tokenizer = get_tokenizer(tokenizer)
+        # Кэш разбора словоформ переживает вызовы analyze
+        self._lemma_cache = lemma_cache if lemma_cache is not None else LemmaCache()
 
-    def extract_text(self, lines: Iterable[str]) -> str:
-        text_lines: List[str] = []
+    @property
+    def lemma_cache(self) -> LemmaCache:
+        return self._lemma_cache
+
+    @property
+    def tokenizer_name(self) -> str:
+        return self._tokenizer.name
+
+    def _parse_word(self, word: str) -> LemmaInfo:
+        parsed = self._morph.parse(word)[0]
+        # Граммемы pymorphy3 - локальные подклассы str: приводим к str, чтобы разбор
+        # сериализовался (кэш на диске, передача между процессами)
+        pos = parsed.tag.POS
+        return LemmaInfo(
+            pos=str(pos) if pos is not None else None,
+            grammemes=frozenset(str(grammeme) for grammeme in parsed.tag.grammemes),
+            normal_form=parsed.normal_form,
+        )
+
+    def parse_words(self, words: Iterable[str]) -> List[Tuple[str, LemmaInfo]]:
+        """Возвращает разборы словоформ (через кэш лемм) в порядке words."""
+        return [(word, self._lemma_cache.get_or_compute(word, self._parse_word)) for word in words]
+
+    @staticmethod
+    def clean_line(line: str) -> str:
+        """Возвращает текст строки без таймкода в нижнем регистре (пустая строка, если текста нет)."""
+        stripped = line.strip()
+        match = TIMESTAMP_PATTERN.match(stripped)
+        if match:
+            stripped = stripped[match.end():].strip()
+        return stripped.lower()
+
+    @staticmethod
+    def iter_text_lines(lines: Iterable[str]) -> Iterator[str]:
+        """Построчно отдаёт текст без таймкодов в нижнем регистре (пустые строки пропускаются)."""
         for line in lines:
-            stripped = line.strip()
-            match = TIMESTAMP_PATTERN.match(stripped)
-            if match:
-                remainder = stripped[match.end():].strip()
-                if remainder:
-                    text_lines.append(remainder)
-            elif stripped:
-                text_lines.append(stripped)
-        return " ".join(text_lines).lower()
+            text = WordAnalysisService.clean_line(line)
+            if text:
+                yield text
+
+    def extract_text(self, lines: Iterable[str]) -> str:
+        return " ".join(self.iter_text_lines(lines))
 
     def extract_words(self, text: str) -> List[str]:
-        return WORD_PATTERN.findall(text)
+        return self._tokenizer.tokenize(text)
 
     def lemmatize_and_filter(self, words: List[str], config: WordAnalysisConfig) -> List[str]:
         if not config.lemmatize:
@@ -37,37 +92,288 @@ class WordAnalysisService:
 
         filtered: List[str] = []
         for word in words:
-            parsed = self._morph.parse(word)[0]
-            if parsed.tag.POS in POS_TO_EXCLUDE:
-                continue
-            if config.exclude_names and "Name" in parsed.tag.grammemes:
-                continue
-            filtered.append(parsed.normal_form)
+            lemma = self._lemma_or_none(word, config)
+            if lemma is not None:
+                filtered.append(lemma)
         return filtered
 
+    def _lemma_or_none(self, word: str, config: WordAnalysisConfig) -> Optional[str]:
+        """Возвращает нормальную форму слова или None, если слово отфильтровано."""
+        parsed = self._lemma_cache.get_or_compute(word, self._parse_word)
+        if parsed.pos in POS_TO_EXCLUDE:
+            return None
+        if config.exclude_names and "Name" in parsed.grammemes:
+            return None
+        return parsed.normal_form
+
     def filter_stopwords(self, words: List[str], stopwords: Iterable[str]) -> List[str]:
         stop_set = set(stopwords) if stopwords else set()
         if not stop_set:
             return words
         return [word for word in words if word not in stop_set]
 
+    def count_words(self, text: str) -> Counter:
+        """Считает словоформы текста."""
+        counts: Counter = Counter()
+        self._tokenizer.count(text, counts)
+        return counts
+
+    @staticmethod
+    def count_words_in_lines(lines: Iterable[str], tokenizer: Optional[Any] = None) -> Counter:
+        """Считает словоформы по пакетам строк.
+
+        Строки обрабатываются пакетами по LINES_PER_BATCH (слово не может
+        переходить через границу строки), поэтому память зависит от размера
+        словаря, а не от объёма входа, если lines - ленивый итератор.
+
+        Args:
+            lines: Строки расшифровки
+            tokenizer: Токенизатор из text_analysis (по умолчанию get_tokenizer())
+        """
+        tokenizer = tokenizer or get_tokenizer()
+        counts: Counter = Counter()
+        batch: List[str] = []
+        for text in WordAnalysisService.iter_text_lines(lines):
+            batch.append(text)
+            if len(batch) >= LINES_PER_BATCH:
+                tokenizer.count("\n".join(batch), counts)
+                batch.clear()
+        if batch:
+            tokenizer.count("\n".join(batch), counts)
+        return counts
+
+    def count_lemmas(
+        self,
+        word_counts: Counter,
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+    ) -> Counter:
+        """Сводит частоты словоформ к частотам лемм.
+
+        Каждая различная словоформа лемматизируется и фильтруется один раз,
+        её частота прибавляется к лемме. Порядок ключей результата совпадает
+        с порядком первого появления лемм в тексте, поэтому most_common
+        упорядочивает равные частоты так же, как подсчёт по потоку токенов.
+        """
+        stop_set = set(stopwords) if stopwords else set()
+        lemma_counts: Counter = Counter()
+        for word, count in word_counts.items():
+            if config.lemmatize:
+                word = self._lemma_or_none(word, config)
+                if word is None:
+                    continue
+            if word in stop_set:
+                continue
+            lemma_counts[word] += count
+        return lemma_counts
+
     def analyze(
         self,
         lines: Iterable[str],
         stopwords: Iterable[str],
         config: WordAnalysisConfig,
     ) -> WordFrequencyResult:
-        text = self.extract_text(lines)
-        words = self.extract_words(text)
-        if not words:
-            raise ValueError("Не найдено слов длиной >= 3 символов")
+        stopwords = set(stopwords) if stopwords else set()
+        ngram_counter = None
+        if config.ngram_sizes:
+            # n-граммы считаются попутно, за тот же единственный проход по строкам
+            ngram_counter = NgramCounter(config.ngram_sizes, config.ngram_min_count, config.max_ngrams)
+            lines = self._feed_ngrams(lines, ngram_counter, stopwords, config)
 
-        words = self.lemmatize_and_filter(words, config)
-        words = self.filter_stopwords(words, stopwords)
+        if config.approximate:
+            result = self.analyze_approximate(lines, stopwords, config)
+        else:
+            # Сначала считаем словоформы (построчно), затем лемматизируем только различные формы
+            word_counts = self.count_words_in_lines(lines, self._tokenizer)
+            if not word_counts:
+                raise ValueError("Не найдено слов длиной >= 3 символов")
 
-        counts = Counter(words).most_common(config.limit)
+            counts = self.count_lemmas(word_counts, stopwords, config).most_common(config.limit)
+            if not counts:
+                raise ValueError("После фильтрации не осталось слов для анализа")
+            result = WordFrequencyResult(items=counts)
+
+        if ngram_counter is not None:
+            result = replace(
+                result,
+                ngrams=ngram_counter.most_common(config.limit),
+                ngrams_pruned=ngram_counter.pruned,
+            )
+        return result
+
+    def _feed_ngrams(
+        self,
+        lines: Iterable[str],
+        ngram_counter: NgramCounter,
+        stopwords: Set[str],
+        config: WordAnalysisConfig,
+    ) -> Iterator[str]:
+        """Пропускает строки дальше без изменений, попутно считая n-граммы.
+
+        n-граммы строятся по тем же леммам (словоформам без лемматизации),
+        что и частотный список: слова, отброшенные фильтром частей речи,
+        именами или стоп-словами, разрывают n-грамму, как и конец строки.
+        """
+        for line in lines:
+            text = self.clean_line(line)
+            if text:
+                for word in self._tokenizer.tokenize(text):
+                    term = self._lemma_or_none(word, config) if config.lemmatize else word
+                    if term is None or term in stopwords:
+                        ngram_counter.reset()
+                    else:
+                        ngram_counter.add(term)
+                ngram_counter.reset()
+            yield line
+
+    def analyze_approximate(
+        self,
+        lines: Iterable[str],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+    ) -> WordFrequencyResult:
+        """Приблизительный частотный список с фиксированным объёмом памяти.
+
+        Леммы считаются потоком в SpaceSavingCounter на config.counter_capacity
+        счётчиков, поэтому память не зависит от размера словаря (опечатки и
+        мусорные токены ASR не раздувают таблицу). Погрешность частот
+        возвращается в WordFrequencyResult.error_bound; пока словарь
+        помещается в таблицу, результат совпадает с точным.
+        """
+        stop_set = set(stopwords) if stopwords else set()
+        counter = SpaceSavingCounter(config.counter_capacity)
+        found_words = False
+        for text in self.iter_text_lines(lines):
+            for word in self._tokenizer.tokenize(text):
+                found_words = True
+                if config.lemmatize:
+                    word = self._lemma_or_none(word, config)
+                    if word is None:
+                        continue
+                if word not in stop_set:
+                    counter.add(word)
+        if not found_words:
+            raise ValueError("Не найдено слов длиной >= 3 символов")
+
+        counts = counter.most_common(config.limit)
         if not counts:
             raise ValueError("После фильтрации не осталось слов для анализа")
 
-        return WordFrequencyResult(items=counts)
+        return WordFrequencyResult(items=counts, error_bound=counter.error_bound)
+
+    def lemma_counts(self, lines: Iterable[str], config: WordAnalysisConfig) -> Counter:
+        """Частоты лемм (словоформ без лемматизации) до фильтрации стоп-словами.
+
+        Результат не зависит от стоп-слов, поэтому его можно сохранять
+        и сливать с частотами других файлов (см. merge_lemma_counts).
+        """
+        return self.count_lemmas(self.count_words_in_lines(lines, self._tokenizer), (), config)
+
+    def merge_lemma_counts(
+        self,
+        file_counts: Iterable[Tuple[str, Counter]],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+        per_file: bool = False,
+    ) -> CorpusFrequencyResult:
+        """Сливает частоты лемм файлов (из lemma_counts) в порядке файлов.
+
+        Результат совпадает с analyze_files по тем же файлам: лемма впервые
+        появляется в слиянии там же, где её первая словоформа в общем тексте.
+        """
+        stop_set = set(stopwords) if stopwords else set()
+        total: Counter = Counter()
+        breakdown: List[Tuple[str, WordFrequencyResult]] = []
+        for name, counts in file_counts:
+            total.update(counts)
+            if per_file:
+                filtered = Counter({word: count for word, count in counts.items() if word not in stop_set})
+                breakdown.append((name, WordFrequencyResult(items=filtered.most_common(config.limit))))
+        if not total:
+            raise ValueError("Не найдено слов длиной >= 3 символов")
+
+        for word in stop_set:
+            total.pop(word, None)
+        items = total.most_common(config.limit)
+        if not items:
+            raise ValueError("После фильтрации не осталось слов для анализа")
+        return CorpusFrequencyResult(total=WordFrequencyResult(items=items), files=breakdown)
+
+    def analyze_files(
+        self,
+        files: Iterable[Tuple[str, Iterable[str]]],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+        per_file: bool = False,
+    ) -> CorpusFrequencyResult:
+        """Анализирует несколько файлов одним анализатором и кэшем лемм.
+
+        Args:
+            files: Пары (имя файла, строки файла); строки читаются по очереди
+            stopwords: Стоп-слова
+            config: Конфигурация анализа
+            per_file: Строить ли частотный список для каждого файла
+
+        Returns:
+            CorpusFrequencyResult: Сводный список (совпадает с analyze по всем
+                строкам подряд) и, при per_file, списки по файлам
+        """
+        if config.approximate or config.ngram_sizes:
+            return self._analyze_files_streaming(files, stopwords, config, per_file)
+        return self.fold_file_counts(
+            ((name, self.count_words_in_lines(lines, self._tokenizer)) for name, lines in files),
+            stopwords,
+            config,
+            per_file,
+        )
+
+    def _analyze_files_streaming(
+        self,
+        files: Iterable[Tuple[str, Iterable[str]]],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+        per_file: bool,
+    ) -> CorpusFrequencyResult:
+        # Приблизительные счётчики и n-граммы не сливаются по файлам: все строки идут одним потоком
+        if per_file:
+            if config.approximate:
+                raise ValueError("Приблизительный подсчёт не поддерживает разбивку по файлам")
+            raise ValueError("Подсчёт n-грамм не поддерживает разбивку по файлам")
+        lines = chain.from_iterable(file_lines for _, file_lines in files)
+        return CorpusFrequencyResult(total=self.analyze(lines, stopwords, config))
+
+    def fold_file_counts(
+        self,
+        file_counts: Iterable[Tuple[str, Counter]],
+        stopwords: Iterable[str],
+        config: WordAnalysisConfig,
+        per_file: bool = False,
+    ) -> CorpusFrequencyResult:
+        """Сводит частоты словоформ по файлам в сводный и пофайловые списки лемм.
+
+        Без per_file счётчики файлов не сохраняются: память определяется
+        общим словарём корпуса.
+        """
+        total: Counter = Counter()
+        breakdown: List[Tuple[str, Counter]] = []
+        for name, counts in file_counts:
+            total.update(counts)
+            if per_file:
+                breakdown.append((name, counts))
+        if not total:
+            raise ValueError("Не найдено слов длиной >= 3 символов")
+
+        stopwords = list(stopwords)
+        items = self.count_lemmas(total, stopwords, config).most_common(config.limit)
+        if not items:
+            raise ValueError("После фильтрации не осталось слов для анализа")
 
+        return CorpusFrequencyResult(
+            total=WordFrequencyResult(items=items),
+            files=[
+                (name, WordFrequencyResult(
+                    items=self.count_lemmas(counts, stopwords, config).most_common(config.limit)
+                ))
+                for name, counts in breakdown
+            ],
+        )
@@ -1,17 +1,41 @@
 """Доменные модели."""
 
-from app.domain.models.transcript import Segment, Transcript
-from app.domain.models.protocol import ProtocolConfig, ProtocolRequest, ProtocolResponse
-from app.domain.models.word_analysis import WordAnalysisConfig, WordFrequencyResult
+from app.domain.models.transcript import (
+    Segment,
+    Transcript,
+    ColumnarTranscript,
+    SegmentView,
+    AudioChunk,
+    TranscriptCheckpoint,
+)
+from app.domain.models.protocol import (
+    ProtocolConfig,
+    ProtocolRequest,
+    ProtocolResponse,
+    TranscriptChunk,
+    split_transcript,
+)
+from app.domain.models.word_analysis import CorpusFrequencyResult, WordAnalysisConfig, WordFrequencyResult
+from app.domain.models.batch import BatchItem, BatchItemResult, BatchReport
 
 __all__ = [
     "Segment",
     "Transcript",
+    "ColumnarTranscript",
+    "SegmentView",
+    "AudioChunk",
+    "TranscriptCheckpoint",
     "ProtocolConfig",
     "ProtocolRequest",
     "ProtocolResponse",
+    "TranscriptChunk",
+    "split_transcript",
     "WordAnalysisConfig",
     "WordFrequencyResult",
+    "CorpusFrequencyResult",
+    "BatchItem",
+    "BatchItemResult",
+    "BatchReport",
 ]
 
 
@@ -0,0 +1,102 @@
+"""Доменные модели пакетной транскрипции."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """Файл пакетной транскрипции: вход и путь для результата."""
+
+    input_path: str
+    output_path: str
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    """Результат транскрипции одного файла пакета.
+
+    Attributes:
+        item: Исходный элемент пакета
+        wall_time: Время обработки файла в секундах
+        audio_duration: Длительность записи в секундах (0.0, если неизвестна)
+        segment_count: Количество записанных сегментов
+        error: Текст ошибки (None, если файл обработан успешно)
+    """
+
+    item: BatchItem
+    wall_time: float
+    audio_duration: float = 0.0
+    segment_count: int = 0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    @property
+    def real_time_factor(self) -> Optional[float]:
+        """Отношение времени обработки к длительности записи (меньше 1 - быстрее реального времени)."""
+        if self.audio_duration <= 0:
+            return None
+        return self.wall_time / self.audio_duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "input": self.item.input_path,
+            "output": self.item.output_path,
+            "wall_time": round(self.wall_time, 3),
+            "audio_duration": round(self.audio_duration, 3),
+            "real_time_factor": (
+                round(self.real_time_factor, 4) if self.real_time_factor is not None else None
+            ),
+            "segments": self.segment_count,
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    """Сводный отчёт пакетной транскрипции."""
+
+    results: List[BatchItemResult]
+    total_wall_time: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> List[BatchItemResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def total_audio_duration(self) -> float:
+        return sum(result.audio_duration for result in self.results if result.succeeded)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "files": [result.to_dict() for result in self.results],
+            "total_files": len(self.results),
+            "failed_files": len(self.failed),
+            "total_wall_time": round(self.total_wall_time, 3),
+            "total_audio_duration": round(self.total_audio_duration, 3),
+            **self.extra,
+        }
+
+    def to_text(self) -> str:
+        """Форматирует отчёт в виде таблицы для консоли."""
+        lines = []
+        for result in self.results:
+            if result.succeeded:
+                rtf = result.real_time_factor
+                rtf_text = f"{rtf:.3f}" if rtf is not None else "-"
+                lines.append(
+                    f"{result.item.input_path}: {result.wall_time:.1f} сек, "
+                    f"аудио {result.audio_duration:.1f} сек, RTF {rtf_text}, "
+                    f"сегментов {result.segment_count}"
+                )
+            else:
+                lines.append(f"{result.item.input_path}: ОШИБКА - {result.error}")
+        lines.append(
+            f"Итого: {len(self.results)} файлов, ошибок {len(self.failed)}, "
+            f"время {self.total_wall_time:.1f} сек, аудио {self.total_audio_duration:.1f} сек"
+        )
+        return "\n".join(lines)
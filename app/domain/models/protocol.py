@@ -1,7 +1,15 @@
 """Доменные модели для команды protocol."""
 
+import re
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Dict, List, Optional
+
+# Расшифровки длиннее этого порога обрабатываются по частям (map-reduce)
+DEFAULT_MAX_CHUNK_CHARS = 60_000
+DEFAULT_MAX_PARALLEL_REQUESTS = 4
+
+# Строка сегмента расшифровки: "[0:00 - 0:05] текст" (см. Segment.to_line)
+SEGMENT_LINE_PATTERN = re.compile(r'^\[\s*([\d:.]+)\s*-\s*([\d:.]+)\s*\]')
 
 
 @dataclass(frozen=True)
@@ -15,6 +23,12 @@ class ProtocolConfig:
         instructions_path: Путь к файлу с инструкциями (CLI-слой читает содержимое).
         temperature: Температура выборки (если поддерживает провайдер).
         extra_params: Дополнительные настройки, специфичные для провайдера.
+        max_chunk_chars: Порог длины расшифровки в символах, выше которого она
+            делится на части по границам сегментов (None - всегда одним запросом).
+        max_parallel_requests: Сколько частей обрабатывается одновременно.
+        stream: Получать ответ потоком (SSE) и выводить текст по мере генерации.
+        request_timeout: Предельное время одного запроса в секундах; передаётся в
+            таймаут HTTP-запроса (None - таймаут клиента по умолчанию).
     """
 
     provider: str = "deepseek"
@@ -23,10 +37,110 @@ class ProtocolConfig:
     instructions_path: Optional[str] = None
     temperature: float = 0.7
     extra_params: Dict[str, object] = None
+    max_chunk_chars: Optional[int] = DEFAULT_MAX_CHUNK_CHARS
+    max_parallel_requests: int = DEFAULT_MAX_PARALLEL_REQUESTS
+    stream: bool = False
+    request_timeout: Optional[float] = None
 
     def __post_init__(self):
         if self.extra_params is None:
             object.__setattr__(self, "extra_params", {})
+        if self.max_chunk_chars is not None and self.max_chunk_chars < 1:
+            raise ValueError("max_chunk_chars должен быть положительным")
+        if self.max_parallel_requests < 1:
+            raise ValueError("max_parallel_requests должен быть не меньше 1")
+        if self.request_timeout is not None and self.request_timeout <= 0:
+            raise ValueError("request_timeout должен быть положительным")
+
+
+@dataclass(frozen=True)
+class TranscriptChunk:
+    """Часть расшифровки из целых сегментов.
+
+    Attributes:
+        index: Номер части (с нуля).
+        text: Строки сегментов части.
+        start: Таймкод начала первого сегмента (None, если строки без таймкодов).
+        end: Таймкод конца последнего сегмента.
+    """
+
+    index: int
+    text: str
+    start: Optional[str] = None
+    end: Optional[str] = None
+
+    def title(self, total: int) -> str:
+        """Заголовок части для промптов: номер и интервал времени."""
+        title = f"Часть {self.index + 1} из {total}"
+        if self.start and self.end:
+            title += f" ({self.start} - {self.end})"
+        return title
+
+
+def _split_long_text(text: str, max_chars: int) -> List[str]:
+    """Режет текст без таймкодов по пробелам на куски не длиннее max_chars (слова не рвутся)."""
+    pieces: List[str] = []
+    current: List[str] = []
+    size = 0
+    for word in text.split():
+        if current and size + 1 + len(word) > max_chars:
+            pieces.append(" ".join(current))
+            current, size = [], 0
+        size += len(word) + (1 if current else 0)
+        current.append(word)
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def split_transcript(transcript: str, max_chars: int) -> List[TranscriptChunk]:
+    """Делит расшифровку на части не длиннее max_chars по границам сегментов.
+
+    Сегмент - строка с таймкодом вместе со следующими за ней строками без
+    таймкода. Сегменты не разрываются; разрезается только сегмент, который
+    сам длиннее max_chars (по пробелам).
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars должен быть положительным")
+
+    # (текст сегмента, начало, конец)
+    segments: List[list] = []
+    for line in transcript.splitlines():
+        match = SEGMENT_LINE_PATTERN.match(line)
+        if match or not segments:
+            start, end = (match.group(1), match.group(2)) if match else (None, None)
+            segments.append([line, start, end])
+        else:
+            segments[-1][0] += "\n" + line
+
+    chunks: List[TranscriptChunk] = []
+    lines: List[str] = []
+    size = 0
+    start = end = None
+
+    def flush() -> None:
+        nonlocal lines, size, start, end
+        if lines:
+            chunks.append(TranscriptChunk(len(chunks), "\n".join(lines), start, end))
+        lines, size, start, end = [], 0, None, None
+
+    for text, seg_start, seg_end in segments:
+        if not text.strip():
+            continue
+        if len(text) > max_chars:
+            flush()
+            for piece in _split_long_text(text, max_chars):
+                chunks.append(TranscriptChunk(len(chunks), piece, seg_start, seg_end))
+            continue
+        if lines and size + 1 + len(text) > max_chars:
+            flush()
+        if not lines:
+            start = seg_start
+        lines.append(text)
+        size += len(text) + (1 if size else 0)
+        end = seg_end or end
+    flush()
+    return chunks
 
 
 @dataclass(frozen=True)
@@ -36,12 +150,14 @@ class ProtocolRequest:
     instructions: str
     transcript: str
     config: ProtocolConfig
+    # Заголовок блока с материалом (на этапе сведения это частичные протоколы)
+    transcript_title: str = "Расшифровка"
 
     def render_prompt(self) -> str:
         """Формирует промпт в формате, принятом текущей реализацией."""
         return (
             f"{self.instructions}\n\n"
-            "**Расшифровка:**\n\n"
+            f"**{self.transcript_title}:**\n\n"
             f"{self.transcript}"
         )
 
@@ -1,40 +1,52 @@
 """Доменные модели транскрипции."""
 
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import List, Iterator, Union
+from typing import Any, Dict, Iterable, List, Iterator, Optional, Union
+
+
+def _format_time(seconds: float) -> str:
+    """Форматирует время в секундах в читаемый формат MM:SS или HH:MM:SS.
+    
+    Args:
+        seconds: Время в секундах
+        
+    Returns:
+        Строка в формате MM:SS (если меньше часа) или HH:MM:SS (если больше часа)
+    """
+    total_seconds = int(seconds)
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    secs = total_seconds % 60
+    
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    else:
+        return f"{minutes}:{secs:02d}"
+
+
+def _segment_line(start: float, end: float, text: str) -> str:
+    return f"[{_format_time(start)} - {_format_time(end)}] {text}"
 
 
 @dataclass
 class Segment:
     """Сегмент транскрипции с таймингами."""
+    # Без __dict__: сегментов в длинных транскрипциях сотни тысяч
+    __slots__ = ("start", "end", "text")
+    
     start: float
     end: float
     text: str
     
     def _format_time(self, seconds: float) -> str:
-        """Форматирует время в секундах в читаемый формат MM:SS или HH:MM:SS.
-        
-        Args:
-            seconds: Время в секундах
-            
-        Returns:
-            Строка в формате MM:SS (если меньше часа) или HH:MM:SS (если больше часа)
-        """
-        total_seconds = int(seconds)
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        secs = total_seconds % 60
-        
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes}:{secs:02d}"
+        """Форматирует время в секундах в читаемый формат MM:SS или HH:MM:SS."""
+        return _format_time(seconds)
     
     def to_line(self) -> str:
         """Форматирует сегмент в строку с таймингами в читаемом формате MM:SS или HH:MM:SS."""
-        start_formatted = self._format_time(self.start)
-        end_formatted = self._format_time(self.end)
-        return f"[{start_formatted} - {end_formatted}] {self.text}"
+        return _segment_line(self.start, self.end, self.text)
 
 
 @dataclass
@@ -49,3 +61,219 @@ class Transcript:
         return '\n'.join(seg.to_line() for seg in self.segments)
 
 
+class SegmentView:
+    """Лёгкое представление сегмента ColumnarTranscript (без копирования данных)."""
+    __slots__ = ("_owner", "_index")
+    
+    def __init__(self, owner: "ColumnarTranscript", index: int):
+        self._owner = owner
+        self._index = index
+    
+    @property
+    def start(self) -> float:
+        return self._owner._starts[self._index]
+    
+    @property
+    def end(self) -> float:
+        return self._owner._ends[self._index]
+    
+    @property
+    def text(self) -> str:
+        return self._owner._text_at(self._index)
+    
+    def to_line(self) -> str:
+        """Форматирует сегмент так же, как Segment.to_line."""
+        return _segment_line(self.start, self.end, self.text)
+    
+    def to_segment(self) -> Segment:
+        """Создаёт самостоятельный Segment с теми же данными."""
+        return Segment(start=self.start, end=self.end, text=self.text)
+    
+    def __repr__(self) -> str:
+        return f"SegmentView(start={self.start!r}, end={self.end!r}, text={self.text!r})"
+
+
+class ColumnarTranscript:
+    """Компактная транскрипция с поколоночным хранением.
+    
+    Начала и концы сегментов хранятся в array('d'), тексты - в одной строке
+    со смещениями в array('q'). На сегмент приходится около 24 байт плюс
+    сам текст, вместо сотен байт на объект Segment со строкой и списком.
+    Если сегменты упорядочены по началу, выборка по времени (slice_time)
+    выполняется двоичным поиском.
+    """
+    __slots__ = ("_starts", "_ends", "_text", "_offsets", "_sorted", "language", "model")
+    
+    def __init__(self,
+                 starts: array,
+                 ends: array,
+                 text: str,
+                 offsets: array,
+                 language: str,
+                 model: str):
+        """
+        Args:
+            starts: Начала сегментов (array('d'))
+            ends: Концы сегментов (array('d'))
+            text: Тексты всех сегментов подряд
+            offsets: Границы текстов в text (array('q'), на один элемент больше числа сегментов)
+            language: Язык транскрипции
+            model: Модель, которой получена транскрипция
+        """
+        if len(starts) != len(ends) or len(offsets) != len(starts) + 1:
+            raise ValueError("Размеры колонок транскрипции не согласованы")
+        self._starts = starts
+        self._ends = ends
+        self._text = text
+        self._offsets = offsets
+        self._sorted = all(starts[i] <= starts[i + 1] for i in range(len(starts) - 1))
+        self.language = language
+        self.model = model
+    
+    @classmethod
+    def from_segments(cls, segments: Iterable[Segment], language: str, model: str) -> "ColumnarTranscript":
+        """Строит транскрипцию из последовательности сегментов (в один проход)."""
+        starts = array('d')
+        ends = array('d')
+        offsets = array('q', [0])
+        texts: List[str] = []
+        position = 0
+        for segment in segments:
+            starts.append(segment.start)
+            ends.append(segment.end)
+            texts.append(segment.text)
+            position += len(segment.text)
+            offsets.append(position)
+        return cls(starts, ends, ''.join(texts), offsets, language, model)
+    
+    @classmethod
+    def from_transcript(cls, transcript: Transcript) -> "ColumnarTranscript":
+        return cls.from_segments(transcript.segments, transcript.language, transcript.model)
+    
+    def to_transcript(self) -> Transcript:
+        """Преобразует в обычный Transcript со списком Segment."""
+        return Transcript(
+            segments=[view.to_segment() for view in self],
+            language=self.language,
+            model=self.model,
+        )
+    
+    def _text_at(self, index: int) -> str:
+        return self._text[self._offsets[index]:self._offsets[index + 1]]
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    def __iter__(self) -> Iterator[SegmentView]:
+        for index in range(len(self._starts)):
+            yield SegmentView(self, index)
+    
+    def __getitem__(self, key: Union[int, slice]) -> Union[SegmentView, "ColumnarTranscript"]:
+        if isinstance(key, slice):
+            first, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("Шаг среза не поддерживается")
+            return self._range(first, max(first, stop))
+        index = key + len(self) if key < 0 else key
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс сегмента вне диапазона")
+        return SegmentView(self, index)
+    
+    def _range(self, first: int, stop: int) -> "ColumnarTranscript":
+        text_start = self._offsets[first]
+        offsets = array('q', (offset - text_start for offset in self._offsets[first:stop + 1]))
+        return ColumnarTranscript(
+            self._starts[first:stop],
+            self._ends[first:stop],
+            self._text[text_start:self._offsets[stop]],
+            offsets,
+            self.language,
+            self.model,
+        )
+    
+    def slice_time(self, start: Optional[float] = None, end: Optional[float] = None) -> "ColumnarTranscript":
+        """Возвращает сегменты, начинающиеся в интервале [start, end).
+        
+        Args:
+            start: Начало интервала в секундах (None - с начала записи)
+            end: Конец интервала в секундах (None - до конца записи)
+        """
+        low = float('-inf') if start is None else start
+        high = float('inf') if end is None else end
+        if self._sorted:
+            return self._range(bisect_left(self._starts, low), bisect_left(self._starts, high))
+        indices = [i for i, value in enumerate(self._starts) if low <= value < high]
+        return ColumnarTranscript.from_segments(
+            (SegmentView(self, i) for i in indices), self.language, self.model
+        )
+    
+    def to_text(self) -> str:
+        """Возвращает текст транскрипции в том же формате, что Transcript.to_text."""
+        return '\n'.join(view.to_line() for view in self)
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """Фрагмент аудиозаписи для параллельной транскрипции.
+    
+    Attributes:
+        index: Порядковый номер фрагмента
+        start: Начало декодируемого участка (секунды, с учётом перекрытия)
+        end: Конец декодируемого участка (секунды, с учётом перекрытия)
+        own_start: Начало зоны ответственности фрагмента (секунды)
+        own_end: Конец зоны ответственности фрагмента (секунды)
+    """
+    index: int
+    start: float
+    end: float
+    own_start: float
+    own_end: float
+    
+    @property
+    def duration(self) -> float:
+        """Длительность декодируемого участка в секундах."""
+        return self.end - self.start
+    
+    def owns(self, segment: Segment, is_last: bool = False) -> bool:
+        """Проверяет, относится ли сегмент (в абсолютном времени) к зоне фрагмента.
+        
+        Сегмент принадлежит фрагменту, если его середина попадает в
+        [own_start, own_end). Для последнего фрагмента правая граница включается.
+        """
+        middle = (segment.start + segment.end) / 2
+        if is_last:
+            return self.own_start <= middle <= self.own_end
+        return self.own_start <= middle < self.own_end
+
+
+@dataclass(frozen=True)
+class TranscriptCheckpoint:
+    """Контрольная точка транскрипции для возобновления после сбоя.
+    
+    Attributes:
+        input_path: Путь к транскрибируемому файлу
+        last_end: Время окончания последнего записанного сегмента (секунды)
+        writer_offset: Смещение в выходном файле после этого сегмента (байты)
+        segment_count: Количество записанных сегментов
+    """
+    input_path: str
+    last_end: float
+    writer_offset: int
+    segment_count: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "input_path": self.input_path,
+            "last_end": self.last_end,
+            "writer_offset": self.writer_offset,
+            "segment_count": self.segment_count,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptCheckpoint":
+        return cls(
+            input_path=data["input_path"],
+            last_end=float(data["last_end"]),
+            writer_offset=int(data["writer_offset"]),
+            segment_count=int(data.get("segment_count", 0)),
+        )
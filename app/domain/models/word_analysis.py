@@ -1,7 +1,13 @@
 """Доменные модели для анализа слов."""
 
-from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+import math
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_ERROR_RATE = 0.0001
+DEFAULT_MAX_COUNTERS = 100_000
+DEFAULT_NGRAM_MIN_COUNT = 2
+DEFAULT_MAX_NGRAMS = 500_000
 
 
 @dataclass(frozen=True)
@@ -12,6 +18,26 @@ class WordAnalysisConfig:
     exclude_names: bool = False
     limit: int = 50
     stopwords: Optional[Sequence[str]] = None
+    # Приблизительный подсчёт (Space-Saving): память ограничена числом счётчиков
+    approximate: bool = False
+    error_rate: float = DEFAULT_ERROR_RATE
+    max_counters: Optional[int] = DEFAULT_MAX_COUNTERS
+    # Словосочетания: длины n-грамм (пусто - не считать), порог частоты и лимит памяти
+    ngram_sizes: Tuple[int, ...] = ()
+    ngram_min_count: int = DEFAULT_NGRAM_MIN_COUNT
+    max_ngrams: Optional[int] = DEFAULT_MAX_NGRAMS
+
+    @property
+    def counter_capacity(self) -> int:
+        """Число счётчиков приблизительного режима.
+
+        Погрешность частот не превышает error_rate от числа слов, а число
+        счётчиков, нужное для этого (1 / error_rate), ограничено max_counters.
+        """
+        capacity = math.ceil(1 / self.error_rate)
+        if self.max_counters is not None:
+            capacity = min(capacity, self.max_counters)
+        return max(1, capacity)
 
 
 @dataclass(frozen=True)
@@ -19,6 +45,12 @@ class WordFrequencyResult:
     """Результат анализа слов."""
 
     items: List[Tuple[str, int]]
+    # Максимальное завышение частот в приблизительном режиме (None - точный подсчёт)
+    error_bound: Optional[int] = None
+    # Частые словосочетания (n-граммы лемм через пробел)
+    ngrams: List[Tuple[str, int]] = field(default_factory=list)
+    # Счётчик словосочетаний обрезался по памяти (частоты редких n-грамм занижены)
+    ngrams_pruned: bool = False
 
     def top(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
         """Возвращает первые N элементов (по умолчанию весь список)."""
@@ -28,7 +60,36 @@ class WordFrequencyResult:
 
     def to_text(self) -> str:
         """Форматирует результат в текстовый вид."""
-        return "\n".join(f"{word}: {count}" for word, count in self.items)
+        text = "\n".join(f"{word}: {count}" for word, count in self.items)
+        if self.error_bound:
+            text += f"\n(приблизительный подсчёт: частоты завышены не более чем на {self.error_bound})"
+        if self.ngrams:
+            text += "\n\n# Словосочетания\n" + "\n".join(f"{ngram}: {count}" for ngram, count in self.ngrams)
+            if self.ngrams_pruned:
+                text += "\n(счётчик словосочетаний обрезался по памяти: частоты редких словосочетаний занижены)"
+        return text
+
+
+@dataclass(frozen=True)
+class CorpusFrequencyResult:
+    """Результат анализа слов по нескольким файлам."""
+
+    total: WordFrequencyResult
+    files: List[Tuple[str, WordFrequencyResult]] = field(default_factory=list)
+
+    def to_text(self) -> str:
+        """Форматирует сводный список и (если есть) разбивку по файлам."""
+        if not self.files:
+            return self.total.to_text()
+        sections = [f"# Все файлы ({len(self.files)})\n{self.total.to_text()}"]
+        for name, result in self.files:
+            sections.append(f"# {name}\n{result.to_text()}".rstrip("\n"))
+        return "\n\n".join(sections)
 
 
+class LemmaInfo(NamedTuple):
+    """Результат морфологического разбора словоформы, нужный для анализа слов."""
 
+    pos: Optional[str]
+    grammemes: FrozenSet[str]
+    normal_form: str
@@ -3,19 +3,31 @@
 from app.factories.transcription_factory import (
     create_transcription_adapter,
     create_transcription_service,
+    create_parallel_transcription_service,
+    create_batch_transcription_service,
+    resolve_model_name,
+    is_faster_whisper_model,
 )
 from app.factories.protocol_factory import (
     create_protocol_client,
     create_protocol_service,
 )
-from app.factories.tag_factory import create_word_analysis_service
+from app.factories.tag_factory import (
+    create_word_analysis_service,
+    create_parallel_word_analysis_service,
+)
 
 __all__ = [
     "create_transcription_adapter",
     "create_transcription_service",
+    "create_parallel_transcription_service",
+    "create_batch_transcription_service",
+    "resolve_model_name",
+    "is_faster_whisper_model",
     "create_protocol_client",
     "create_protocol_service",
     "create_word_analysis_service",
+    "create_parallel_word_analysis_service",
 ]
 
 
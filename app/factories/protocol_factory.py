@@ -15,12 +15,15 @@ def _create_deepseek_client(config: ProtocolConfig, dependencies: Optional[Dict[
     http_client = deps.get("http_client")
     base_url = deps.get("base_url", DeepSeekProtocolClient.DEFAULT_BASE_URL)
     timeout = deps.get("timeout", 300)
+    # Пул не меньше числа параллельных запросов, иначе части длинной расшифровки ждут соединения
+    pool_size = deps.get("pool_size", max(DeepSeekProtocolClient.DEFAULT_POOL_SIZE, config.max_parallel_requests))
 
     return DeepSeekProtocolClient(
         api_key=config.api_key,
         http_client=http_client,
         base_url=base_url,
         timeout=timeout,
+        pool_size=pool_size,
     )
 
 
@@ -46,4 +49,3 @@ def create_protocol_service(client: ILLMProtocolClient) -> ProtocolService:
     return ProtocolService(client=client)
 
 
-
@@ -1,16 +1,30 @@
 """Фабрики для анализа слов."""
 
+from functools import partial
 from typing import Dict, Optional
 
-import pymorphy3
-
+from app.adapters.output.morph_analyzer import LazyMorphAnalyzer, get_shared_morph_analyzer
+from app.application.services.parallel_word_analysis import ParallelWordAnalysisService
 from app.application.services.word_analysis import WordAnalysisService
 
 
 def create_word_analysis_service(
     dependencies: Optional[Dict[str, object]] = None,
+    tokenizer: Optional[str] = None,
 ) -> WordAnalysisService:
     deps = dependencies or {}
-    morph = deps.get("morph") or pymorphy3.MorphAnalyzer(lang="ru")
-    return WordAnalysisService(morph_analyzer=morph)
+    # Словари pymorphy3 загружаются только при первой лемматизации
+    morph = deps.get("morph") or LazyMorphAnalyzer(lang="ru")
+    return WordAnalysisService(morph_analyzer=morph, tokenizer=tokenizer)
+
 
+def create_parallel_word_analysis_service(
+    service: WordAnalysisService,
+    workers: int,
+) -> ParallelWordAnalysisService:
+    # Каждый процесс пула получает собственный MorphAnalyzer: анализатор не передаётся между процессами
+    return ParallelWordAnalysisService(
+        service=service,
+        morph_factory=partial(get_shared_morph_analyzer, "ru"),
+        workers=workers,
+    )
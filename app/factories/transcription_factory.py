@@ -1,13 +1,28 @@
 """Фабрики для создания компонентов транскрипции."""
 
+from functools import partial
 from typing import Tuple, Optional
 from app.application.ports import ITranscriptionEngine
 
 
+def is_faster_whisper_model(model: str) -> bool:
+    """Выбран ли движок faster-whisper (модель вида "faster:model_name")."""
+    return model.startswith('faster:')
+
+
+def resolve_model_name(model: str) -> str:
+    """Имя модели без префикса движка ("faster:small" -> "small")."""
+    if is_faster_whisper_model(model):
+        return model.split(':', 1)[1]
+    return model
+
+
 def _create_transcription_adapter_internal(model: str,
                                           whisper_module,
                                           faster_whisper_model_class,
-                                          compute_type: str = 'int8') -> Tuple[ITranscriptionEngine, str]:
+                                          compute_type: str = 'int8',
+                                          model_registry=None,
+                                          audio_cache=None) -> Tuple[ITranscriptionEngine, str]:
     """
     Внутренний метод для создания адаптера транскрипции.
     
@@ -18,19 +33,26 @@ def _create_transcription_adapter_internal(model: str,
         whisper_module: Модуль OpenAI Whisper
         faster_whisper_model_class: Класс WhisperModel из faster_whisper
         compute_type: Тип вычислений для faster-whisper ('int8', 'float16', 'float32')
+        model_registry: Реестр загруженных моделей (None - без кэширования моделей)
+        audio_cache: Кэш декодированного аудио (None - запись декодируется при каждом запуске)
     
     Returns:
         Tuple[ITranscriptionEngine, str]: Адаптер и имя модели (без префикса "faster:")
     """
-    use_faster = model.startswith('faster:')
+    use_faster = is_faster_whisper_model(model)
     
     if use_faster:
         # Извлекаем имя модели из "faster:model_name"
-        _, model_name = model.split(':', 1)
+        model_name = resolve_model_name(model)
         
         # Создаем адаптер для faster-whisper с compute_type в конструкторе
         from app.adapters.output.whisper import FasterWhisperAdapter
-        adapter = FasterWhisperAdapter(faster_whisper_model_class, compute_type=compute_type)
+        adapter = FasterWhisperAdapter(
+            faster_whisper_model_class,
+            compute_type=compute_type,
+            model_registry=model_registry,
+            audio_cache=audio_cache,
+        )
         
         return adapter, model_name
     else:
@@ -38,14 +60,15 @@ def _create_transcription_adapter_internal(model: str,
         
         # Создаем адаптер для OpenAI Whisper
         from app.adapters.output.whisper import WhisperAdapter
-        adapter = WhisperAdapter(whisper_module)
+        adapter = WhisperAdapter(whisper_module, model_registry=model_registry, audio_cache=audio_cache)
         
         return adapter, model_name
 
 
 def create_transcription_adapter(model: str,
                                  compute_type: str = 'int8',
-                                 dependencies: Optional[dict] = None) -> Tuple[ITranscriptionEngine, str]:
+                                 dependencies: Optional[dict] = None,
+                                 audio_cache=None) -> Tuple[ITranscriptionEngine, str]:
     """
     Фабричный метод для создания адаптера транскрипции.
     
@@ -58,6 +81,9 @@ def create_transcription_adapter(model: str,
         dependencies: Словарь зависимостей (если None, используется get_transcription_dependencies())
             - 'whisper_module': Модуль OpenAI Whisper
             - 'faster_whisper_model_class': Класс WhisperModel из faster_whisper
+            - 'model_registry': Реестр моделей (опционально; по умолчанию общий реестр процесса,
+              поэтому повторные транскрипции в одном процессе не загружают модель заново)
+        audio_cache: Кэш декодированного аудио (DecodedAudioCache, опционально)
     
     Returns:
         Tuple[ITranscriptionEngine, str]: Адаптер и имя модели (без префикса "faster:")
@@ -70,6 +96,8 @@ def create_transcription_adapter(model: str,
         deps = {'whisper_module': mock_whisper, 'faster_whisper_model_class': MockClass}
         adapter, model_name = create_transcription_adapter(model='small', dependencies=deps)
     """
+    from app.adapters.output.whisper import get_default_model_registry
+    
     if dependencies is None:
         from app.main import get_transcription_dependencies
         dependencies = get_transcription_dependencies()
@@ -78,20 +106,79 @@ def create_transcription_adapter(model: str,
         model=model,
         whisper_module=dependencies['whisper_module'],
         faster_whisper_model_class=dependencies['faster_whisper_model_class'],
-        compute_type=compute_type
+        compute_type=compute_type,
+        model_registry=dependencies.get('model_registry') or get_default_model_registry(),
+        audio_cache=audio_cache,
     )
 
 
-def create_transcription_service(engine: ITranscriptionEngine):
+def create_transcription_service(engine: ITranscriptionEngine, audio_source=None):
     """
     Фабричный метод для создания TranscriptionService.
     
     Args:
         engine: Адаптер движка транскрипции
+        audio_source: Источник аудио для потокового режима
+                      (по умолчанию FFmpegAudioSource)
     
     Returns:
         TranscriptionService: Сервис транскрипции
     """
     from app.application.services import TranscriptionService
-    return TranscriptionService(engine=engine)
+    from app.adapters.output.audio import FFmpegAudioSource
+    return TranscriptionService(engine=engine, audio_source=audio_source or FFmpegAudioSource())
+
+
+
+def create_parallel_transcription_service(model: str,
+                                          compute_type: str = 'int8',
+                                          workers: int = 2,
+                                          dependencies: Optional[dict] = None):
+    """
+    Фабричный метод для создания ParallelTranscriptionService.
+    
+    Движок создаётся заново в каждом процессе-воркере, поэтому сервису
+    передаётся сериализуемая фабрика, а не готовый адаптер.
+    
+    Args:
+        model: Название модели или "faster:model_name" для faster-whisper
+        compute_type: Тип вычислений для faster-whisper ('int8', 'float16', 'float32')
+        workers: Количество процессов-воркеров
+        dependencies: Словарь зависимостей для create_transcription_adapter
+            (должен быть сериализуемым; по умолчанию зависимости импортируются в воркере)
+    
+    Returns:
+        ParallelTranscriptionService: Сервис параллельной транскрипции
+    """
+    from app.application.services import ParallelTranscriptionService
+    engine_factory = partial(
+        create_transcription_adapter,
+        model,
+        compute_type=compute_type,
+        dependencies=dependencies,
+    )
+    return ParallelTranscriptionService(engine_factory=engine_factory, workers=workers)
+
 
+def create_batch_transcription_service(transcription_service,
+                                       writer_factory,
+                                       concurrency: int = 1):
+    """
+    Фабричный метод для создания BatchTranscriptionService.
+    
+    Args:
+        transcription_service: Сервис транскрипции, через который идут все файлы пакета
+        writer_factory: Фабрика writer'а по пути выходного файла
+        concurrency: Максимальное количество файлов, обрабатываемых одновременно
+    
+    Returns:
+        BatchTranscriptionService: Сервис пакетной транскрипции
+    """
+    from app.application.services import BatchTranscriptionService
+    from app.utils.audio import probe_duration
+    return BatchTranscriptionService(
+        transcription_service=transcription_service,
+        writer_factory=writer_factory,
+        concurrency=concurrency,
+        duration_probe=probe_duration,
+    )
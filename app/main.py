@@ -38,12 +38,12 @@ def create_app():
         dict: Словарь с инициализированными компонентами приложения
               (адаптеры, сервисы и т.д.)
     """
-    import pymorphy3  # type: ignore[import]
     from app.adapters.input.cli import (
         ScribeCommandHandler,
         ProtocolCommandHandler,
         TagCommandHandler,
     )
+    from app.adapters.output.morph_analyzer import LazyMorphAnalyzer
     from app.factories import (
         create_transcription_adapter,
         create_transcription_service,
@@ -52,7 +52,8 @@ def create_app():
         create_word_analysis_service,
     )
 
-    morph_analyzer = pymorphy3.MorphAnalyzer(lang="ru")
+    # Анализатор общий для всех сервисов; словари загружаются при первой лемматизации
+    morph_analyzer = LazyMorphAnalyzer(lang="ru")
 
     handlers = {
         "scribe": ScribeCommandHandler(),
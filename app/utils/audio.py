@@ -0,0 +1,139 @@
+"""Утилиты для работы с аудио через ffmpeg."""
+
+import re
+import subprocess
+from typing import Any, List, Optional, Tuple
+
+# Частота дискретизации, с которой работают модели Whisper
+SAMPLE_RATE = 16000
+
+# Параметры поиска тишины по умолчанию (фильтр ffmpeg silencedetect)
+DEFAULT_SILENCE_NOISE_DB = -30.0
+DEFAULT_MIN_SILENCE_DURATION = 0.5
+
+_DURATION_PATTERN = re.compile(r'Duration:\s*(\d+):(\d{2}):(\d{2}(?:\.\d+)?)')
+_SILENCE_START_PATTERN = re.compile(r'silence_start:\s*(-?\d+(?:\.\d+)?)')
+_SILENCE_END_PATTERN = re.compile(r'silence_end:\s*(-?\d+(?:\.\d+)?)')
+
+
+def parse_silencedetect_output(output: str) -> Tuple[float, List[Tuple[float, float]]]:
+    """Разбирает вывод ffmpeg с фильтром silencedetect.
+
+    Args:
+        output: Текст stderr ffmpeg
+
+    Returns:
+        Кортеж (длительность записи в секундах, список интервалов тишины (start, end)).
+        Если длительность не найдена, возвращается 0.0.
+    """
+    duration = 0.0
+    duration_match = _DURATION_PATTERN.search(output)
+    if duration_match:
+        hours, minutes, seconds = duration_match.groups()
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    silences: List[Tuple[float, float]] = []
+    silence_start: Optional[float] = None
+    for line in output.splitlines():
+        start_match = _SILENCE_START_PATTERN.search(line)
+        if start_match:
+            silence_start = max(0.0, float(start_match.group(1)))
+            continue
+        end_match = _SILENCE_END_PATTERN.search(line)
+        if end_match and silence_start is not None:
+            silences.append((silence_start, float(end_match.group(1))))
+            silence_start = None
+
+    # Тишина, которая тянется до конца записи, не получает silence_end
+    if silence_start is not None and duration > silence_start:
+        silences.append((silence_start, duration))
+
+    return duration, silences
+
+
+def detect_silences(audio_path: str,
+                    noise_db: float = DEFAULT_SILENCE_NOISE_DB,
+                    min_silence: float = DEFAULT_MIN_SILENCE_DURATION) -> Tuple[float, List[Tuple[float, float]]]:
+    """Находит участки тишины в аудиофайле с помощью ffmpeg.
+
+    Файл обрабатывается потоково внутри ffmpeg, поэтому память не зависит
+    от длительности записи.
+
+    Args:
+        audio_path: Путь к аудио/видеофайлу
+        noise_db: Порог тишины в децибелах
+        min_silence: Минимальная длительность тишины в секундах
+
+    Returns:
+        Кортеж (длительность записи в секундах, список интервалов тишины (start, end))
+
+    Raises:
+        RuntimeError: Если ffmpeg завершился с ошибкой
+    """
+    command = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-nostats",
+        "-i", audio_path,
+        "-vn",
+        "-af", f"silencedetect=noise={noise_db}dB:d={min_silence}",
+        "-f", "null", "-",
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, errors="replace")
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg не смог обработать файл {audio_path}: {result.stderr.strip()[-500:]}"
+        )
+    return parse_silencedetect_output(result.stderr)
+
+
+def decode_audio(audio_path: str,
+                 start: float = 0.0,
+                 duration: Optional[float] = None,
+                 sample_rate: int = SAMPLE_RATE) -> Any:
+    """Декодирует участок аудиофайла в моно float32 массив (как whisper.load_audio).
+
+    Args:
+        audio_path: Путь к аудио/видеофайлу
+        start: Начало участка в секундах
+        duration: Длительность участка в секундах (None - до конца файла)
+        sample_rate: Частота дискретизации результата
+
+    Returns:
+        numpy.ndarray: Отсчёты в диапазоне [-1.0, 1.0]
+
+    Raises:
+        RuntimeError: Если ffmpeg завершился с ошибкой
+    """
+    import numpy as np  # type: ignore[import]
+
+    command = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error"]
+    if start > 0:
+        command += ["-ss", f"{start:.3f}"]
+    command += ["-i", audio_path]
+    if duration is not None:
+        command += ["-t", f"{duration:.3f}"]
+    command += ["-vn", "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate), "-"]
+
+    result = subprocess.run(command, capture_output=True)
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"ffmpeg не смог декодировать файл {audio_path}: {stderr[-500:]}")
+
+    return np.frombuffer(result.stdout, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def probe_duration(audio_path: str) -> float:
+    """Возвращает длительность записи в секундах по заголовку файла.
+
+    Файл не декодируется: ffmpeg читает только метаданные контейнера.
+
+    Args:
+        audio_path: Путь к аудио/видеофайлу
+
+    Returns:
+        Длительность в секундах или 0.0, если её не удалось определить
+    """
+    command = ["ffmpeg", "-nostdin", "-hide_banner", "-i", audio_path]
+    # Без выходного файла ffmpeg завершается с ошибкой, но успевает вывести заголовок
+    result = subprocess.run(command, capture_output=True, text=True, errors="replace")
+    duration, _ = parse_silencedetect_output(result.stderr)
+    return duration
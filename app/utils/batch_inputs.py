@@ -0,0 +1,125 @@
+"""Утилиты для сбора входных файлов пакетной обработки."""
+
+import glob
+import os
+from typing import Iterable, List, Optional, Tuple
+
+# Расширения аудио/видеофайлов, которые понимает ffmpeg и имеет смысл транскрибировать
+AUDIO_EXTENSIONS = {
+    '.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg', '.opus', '.wma',
+    '.mp4', '.mkv', '.webm', '.mov', '.avi',
+}
+
+# Расширения текстовых расшифровок (вход команды tag)
+TRANSCRIPT_EXTENSIONS = {'.txt'}
+
+
+def collect_directory(directory: str, extensions: Iterable[str] = AUDIO_EXTENSIONS) -> List[str]:
+    """Возвращает отсортированный список файлов каталога с подходящими расширениями.
+
+    Args:
+        directory: Путь к каталогу (подкаталоги не обходятся)
+        extensions: Допустимые расширения (в нижнем регистре, с точкой)
+
+    Returns:
+        Пути к файлам в алфавитном порядке
+
+    Raises:
+        FileNotFoundError: Если каталог не существует
+    """
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"Каталог не найден: {directory}")
+    allowed = {extension.lower() for extension in extensions}
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if os.path.isfile(os.path.join(directory, name))
+        and os.path.splitext(name)[1].lower() in allowed
+    )
+
+
+def expand_input_patterns(patterns: Iterable[str]) -> List[str]:
+    """Раскрывает glob-шаблоны входных файлов (в том числе '**').
+
+    Пути без метасимволов возвращаются как есть, совпадения шаблона -
+    в алфавитном порядке (каталоги пропускаются).
+
+    Args:
+        patterns: Пути к файлам и/или glob-шаблоны
+
+    Returns:
+        Пути к файлам в порядке шаблонов
+
+    Raises:
+        FileNotFoundError: Если шаблону не соответствует ни одного файла
+    """
+    paths: List[str] = []
+    for pattern in patterns:
+        if not glob.has_magic(pattern):
+            paths.append(pattern)
+            continue
+        matches = sorted(
+            path for path in glob.glob(os.path.expanduser(pattern), recursive=True)
+            if os.path.isfile(path)
+        )
+        if not matches:
+            raise FileNotFoundError(f"По шаблону не найдено ни одного файла: {pattern}")
+        paths.extend(matches)
+    return paths
+
+
+def read_manifest(manifest_path: str) -> List[Tuple[str, Optional[str]]]:
+    """Читает манифест пакетной обработки.
+
+    Формат: одна запись на строку, вход и (опционально) выход через табуляцию.
+    Пустые строки и строки, начинающиеся с '#', пропускаются. Относительные
+    пути считаются от каталога манифеста.
+
+    Args:
+        manifest_path: Путь к файлу манифеста
+
+    Returns:
+        Список пар (входной путь, выходной путь или None)
+
+    Raises:
+        FileNotFoundError: Если манифест не найден
+        ValueError: Если строка манифеста некорректна
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    def _resolve(path: str) -> str:
+        path = os.path.expanduser(path.strip())
+        return path if os.path.isabs(path) else os.path.join(base_dir, path)
+
+    entries: List[Tuple[str, Optional[str]]] = []
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            parts = [part for part in stripped.split("\t") if part.strip()]
+            if len(parts) > 2:
+                raise ValueError(
+                    f"Некорректная строка {line_number} в манифесте {manifest_path}: "
+                    "ожидается 'вход<TAB>выход'"
+                )
+            input_path = _resolve(parts[0])
+            output_path = _resolve(parts[1]) if len(parts) == 2 else None
+            entries.append((input_path, output_path))
+    return entries
+
+
+def derive_output_path(input_path: str, output_dir: Optional[str], suffix: str = ".txt") -> str:
+    """Строит путь результата: имя входного файла с новым расширением в output_dir.
+
+    Args:
+        input_path: Путь к входному файлу
+        output_dir: Каталог для результатов (None - рядом с входным файлом)
+        suffix: Расширение результата
+
+    Returns:
+        Путь к выходному файлу
+    """
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    directory = output_dir if output_dir is not None else os.path.dirname(input_path)
+    return os.path.join(directory, stem + suffix)
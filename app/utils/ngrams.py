@@ -0,0 +1,88 @@
+"""Подсчёт n-грамм потока слов скользящим окном."""
+
+from collections import Counter, deque
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+
+from app.domain.models.word_analysis import DEFAULT_MAX_NGRAMS, DEFAULT_NGRAM_MIN_COUNT
+
+
+class NgramCounter:
+    """Счётчик n-грамм заданных длин по потоку слов.
+
+    Слова подаются по одному (add) в окно длиной max(sizes); каждое новое
+    слово завершает не больше len(sizes) n-грамм, которые сразу учитываются
+    в счётчике - списки n-грамм не строятся. Разрыв (reset) очищает окно:
+    n-граммы не переходят через отфильтрованные слова и границы строк.
+
+    Память ограничена max_entries: при переполнении из счётчика удаляются
+    n-граммы с частотой ниже порога (сначала min_count, при необходимости
+    выше). После такой обрезки частоты редких n-грамм могут быть занижены,
+    что отражает свойство pruned.
+    """
+
+    def __init__(self,
+                 sizes: Iterable[int],
+                 min_count: int = DEFAULT_NGRAM_MIN_COUNT,
+                 max_entries: Optional[int] = DEFAULT_MAX_NGRAMS):
+        """
+        Args:
+            sizes: Длины n-грамм (не меньше 2)
+            min_count: Минимальная частота n-граммы в результате
+            max_entries: Максимальное количество n-грамм в памяти (None - без ограничения)
+        """
+        self._sizes: Tuple[int, ...] = tuple(sorted(set(sizes)))
+        if not self._sizes or self._sizes[0] < 2:
+            raise ValueError("Длина n-граммы должна быть не меньше 2")
+        if min_count < 1:
+            raise ValueError("Минимальная частота n-граммы должна быть не меньше 1")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Лимит n-грамм должен быть не меньше 1")
+        self._min_count = min_count
+        self._max_entries = max_entries
+        self._window: deque = deque(maxlen=self._sizes[-1])
+        self._counts: Counter = Counter()
+        self._pruned = False
+
+    @property
+    def sizes(self) -> Tuple[int, ...]:
+        return self._sizes
+
+    @property
+    def pruned(self) -> bool:
+        """Обрезался ли счётчик по памяти (частоты редких n-грамм могут быть занижены)."""
+        return self._pruned
+
+    def add(self, word: str) -> None:
+        """Добавляет слово в окно и учитывает завершённые им n-граммы."""
+        window = self._window
+        window.append(word)
+        length = len(window)
+        for size in self._sizes:
+            if size > length:
+                break
+            self._counts[" ".join(islice(window, length - size, None))] += 1
+        if self._max_entries is not None and len(self._counts) > self._max_entries:
+            self._prune()
+
+    def reset(self) -> None:
+        """Разрывает последовательность: следующая n-грамма начнётся с нового слова."""
+        self._window.clear()
+
+    def _prune(self) -> None:
+        # Освобождаем не меньше половины лимита, чтобы обрезка не повторялась на каждом слове
+        self._pruned = True
+        threshold = self._min_count
+        target = self._max_entries // 2
+        while len(self._counts) > target:
+            for ngram in [ngram for ngram, count in self._counts.items() if count < threshold]:
+                del self._counts[ngram]
+            threshold += 1
+
+    def most_common(self, limit: int) -> List[Tuple[str, int]]:
+        """Возвращает limit самых частых n-грамм с частотой не ниже min_count."""
+        frequent = Counter({ngram: count for ngram, count in self._counts.items() if count >= self._min_count})
+        return frequent.most_common(limit)
+
+    def __len__(self) -> int:
+        return len(self._counts)
@@ -0,0 +1,101 @@
+"""Приблизительный подсчёт частых элементов потока (алгоритм Space-Saving)."""
+
+import heapq
+import itertools
+from typing import Dict, Hashable, List, Tuple
+
+
+class SpaceSavingCounter:
+    """Счётчик частых элементов с фиксированным числом счётчиков.
+
+    Хранит не больше capacity элементов. Когда таблица заполнена, новый
+    элемент вытесняет элемент с наименьшим счётчиком и наследует его
+    значение (+1). Оценка частоты никогда не занижена и завышена не больше
+    чем на total / capacity; любой элемент с частотой выше этой величины
+    гарантированно присутствует в таблице.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Максимальное количество отслеживаемых элементов
+        """
+        if capacity < 1:
+            raise ValueError("Количество счётчиков должно быть не меньше 1")
+        self._capacity = capacity
+        # элемент -> [оценка частоты, порядковый номер вставки]
+        self._counters: Dict[Hashable, List[int]] = {}
+        # Минимальная куча (частота, номер, элемент). Частота в куче может отставать
+        # от актуальной: устаревшая запись обновляется при извлечении минимума,
+        # поэтому в куче ровно одна запись на элемент и память не растёт
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._total = 0
+        self._evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """Количество учтённых элементов потока."""
+        return self._total
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Учитывает count вхождений элемента."""
+        self._total += count
+        counter = self._counters.get(item)
+        if counter is not None:
+            counter[0] += count
+            return
+
+        error = 0
+        if len(self._counters) >= self._capacity:
+            error = self._pop_min()
+        sequence = next(self._sequence)
+        self._counters[item] = [error + count, sequence]
+        heapq.heappush(self._heap, (error + count, sequence, item))
+
+    def _min_entry(self) -> Tuple[int, int, Hashable]:
+        """Возвращает актуальную запись кучи с наименьшей оценкой."""
+        while True:
+            estimate, sequence, item = self._heap[0]
+            actual = self._counters[item][0]
+            if actual == estimate:
+                return estimate, sequence, item
+            heapq.heapreplace(self._heap, (actual, sequence, item))
+
+    def _pop_min(self) -> int:
+        """Вытесняет элемент с наименьшей оценкой и возвращает эту оценку."""
+        estimate, _, item = self._min_entry()
+        heapq.heappop(self._heap)
+        del self._counters[item]
+        self._evictions += 1
+        return estimate
+
+    @property
+    def error_bound(self) -> int:
+        """Максимальная погрешность оценок (0, пока ни один элемент не вытеснен).
+
+        Ни одна оценка не завышена больше чем на эту величину, и ни один
+        отсутствующий в таблице элемент не встречался чаще.
+        """
+        if not self._evictions:
+            return 0
+        return self._min_entry()[0]
+
+    def most_common(self, limit: int) -> List[Tuple[Hashable, int]]:
+        """Возвращает limit элементов с наибольшей оценкой частоты.
+
+        Равные оценки упорядочены по времени попадания элемента в таблицу.
+        """
+        ranked = heapq.nsmallest(
+            limit,
+            self._counters.items(),
+            key=lambda entry: (-entry[1][0], entry[1][1]),
+        )
+        return [(item, counter[0]) for item, counter in ranked]
+
+    def __len__(self) -> int:
+        return len(self._counters)
@@ -1,6 +1,9 @@
 """Утилиты для анализа текста транскрипций."""
 
+import codecs
 import re
+from collections import Counter
+from typing import Dict, List, Optional
 
 # Регулярные выражения для извлечения слов и таймкодов
 WORD_PATTERN = re.compile(r'\b[а-яА-ЯёЁa-zA-Z]{3,}\b', re.UNICODE)
@@ -9,6 +12,117 @@ TIMESTAMP_PATTERN = re.compile(r'^\[\d{1,3}\.\d{2}\s*-\s*\d{1,3}\.\d{2}\]')
 # Части речи, которые считаем шумом (для исключения при лемматизации)
 POS_TO_EXCLUDE = {'NPRO', 'ADVB', 'PRCL', 'CONJ', 'PREP', 'INTJ'}
 
+# Буквы, из которых состоят слова WORD_PATTERN
+WORD_LETTERS = frozenset(
+    [chr(code) for code in range(ord('а'), ord('я') + 1)]
+    + [chr(code) for code in range(ord('А'), ord('Я') + 1)]
+    + ['ё', 'Ё']
+    + [chr(code) for code in range(ord('a'), ord('z') + 1)]
+    + [chr(code) for code in range(ord('A'), ord('Z') + 1)]
+)
+MIN_WORD_LENGTH = 3
 
 
+class RegexTokenizer:
+    """Извлечение слов регулярным выражением WORD_PATTERN."""
 
+    name = "regex"
+
+    def tokenize(self, text: str) -> List[str]:
+        return WORD_PATTERN.findall(text)
+
+    def count(self, text: str, counts: Counter) -> None:
+        counts.update(WORD_PATTERN.findall(text))
+
+
+# Однобайтовая кодировка, в которой есть вся кириллица и латиница WORD_PATTERN
+_SCAN_ENCODING = "cp1251"
+_SCAN_ERRORS = "mina-word-scan"
+# Символ, помечающий «чужой» символ слова (цифра, '_', буква вне WORD_LETTERS)
+_FOREIGN_MARK = "#"
+
+
+def _classify(char: str) -> str:
+    """Во что превращается символ перед разбиением: буква слова, метка или пробел."""
+    if char in WORD_LETTERS:
+        return char
+    # \w в re: буквы и цифры любых алфавитов и подчёркивание
+    if char.isalnum() or char == "_":
+        return _FOREIGN_MARK
+    return " "
+
+
+def _scan_error_handler(error: UnicodeEncodeError):
+    """Заменяет символы вне cp1251 (буквами слов они быть не могут).
+
+    Замена проходит через ту же таблицу перевода, поэтому символ слова
+    заменяется цифрой (она переводится в метку), а остальные - пробелом.
+    """
+    chunk = error.object[error.start:error.end]
+    return "".join("0" if _classify(char) == _FOREIGN_MARK else " " for char in chunk), error.end
+
+
+codecs.register_error(_SCAN_ERRORS, _scan_error_handler)
+
+
+def _build_scan_table() -> bytes:
+    table = bytearray()
+    for byte in range(256):
+        char = bytes([byte]).decode(_SCAN_ENCODING, errors="replace")
+        table += _classify(char).encode(_SCAN_ENCODING)
+    return bytes(table)
+
+
+class TranslateTokenizer:
+    """Извлечение слов через bytes.translate и str.split.
+
+    Текст кодируется в cp1251 (символы вне кодировки заменяются обработчиком
+    ошибок) и одной таблицей переводится так, что буквы слов остаются,
+    прочие символы слова (\\w) становятся меткой '#', остальное - пробелом.
+    Слова WORD_PATTERN - это ровно части после split() длиной от 3 символов
+    без метки: граница \\b совпадает с границей между \\w и не-\\w.
+    Кодирование, перевод и разбиение выполняются в C. Выигрыш у регулярного
+    выражения нестабилен (см. benchmarks/tokenizer_benchmark.py), поэтому
+    токенизатор включается явно (tag --tokenizer translate).
+    """
+
+    name = "translate"
+
+    def __init__(self) -> None:
+        self._table = _build_scan_table()
+
+    def _scan(self, text: str) -> str:
+        return text.encode(_SCAN_ENCODING, _SCAN_ERRORS).translate(self._table).decode(_SCAN_ENCODING)
+
+    def tokenize(self, text: str) -> List[str]:
+        return [
+            token for token in self._scan(text).split()
+            if len(token) >= MIN_WORD_LENGTH and _FOREIGN_MARK not in token
+        ]
+
+    def count(self, text: str, counts: Counter) -> None:
+        # Считаем все части и отбрасываем лишние ключи: фильтр проходит по словарю, а не по потоку
+        chunk_counts = Counter(self._scan(text).split())
+        for token in [token for token in chunk_counts
+                      if len(token) < MIN_WORD_LENGTH or _FOREIGN_MARK in token]:
+            del chunk_counts[token]
+        counts.update(chunk_counts)
+
+
+TOKENIZERS: Dict[str, object] = {
+    RegexTokenizer.name: RegexTokenizer(),
+    TranslateTokenizer.name: TranslateTokenizer(),
+}
+DEFAULT_TOKENIZER = RegexTokenizer.name
+
+
+def get_tokenizer(name: Optional[str] = None):
+    """Возвращает токенизатор по имени (по умолчанию DEFAULT_TOKENIZER).
+
+    Все токенизаторы возвращают одинаковые слова в одинаковом порядке.
+    """
+    name = name or DEFAULT_TOKENIZER
+    try:
+        return TOKENIZERS[name]
+    except KeyError:
+        raise ValueError(f"Неизвестный токенизатор: {name} (доступны: {', '.join(sorted(TOKENIZERS))})")
@@ -0,0 +1,84 @@
+"""Микробенчмарк токенизаторов tag (app.utils.text_analysis.TOKENIZERS).
+
+Проверяет, что все токенизаторы выдают одинаковые слова, и сравнивает
+время извлечения и подсчёта слов на синтетической расшифровке или на
+указанном файле.
+
+Запуск:
+    python benchmarks/tokenizer_benchmark.py [--input transcript.txt] [--lines 20000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.application.services.word_analysis import WordAnalysisService  # noqa: E402
+from app.utils.text_analysis import TOKENIZERS  # noqa: E402
+
+_LETTERS = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+_EXTRA_TOKENS = ["и", "в", "на", "ok", "python3", "mp3", "12:30", "—", "«да»", "api", "café"]
+
+
+def synthetic_transcript(lines: int, seed: int = 1):
+    """Строки в формате стенограммы scribe с кириллическим словарём по закону Ципфа."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice(_LETTERS) for _ in range(rng.randint(2, 11))) for _ in range(5000)
+    ] + _EXTRA_TOKENS
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    transcript = []
+    for index in range(lines):
+        start = index * 4.0
+        words = rng.choices(vocabulary, weights=weights, k=rng.randint(5, 25))
+        transcript.append(f"[{start / 60:05.2f} - {(start + 4) / 60:05.2f}] " + " ".join(words).capitalize() + ".")
+    return transcript
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="Файл расшифровки (по умолчанию - синтетическая)")
+    parser.add_argument("--lines", type=int, default=20000, help="Строк синтетической расшифровки")
+    parser.add_argument("--repeat", type=int, default=5, help="Повторов замера")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    else:
+        lines = synthetic_transcript(args.lines)
+    text = "\n".join(WordAnalysisService.iter_text_lines(lines))
+    print(f"Текст: {len(lines)} строк, {len(text) / 1024 ** 2:.1f} МБ")
+
+    reference = None
+    for name, tokenizer in TOKENIZERS.items():
+        tokens = tokenizer.tokenize(text)
+        counts = WordAnalysisService.count_words_in_lines(lines, tokenizer)
+        if reference is None:
+            reference = (tokens, list(counts.items()))
+        elif (tokens, list(counts.items())) != reference:
+            raise SystemExit(f"Токенизатор {name} выдаёт другие слова")
+    print(f"Слов: {len(reference[0])}, различных: {len(reference[1])}; результаты совпадают")
+
+    timings = {}
+    for name, tokenizer in TOKENIZERS.items():
+        tokenize = min(timeit.repeat(lambda: tokenizer.tokenize(text), number=1, repeat=args.repeat))
+        count = min(timeit.repeat(lambda: tokenizer.count(text, Counter()), number=1, repeat=args.repeat))
+        pipeline = min(timeit.repeat(
+            lambda: WordAnalysisService.count_words_in_lines(lines, tokenizer), number=1, repeat=args.repeat
+        ))
+        timings[name] = (tokenize, count, pipeline)
+
+    baseline = timings["regex"]
+    print(f"{'токенизатор':<12}{'tokenize, мс':>14}{'count, мс':>14}{'по строкам, мс':>18}")
+    for name, values in timings.items():
+        cells = [f"{value * 1000:.1f} (x{base / value:.2f})" for value, base in zip(values, baseline)]
+        print(f"{name:<12}{cells[0]:>14}{cells[1]:>14}{cells[2]:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,16 @@ import click
 from app.adapters.input.cli import (
     ScribeCommandHandler,
     ScribeCommandOptions,
+    ScribeBatchCommandHandler,
+    ScribeBatchCommandOptions,
     ProtocolCommandHandler,
     ProtocolCommandOptions,
     TagCommandHandler,
     TagCommandOptions,
 )
 from app.domain.exceptions import ProtocolClientError
+from app.factories import is_faster_whisper_model
+from app.utils.text_analysis import DEFAULT_TOKENIZER, TOKENIZERS
 
 
 @click.group()
@@ -17,16 +21,64 @@ def cli():
 
 
 @cli.command()
-@click.option('--input', '-i', required=True, type=click.Path(exists=True), help='Путь к аудиофайлу')
-@click.option('--output', '-o', required=True, type=click.Path(), help='Путь к выходному текстовому файлу')
+@click.option('--input', '-i', required=False, type=click.Path(exists=True), help='Путь к аудиофайлу')
+@click.option('--output', '-o', required=False, type=click.Path(), help='Путь к выходному текстовому файлу')
+@click.option('--input-dir', required=False, type=click.Path(exists=True, file_okay=False),
+              help='Пакетный режим: каталог с аудио/видеофайлами')
+@click.option('--manifest', required=False, type=click.Path(exists=True, dir_okay=False),
+              help='Пакетный режим: файл со списком "вход<TAB>выход" (по одной записи на строку)')
+@click.option('--output-dir', required=False, type=click.Path(file_okay=False),
+              help='Пакетный режим: каталог для стенограмм (по умолчанию рядом с исходными файлами)')
+@click.option('--concurrency', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Пакетный режим: сколько файлов обрабатывать одновременно')
+@click.option('--report', required=False, type=click.Path(dir_okay=False),
+              help='Пакетный режим: путь к JSON-отчёту (по умолчанию scribe-report.json в каталоге результатов)')
 @click.option('--model', '-m', default='small', show_default=True, 
               help='Название модели: tiny, base, small, medium, large. Для faster-whisper используйте формат "faster:model" (например, "faster:base")')
 @click.option('--language', '--lang', default='ru', show_default=True, 
               help='Язык транскрипции (код ISO 639-1, например: ru, en, es, de)')
 @click.option('--compute-type', default='int8', show_default=True, 
               help='Тип вычислений для faster-whisper (int8, float16, float32)')
-def scribe(input, output, model, language, compute_type):
+@click.option('--workers', '-w', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Количество процессов: при N > 1 запись режется по паузам на фрагменты, которые транскрибируются параллельно')
+@click.option('--resume', is_flag=True, default=False,
+              help='Продолжить прерванную транскрипцию с последней контрольной точки, дописывая выходной файл')
+@click.option('--stream-window', required=False, type=click.FloatRange(min=0, min_open=True), metavar='SECONDS',
+              help='Потоковое декодирование: подавать запись движку окнами указанной длины (память не зависит от длины записи)')
+@click.option('--audio-cache', 'audio_cache', required=False, type=click.Path(file_okay=False),
+              help='Каталог кэша декодированного аудио: повторный запуск на том же файле не декодирует его заново')
+@click.option('--audio-cache-size', required=False, type=click.IntRange(min=1), metavar='MB',
+              help='Максимальный размер кэша декодированного аудио в мегабайтах (по умолчанию 5120)')
+@click.option('--flush-every', required=False, type=click.IntRange(min=1), metavar='N',
+              help='Сбрасывать буфер стенограммы раз в N сегментов (по умолчанию - после каждого сегмента)')
+@click.option('--flush-interval', required=False, type=click.FloatRange(min=0, min_open=True), metavar='SECONDS',
+              help='Сбрасывать буфер стенограммы не реже, чем раз в указанное число секунд')
+@click.option('--write-queue', required=False, type=click.IntRange(min=1), metavar='N',
+              help='Записывать стенограмму в фоновом потоке через очередь на N сегментов')
+def scribe(input, output, input_dir, manifest, output_dir, concurrency, report, model, language, compute_type, workers,
+           resume, stream_window, audio_cache, audio_cache_size, flush_every, flush_interval, write_queue):
     """Распознавание речи с таймингами с помощью OpenAI Whisper или faster-whisper."""
+    sources = [value for value in (input, input_dir, manifest) if value]
+    if len(sources) != 1:
+        raise click.UsageError("Укажите ровно один источник: --input, --input-dir или --manifest")
+
+    if input_dir or manifest:
+        if concurrency > 1 and workers == 1 and not is_faster_whisper_model(model):
+            raise click.UsageError(
+                "--concurrency > 1 поддерживается только для faster-whisper (-m faster:...) или с --workers > 1"
+            )
+        _scribe_batch(input_dir, manifest, output_dir, concurrency, report, model, language, compute_type, workers)
+        return
+
+    if not output:
+        raise click.UsageError("Для --input необходимо указать --output")
+    if resume and workers > 1:
+        raise click.UsageError("--resume нельзя использовать вместе с --workers > 1")
+    if stream_window and workers > 1:
+        raise click.UsageError("--stream-window нельзя использовать вместе с --workers > 1")
+    if audio_cache and workers > 1:
+        raise click.UsageError("--audio-cache нельзя использовать вместе с --workers > 1")
+
     handler = ScribeCommandHandler()
     options = ScribeCommandOptions(
         input_path=input,
@@ -35,31 +87,123 @@ def scribe(input, output, model, language, compute_type):
         language=language,
         compute_type=compute_type,
         verbose=True,
+        workers=workers,
+        resume=resume,
+        stream_window=stream_window,
+        audio_cache_dir=audio_cache,
+        audio_cache_size=audio_cache_size * 1024 * 1024 if audio_cache_size else None,
+        flush_every=flush_every,
+        flush_interval=flush_interval,
+        write_queue=write_queue,
     )
     try:
         handler.execute(options)
         click.echo(f"Готово! Стенограмма сохранена в: {output}")
-    except RuntimeError as e:
+    except (RuntimeError, ValueError) as e:
+        raise click.ClickException(str(e))
+
+
+def _scribe_batch(input_dir, manifest, output_dir, concurrency, report, model, language, compute_type, workers):
+    """Пакетная транскрипция каталога или манифеста одним загруженным движком."""
+    handler = ScribeBatchCommandHandler()
+    options = ScribeBatchCommandOptions(
+        input_dir=input_dir,
+        manifest_path=manifest,
+        output_dir=output_dir,
+        report_path=report,
+        model=model,
+        language=language,
+        compute_type=compute_type,
+        concurrency=concurrency,
+        workers=workers,
+        verbose=True,
+    )
+    try:
+        batch_report = handler.execute(options)
+    except (RuntimeError, ValueError, FileNotFoundError) as e:
         raise click.ClickException(str(e))
 
+    click.echo(batch_report.to_text())
+    if batch_report.failed:
+        raise click.ClickException(f"Не удалось обработать файлов: {len(batch_report.failed)}")
+    click.echo("Готово! Пакетная транскрипция завершена.")
+
+
+def _parse_ngram_sizes(value):
+    """Разбирает список длин n-грамм вида "2,3"."""
+    try:
+        sizes = tuple(sorted({int(part) for part in value.split(',') if part.strip()}))
+    except ValueError:
+        raise click.UsageError(f"--ngrams: ожидается список чисел через запятую, получено {value!r}")
+    if not sizes or sizes[0] < 2:
+        raise click.UsageError("--ngrams: длина словосочетания должна быть не меньше 2")
+    return sizes
+
 
 @cli.command()
-@click.option('--input', '-i', required=True, help='Путь к файлу с расшифровкой.')
+@click.option('--input', '-i', 'inputs', multiple=True,
+              help='Путь к файлу с расшифровкой или glob-шаблон (можно указать несколько раз).')
+@click.option('--input-dir', required=False, type=click.Path(exists=True, file_okay=False),
+              help='Каталог с расшифровками (*.txt).')
+@click.option('--manifest', required=False, type=click.Path(exists=True, dir_okay=False),
+              help='Файл со списком расшифровок (по одной на строку).')
 @click.option('--output', '-o', required=False, help='Путь к выходному файлу (опционально).')
 @click.option('--limit', '-l', default=50, show_default=True, help='Сколько слов вывести в итоговой статистике.')
 @click.option('--lemmatize', is_flag=True, default=False, help='Включить лемматизацию (требуется pymorphy3).')
 @click.option('--stopwords', required=False, type=click.Path(), help='Путь к файлу со стоп-словами (по одному слову на строку).')
 @click.option('--no-names', is_flag=True, default=False, help='Исключать имена собственные (Name-граммема).')
-def tag(input, output, limit, lemmatize, stopwords, no_names):
+@click.option('--lemma-cache', required=False, type=click.Path(dir_okay=False),
+              help='Файл кэша лемматизации: разборы словоформ сохраняются между запусками --lemmatize.')
+@click.option('--workers', '-w', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Количество процессов для подсчёта и лемматизации (1 - без параллелизма).')
+@click.option('--per-file', is_flag=True, default=False,
+              help='Кроме сводного списка вывести частотный список для каждого файла.')
+@click.option('--index', 'index_path', required=False, type=click.Path(dir_okay=False),
+              help='Файл индекса частот (SQLite): уже проиндексированные расшифровки не пересчитываются.')
+@click.option('--approximate', is_flag=True, default=False,
+              help='Приблизительный подсчёт (Space-Saving) с фиксированным объёмом памяти.')
+@click.option('--error-rate', required=False, type=click.FloatRange(min=0, max=1, min_open=True),
+              help='Допустимая погрешность частот в приблизительном режиме, доля от числа слов (по умолчанию 0.0001).')
+@click.option('--max-counters', required=False, type=click.IntRange(min=1),
+              help='Потолок числа счётчиков в приблизительном режиме (по умолчанию 100000).')
+@click.option('--ngrams', required=False,
+              help='Длины словосочетаний через запятую, например 2,3 (считаются по тому же потоку слов).')
+@click.option('--ngram-min-count', required=False, type=click.IntRange(min=1),
+              help='Минимальная частота словосочетания в выводе (по умолчанию 2).')
+@click.option('--tokenizer', required=False, type=click.Choice(sorted(TOKENIZERS)),
+              help=f'Способ выделения слов (по умолчанию {DEFAULT_TOKENIZER}); результат от выбора не зависит.')
+def tag(inputs, input_dir, manifest, output, limit, lemmatize, stopwords, no_names, lemma_cache, workers, per_file,
+        index_path, approximate, error_rate, max_counters, ngrams, ngram_min_count, tokenizer):
     """Генерация облака слов (частотный список) из текста расшифровки митапа."""
+    if not (inputs or input_dir or manifest):
+        raise click.UsageError("Укажите расшифровки: --input, --input-dir или --manifest")
+    if approximate and (index_path or per_file):
+        raise click.UsageError("--approximate нельзя использовать вместе с --index или --per-file")
+    ngram_sizes = _parse_ngram_sizes(ngrams) if ngrams else ()
+    if ngram_sizes and (index_path or per_file):
+        raise click.UsageError("--ngrams нельзя использовать вместе с --index или --per-file")
+
     handler = TagCommandHandler()
     options = TagCommandOptions(
-        transcript_path=input,
+        transcript_path=None,
+        transcript_paths=inputs,
+        input_dir=input_dir,
+        manifest_path=manifest,
+        per_file=per_file,
+        index_path=index_path,
+        approximate=approximate,
+        error_rate=error_rate,
+        max_counters=max_counters,
+        ngram_sizes=ngram_sizes,
+        ngram_min_count=ngram_min_count,
+        tokenizer=tokenizer,
         output_path=output,
         limit=limit,
         lemmatize=lemmatize,
         stopwords_path=stopwords,
         exclude_names=no_names,
+        lemma_cache_path=lemma_cache,
+        workers=workers,
     )
     try:
         handler.execute(options)
@@ -76,7 +220,13 @@ def tag(input, output, limit, lemmatize, stopwords, no_names):
 @click.option('--output', '-o', default=None, type=click.Path(), help='Путь к выходному файлу (опционально, если не указан - вывод в консоль).')
 @click.option('--config', '-c', default=None, type=click.Path(),
               help='Путь к файлу конфигурации (по умолчанию: config.yaml в директории проекта).')
-def protocol(input, output, config):
+@click.option('--stream/--no-stream', default=None,
+              help='Выводить протокол по мере генерации (по умолчанию: ключ stream в конфиге).')
+@click.option('--no-cache', is_flag=True, default=False,
+              help='Не использовать кэш ответов: всегда обращаться к провайдеру.')
+@click.option('--cache-dir', required=False, type=click.Path(file_okay=False),
+              help='Каталог кэша ответов (по умолчанию: ~/.cache/mina/protocol).')
+def protocol(input, output, config, stream, no_cache, cache_dir):
     """Создает структурированный протокол из расшифровки."""
     handler = ProtocolCommandHandler(
         output_writer=_write_protocol_output
@@ -85,6 +235,9 @@ def protocol(input, output, config):
         transcript_path=input,
         output_path=output,
         config_path=config,
+        stream=stream,
+        use_cache=not no_cache,
+        cache_dir=cache_dir,
     )
     try:
         handler.execute(options)
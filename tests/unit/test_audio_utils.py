@@ -0,0 +1,80 @@
+"""Тесты для утилит работы с аудио."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from app.utils.audio import SAMPLE_RATE, decode_audio, detect_silences, parse_silencedetect_output
+
+SILENCEDETECT_OUTPUT = """Input #0, mp3, from 'meeting.mp3':
+  Duration: 01:02:03.50, start: 0.025057, bitrate: 128 kb/s
+[silencedetect @ 0x55d5] silence_start: 10.5
+[silencedetect @ 0x55d5] silence_end: 12.25 | silence_duration: 1.75
+[silencedetect @ 0x55d5] silence_start: -0.01
+[silencedetect @ 0x55d5] silence_end: 0.8 | silence_duration: 0.81
+[silencedetect @ 0x55d5] silence_start: 3720
+"""
+
+
+@pytest.mark.unit
+def test_parse_silencedetect_output():
+    duration, silences = parse_silencedetect_output(SILENCEDETECT_OUTPUT)
+
+    assert duration == pytest.approx(3723.5)
+    assert silences == [(10.5, 12.25), (0.0, 0.8), (3720.0, 3723.5)]
+
+
+@pytest.mark.unit
+def test_parse_silencedetect_output_without_duration():
+    duration, silences = parse_silencedetect_output("silence_start: 1\n")
+
+    assert duration == 0.0
+    assert silences == []
+
+
+@pytest.fixture
+def tone_with_pause(tmp_path):
+    """Генерирует wav: 2 секунды тона, 2 секунды тишины, 2 секунды тона."""
+    if not shutil.which("ffmpeg"):
+        pytest.skip("ffmpeg не установлен")
+    path = tmp_path / "tone.wav"
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=2",
+            "-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono:d=2",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=2",
+            "-filter_complex", "[0:a]aresample=16000[a0];[2:a]aresample=16000[a2];[a0][1:a][a2]concat=n=3:v=0:a=1",
+            str(path),
+        ],
+        check=True,
+    )
+    return str(path)
+
+
+@pytest.mark.integration
+def test_detect_silences_with_ffmpeg(tone_with_pause):
+    duration, silences = detect_silences(tone_with_pause)
+
+    assert duration == pytest.approx(6.0, abs=0.1)
+    assert len(silences) == 1
+    assert silences[0][0] == pytest.approx(2.0, abs=0.1)
+    assert silences[0][1] == pytest.approx(4.0, abs=0.1)
+
+
+@pytest.mark.integration
+def test_decode_audio_returns_requested_range(tone_with_pause):
+    audio = decode_audio(tone_with_pause, start=1.0, duration=2.0)
+
+    assert audio.dtype.name == "float32"
+    assert len(audio) == pytest.approx(2 * SAMPLE_RATE, abs=SAMPLE_RATE * 0.05)
+    assert abs(audio).max() <= 1.0
+
+
+@pytest.mark.unit
+def test_decode_audio_raises_on_ffmpeg_error(tmp_path):
+    if not shutil.which("ffmpeg"):
+        pytest.skip("ffmpeg не установлен")
+    with pytest.raises(RuntimeError, match="не смог декодировать"):
+        decode_audio(str(tmp_path / "missing.wav"))
@@ -0,0 +1,260 @@
+"""Тесты для пакетной транскрипции (сервис и входной адаптер)."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters.input.cli import ScribeBatchCommandHandler, ScribeBatchCommandOptions
+from app.application.ports import ITranscriptionEngine, ITranscriptSegmentWriter
+from app.application.services import BatchTranscriptionService
+from app.domain.models.batch import BatchItem, BatchItemResult, BatchReport
+from app.domain.models.transcript import Segment
+
+
+class FakeTranscriptionService:
+    """Сервис транскрипции, возвращающий два сегмента или ошибку для 'broken' файлов."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, input_path, output_writer, model_name, language='ru', **kwargs):
+        self.calls.append((input_path, model_name, kwargs))
+        if "broken" in input_path:
+            output_writer.close()
+            raise RuntimeError("битый файл")
+        segments = [Segment(0.0, 5.0, "раз"), Segment(5.0, 10.0, "два")]
+        for segment in segments:
+            output_writer.write_segment(segment)
+        output_writer.close()
+        return iter(segments)
+
+
+@pytest.mark.unit
+class TestBatchTranscriptionService:
+    """Тесты для BatchTranscriptionService."""
+
+    def test_run_processes_all_items_and_reports_rtf(self):
+        transcription_service = FakeTranscriptionService()
+        writers = {}
+
+        def writer_factory(path):
+            writers[path] = Mock(spec=ITranscriptSegmentWriter)
+            return writers[path]
+
+        service = BatchTranscriptionService(
+            transcription_service=transcription_service,
+            writer_factory=writer_factory,
+            concurrency=2,
+            duration_probe=lambda path: 20.0,
+        )
+        items = [BatchItem("a.mp3", "a.txt"), BatchItem("b.mp3", "b.txt")]
+
+        report = service.run(items, model_name="small", language="ru", beam_size=5, verbose=False)
+
+        assert [result.item for result in report.results] == items
+        assert all(result.succeeded for result in report.results)
+        assert report.results[0].segment_count == 2
+        assert report.results[0].audio_duration == 20.0
+        assert report.results[0].real_time_factor == pytest.approx(report.results[0].wall_time / 20.0)
+        assert writers["a.txt"].write_segment.call_count == 2
+        assert {call[1] for call in transcription_service.calls} == {"small"}
+        assert all("verbose" not in call[2] for call in transcription_service.calls)
+
+    def test_run_continues_after_failed_item(self):
+        service = BatchTranscriptionService(
+            transcription_service=FakeTranscriptionService(),
+            writer_factory=lambda path: Mock(spec=ITranscriptSegmentWriter),
+        )
+
+        report = service.run(
+            [BatchItem("broken.mp3", "broken.txt"), BatchItem("ok.mp3", "ok.txt")],
+            model_name="small",
+        )
+
+        assert report.results[0].error == "битый файл"
+        assert report.results[1].succeeded
+        assert len(report.failed) == 1
+
+    def test_audio_duration_falls_back_to_last_segment(self):
+        service = BatchTranscriptionService(
+            transcription_service=FakeTranscriptionService(),
+            writer_factory=lambda path: Mock(spec=ITranscriptSegmentWriter),
+        )
+
+        report = service.run([BatchItem("a.mp3", "a.txt")], model_name="small")
+
+        assert report.results[0].audio_duration == 10.0
+
+    def test_closes_writer_when_service_fails_before_start(self):
+        """Если сервис упал до начала транскрипции (нет ffmpeg), writer всё равно закрывается."""
+        transcription_service = Mock()
+        transcription_service.transcribe.side_effect = RuntimeError("ffmpeg не найден")
+        writer = Mock(spec=ITranscriptSegmentWriter)
+        service = BatchTranscriptionService(
+            transcription_service=transcription_service,
+            writer_factory=lambda path: writer,
+        )
+
+        report = service.run([BatchItem("a.mp3", "a.txt")], model_name="small")
+
+        assert report.results[0].error == "ffmpeg не найден"
+        writer.close.assert_called()
+
+    def test_requires_positive_concurrency(self):
+        with pytest.raises(ValueError):
+            BatchTranscriptionService(Mock(), Mock(), concurrency=0)
+
+
+@pytest.mark.unit
+def test_batch_report_to_dict_and_text():
+    report = BatchReport(
+        results=[
+            BatchItemResult(BatchItem("a.mp3", "a.txt"), wall_time=5.0, audio_duration=50.0, segment_count=3),
+            BatchItemResult(BatchItem("b.mp3", "b.txt"), wall_time=1.0, error="сбой"),
+        ],
+        total_wall_time=6.0,
+        extra={"model": "small"},
+    )
+
+    data = report.to_dict()
+
+    assert data["files"][0]["real_time_factor"] == 0.1
+    assert data["files"][1]["real_time_factor"] is None
+    assert data["failed_files"] == 1
+    assert data["total_audio_duration"] == 50.0
+    assert data["model"] == "small"
+    assert "b.mp3: ОШИБКА - сбой" in report.to_text()
+
+
+@pytest.mark.unit
+class TestScribeBatchCommandHandler:
+    """Тесты для ScribeBatchCommandHandler."""
+
+    def _create_handler(self, batch_service, **overrides):
+        adapter = Mock(spec=ITranscriptionEngine)
+        deps = dict(
+            transcription_adapter_factory=Mock(return_value=(adapter, "resolved")),
+            transcription_service_factory=Mock(return_value="service"),
+            batch_service_factory=Mock(return_value=batch_service),
+            transcript_writer_factory=Mock(),
+            report_writer=Mock(),
+            model_stats_provider=Mock(return_value=None),
+        )
+        deps.update(overrides)
+        return ScribeBatchCommandHandler(**deps), deps
+
+    def test_execute_loads_engine_once_and_writes_report(self, tmp_path):
+        (tmp_path / "one.mp3").write_bytes(b"")
+        (tmp_path / "two.wav").write_bytes(b"")
+        (tmp_path / "notes.txt").write_text("не аудио", encoding="utf-8")
+        output_dir = tmp_path / "out"
+
+        batch_service = Mock()
+        batch_service.run.return_value = BatchReport(results=[], total_wall_time=1.0)
+        handler, deps = self._create_handler(batch_service)
+
+        handler.execute(ScribeBatchCommandOptions(
+            input_dir=str(tmp_path),
+            output_dir=str(output_dir),
+            model="faster:base",
+            concurrency=3,
+        ))
+
+        deps["transcription_adapter_factory"].assert_called_once_with("faster:base", "int8")
+        assert batch_service_kwargs(deps)["concurrency"] == 3
+        assert batch_service_kwargs(deps)["transcription_service"] == "service"
+        items = batch_service.run.call_args.args[0]
+        assert [item.output_path for item in items] == [
+            str(output_dir / "one.txt"),
+            str(output_dir / "two.txt"),
+        ]
+        assert batch_service.run.call_args.kwargs["model_name"] == "resolved"
+        report_path, report_dict = deps["report_writer"].call_args.args
+        assert report_path == str(output_dir / "scribe-report.json")
+        assert report_dict["model"] == "faster:base"
+        assert output_dir.is_dir()
+
+    def test_execute_parallel_mode_does_not_create_adapter(self, tmp_path):
+        (tmp_path / "one.mp3").write_bytes(b"")
+        batch_service = Mock()
+        batch_service.run.return_value = BatchReport(results=[], total_wall_time=1.0)
+        parallel_service_factory = Mock(return_value="parallel")
+        handler, deps = self._create_handler(batch_service, parallel_service_factory=parallel_service_factory)
+
+        handler.execute(ScribeBatchCommandOptions(input_dir=str(tmp_path), model="faster:base", workers=2))
+
+        deps["transcription_adapter_factory"].assert_not_called()
+        parallel_service_factory.assert_called_once_with("faster:base", "int8", 2)
+        assert batch_service_kwargs(deps)["transcription_service"] == "parallel"
+        assert batch_service.run.call_args.kwargs["model_name"] == "base"
+
+    def test_execute_rejects_concurrent_files_on_shared_whisper_model(self, tmp_path):
+        """Модель OpenAI Whisper не делится между потоками: --concurrency > 1 для неё запрещено."""
+        (tmp_path / "one.mp3").write_bytes(b"")
+        handler, deps = self._create_handler(Mock())
+
+        with pytest.raises(ValueError, match="--concurrency"):
+            handler.execute(ScribeBatchCommandOptions(input_dir=str(tmp_path), model="small", concurrency=2))
+
+        deps["transcription_adapter_factory"].assert_not_called()
+        deps["batch_service_factory"].assert_not_called()
+
+    @pytest.mark.parametrize("model, workers", [("faster:small", 1), ("small", 2)])
+    def test_execute_allows_concurrency_without_shared_whisper_model(self, tmp_path, model, workers):
+        """Потоки делят модель только для faster-whisper; при --workers > 1 модели живут в воркерах."""
+        (tmp_path / "one.mp3").write_bytes(b"")
+        batch_service = Mock()
+        batch_service.run.return_value = BatchReport(results=[], total_wall_time=1.0)
+        handler, deps = self._create_handler(batch_service, parallel_service_factory=Mock())
+
+        handler.execute(ScribeBatchCommandOptions(
+            input_dir=str(tmp_path), model=model, concurrency=2, workers=workers
+        ))
+
+        assert batch_service_kwargs(deps)["concurrency"] == 2
+
+    def test_build_items_rejects_duplicate_outputs(self, tmp_path):
+        (tmp_path / "meeting.mp3").write_bytes(b"")
+        (tmp_path / "meeting.wav").write_bytes(b"")
+
+        with pytest.raises(ValueError, match="meeting.txt"):
+            ScribeBatchCommandHandler.build_items(ScribeBatchCommandOptions(input_dir=str(tmp_path)))
+
+    def test_build_items_from_manifest(self, tmp_path):
+        manifest = tmp_path / "batch.tsv"
+        manifest.write_text(
+            "# вход\tвыход\n"
+            "first.mp3\tresults/first.txt\n"
+            "\n"
+            "/abs/second.mp3\n",
+            encoding="utf-8",
+        )
+
+        items = ScribeBatchCommandHandler.build_items(
+            ScribeBatchCommandOptions(manifest_path=str(manifest), output_dir="/out")
+        )
+
+        assert items == [
+            BatchItem(str(tmp_path / "first.mp3"), str(tmp_path / "results" / "first.txt")),
+            BatchItem("/abs/second.mp3", "/out/second.txt"),
+        ]
+
+    def test_build_items_requires_exactly_one_source(self):
+        with pytest.raises(ValueError):
+            ScribeBatchCommandHandler.build_items(ScribeBatchCommandOptions())
+        with pytest.raises(ValueError):
+            ScribeBatchCommandHandler.build_items(
+                ScribeBatchCommandOptions(input_dir="a", manifest_path="b")
+            )
+
+    def test_default_report_writer_writes_json(self, tmp_path):
+        report_path = tmp_path / "report.json"
+
+        ScribeBatchCommandHandler._default_report_writer(str(report_path), {"files": [], "model": "тест"})
+
+        assert json.loads(report_path.read_text(encoding="utf-8")) == {"files": [], "model": "тест"}
+
+
+def batch_service_kwargs(deps):
+    return deps["batch_service_factory"].call_args.kwargs
@@ -0,0 +1,129 @@
+"""Тесты для контрольных точек транскрипции."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters.output.file_writer import FileOutputWriter
+from app.adapters.output.storage import JsonCheckpointStore
+from app.application.ports import ITranscriptionEngine
+from app.application.services import TranscriptionService
+from app.domain.models.transcript import Segment, TranscriptCheckpoint
+
+
+def _segments(count: int, start: float = 0.0):
+    return [
+        Segment(start=start + index, end=start + index + 1, text=f"Сегмент {index}")
+        for index in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestJsonCheckpointStore:
+    """Тесты для JsonCheckpointStore."""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        store = JsonCheckpointStore.for_output(str(tmp_path / "out.txt"))
+        checkpoint = TranscriptCheckpoint(input_path="a.mp3", last_end=12.5, writer_offset=100, segment_count=3)
+
+        store.save(checkpoint)
+
+        assert store.path.endswith("out.txt.checkpoint.json")
+        assert store.load() == checkpoint
+
+    def test_load_returns_none_without_checkpoint(self, tmp_path):
+        assert JsonCheckpointStore(str(tmp_path / "missing.json")).load() is None
+
+    def test_clear_removes_checkpoint(self, tmp_path):
+        store = JsonCheckpointStore(str(tmp_path / "cp.json"))
+        store.save(TranscriptCheckpoint(input_path="a.mp3", last_end=1.0, writer_offset=10))
+
+        store.clear()
+        store.clear()
+
+        assert store.load() is None
+
+    def test_corrupted_checkpoint_raises_value_error(self, tmp_path):
+        path = tmp_path / "cp.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Повреждён"):
+            JsonCheckpointStore(str(path)).load()
+
+
+@pytest.mark.unit
+class TestTranscriptionServiceCheckpoints:
+    """Тесты сохранения и возобновления транскрипции по контрольным точкам."""
+
+    def test_checkpoint_is_saved_periodically_and_cleared_on_success(self, tmp_path):
+        engine = Mock(spec=ITranscriptionEngine)
+        engine.transcribe.return_value = iter(_segments(5))
+        store = Mock()
+        writer = FileOutputWriter(str(tmp_path / "out.txt"), verbose=False)
+        service = TranscriptionService(engine=engine, checkpoint_every=2)
+
+        list(service.transcribe("a.mp3", writer, "small", checkpoint_store=store))
+
+        saved = [call.args[0] for call in store.save.call_args_list]
+        assert [checkpoint.last_end for checkpoint in saved] == [2.0, 4.0]
+        assert saved[-1].segment_count == 4
+        store.clear.assert_called_once_with()
+
+    def test_checkpoint_is_saved_when_engine_fails(self, tmp_path):
+        def failing_segments():
+            yield from _segments(3)
+            raise RuntimeError("сбой движка")
+
+        engine = Mock(spec=ITranscriptionEngine)
+        engine.transcribe.return_value = failing_segments()
+        store = JsonCheckpointStore.for_output(str(tmp_path / "out.txt"))
+        writer = FileOutputWriter(str(tmp_path / "out.txt"), verbose=False)
+        service = TranscriptionService(engine=engine, checkpoint_every=100)
+
+        with pytest.raises(RuntimeError):
+            list(service.transcribe("a.mp3", writer, "small", checkpoint_store=store))
+
+        checkpoint = store.load()
+        assert checkpoint.last_end == 3.0
+        assert checkpoint.segment_count == 3
+        assert checkpoint.writer_offset == len((tmp_path / "out.txt").read_bytes())
+
+    def test_resume_decodes_tail_and_shifts_timestamps(self, tmp_path):
+        output_file = tmp_path / "out.txt"
+        first_writer = FileOutputWriter(str(output_file), verbose=False)
+        first_writer.write_segment(Segment(start=0.0, end=60.0, text="Начало"))
+        offset = first_writer.checkpoint()
+        first_writer.close()
+
+        engine = Mock(spec=ITranscriptionEngine)
+        engine.transcribe.return_value = iter([Segment(start=0.0, end=5.0, text="Продолжение")])
+        audio_loader = Mock(return_value="tail-audio")
+        service = TranscriptionService(engine=engine, audio_loader=audio_loader)
+        resume_from = TranscriptCheckpoint(input_path="a.mp3", last_end=60.0, writer_offset=offset, segment_count=1)
+
+        result = list(service.transcribe(
+            "a.mp3",
+            FileOutputWriter(str(output_file), verbose=False, resume_offset=offset),
+            "small",
+            resume_from=resume_from,
+        ))
+
+        audio_loader.assert_called_once_with("a.mp3", start=60.0)
+        assert engine.transcribe.call_args.kwargs["audio_path"] == "tail-audio"
+        assert (result[0].start, result[0].end) == (60.0, 65.0)
+        assert output_file.read_text(encoding="utf-8") == (
+            "[0:00 - 1:00] Начало\n[1:00 - 1:05] Продолжение\n"
+        )
+
+    def test_resume_closes_writer_when_tail_decode_fails(self):
+        engine = Mock(spec=ITranscriptionEngine)
+        audio_loader = Mock(side_effect=RuntimeError("ffmpeg не смог декодировать запись"))
+        service = TranscriptionService(engine=engine, audio_loader=audio_loader)
+        writer = Mock()
+        resume_from = TranscriptCheckpoint(input_path="a.mp3", last_end=60.0, writer_offset=10, segment_count=1)
+
+        with pytest.raises(RuntimeError, match="ffmpeg"):
+            list(service.transcribe("a.mp3", writer, "small", resume_from=resume_from))
+
+        writer.close.assert_called_once_with()
+        engine.transcribe.assert_not_called()
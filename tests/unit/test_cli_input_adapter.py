@@ -9,7 +9,9 @@ from app.adapters.input.cli import (
     ScribeCommandHandler,
     ScribeCommandOptions,
 )
+from app.adapters.output import FlushPolicy, QueuedSegmentWriter
 from app.application.ports import ITranscriptSegmentWriter, ITranscriptionEngine
+from app.domain.models.transcript import TranscriptCheckpoint
 
 
 @pytest.mark.unit
@@ -27,11 +29,14 @@ class TestScribeCommandHandler:
         service_factory = Mock(return_value=service)
         writer = Mock(spec=ITranscriptSegmentWriter)
         writer_factory = Mock(return_value=writer)
+        checkpoint_store = Mock()
+        checkpoint_store_factory = Mock(return_value=checkpoint_store)
 
         handler = ScribeCommandHandler(
             transcription_adapter_factory=adapter_factory,
             transcription_service_factory=service_factory,
             transcript_writer_factory=writer_factory,
+            checkpoint_store_factory=checkpoint_store_factory,
         )
 
         options = ScribeCommandOptions(
@@ -55,7 +60,11 @@ class TestScribeCommandHandler:
             language="en",
             verbose=False,
             beam_size=DEFAULT_BEAM_SIZE,
+            checkpoint_store=checkpoint_store,
+            resume_from=None,
         )
+        checkpoint_store_factory.assert_called_once_with("out.txt")
+        checkpoint_store.load.assert_not_called()
 
     def test_execute_closes_writer_and_reraises_on_error(self):
         """При ошибке транскрипции writer должен закрываться и исключение пробрасывается."""
@@ -89,6 +98,206 @@ class TestScribeCommandHandler:
 
         writer.close.assert_called_once_with()
 
+    def test_execute_does_not_close_writer_twice_after_service_started(self):
+        """Запущенный сервис сам закрывает writer - ошибка записи не подменяет исходную."""
+        writer = Mock(spec=ITranscriptSegmentWriter)
+
+        def transcribe(**kwargs):
+            try:
+                raise RuntimeError("engine failure")
+                yield
+            finally:
+                kwargs["output_writer"].close()
+
+        service = Mock()
+        service.transcribe.side_effect = transcribe
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=Mock(return_value=(Mock(), "small")),
+            transcription_service_factory=Mock(return_value=service),
+            transcript_writer_factory=Mock(return_value=writer),
+        )
+
+        with pytest.raises(RuntimeError, match="engine failure"):
+            handler.execute(ScribeCommandOptions(input_path="audio.mp3", output_path="out.txt", verbose=False))
+
+        writer.close.assert_called_once_with()
 
+    def test_execute_uses_parallel_service_when_workers_requested(self):
+        """При workers > 1 должен использоваться сервис параллельной транскрипции."""
+        adapter = Mock(spec=ITranscriptionEngine)
+        adapter_factory = Mock(return_value=(adapter, "small"))
+        service_factory = Mock()
+        parallel_service = Mock()
+        parallel_service.transcribe.return_value = iter([])
+        parallel_service_factory = Mock(return_value=parallel_service)
+        writer = Mock(spec=ITranscriptSegmentWriter)
+
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=adapter_factory,
+            transcription_service_factory=service_factory,
+            transcript_writer_factory=Mock(return_value=writer),
+            parallel_service_factory=parallel_service_factory,
+        )
+
+        options = ScribeCommandOptions(
+            input_path="audio.mp3",
+            output_path="out.txt",
+            model="faster:small",
+            compute_type="int8",
+            verbose=False,
+            workers=4,
+        )
+
+        handler.execute(options)
+
+        parallel_service_factory.assert_called_once_with("faster:small", "int8", 4)
+        service_factory.assert_not_called()
+        parallel_service.transcribe.assert_called_once()
+        assert parallel_service.transcribe.call_args.kwargs["model_name"] == "small"
+
+    def test_execute_resume_reopens_writer_at_checkpoint_offset(self):
+        """При resume writer открывается со смещения из контрольной точки."""
+        service = Mock()
+        service.transcribe.return_value = iter([])
+        checkpoint = TranscriptCheckpoint(input_path="audio.mp3", last_end=30.0, writer_offset=42)
+        checkpoint_store = Mock()
+        checkpoint_store.load.return_value = checkpoint
+        writer_factory = Mock(return_value=Mock(spec=ITranscriptSegmentWriter))
+
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=Mock(return_value=(Mock(), "small")),
+            transcription_service_factory=Mock(return_value=service),
+            transcript_writer_factory=writer_factory,
+            checkpoint_store_factory=Mock(return_value=checkpoint_store),
+        )
+
+        handler.execute(ScribeCommandOptions(
+            input_path="audio.mp3", output_path="out.txt", verbose=False, resume=True
+        ))
+
+        writer_factory.assert_called_once_with("out.txt", False, resume_offset=42)
+        assert service.transcribe.call_args.kwargs["resume_from"] is checkpoint
+
+    def test_execute_parallel_mode_does_not_create_adapter(self):
+        """При workers > 1 движок в основном процессе не создаётся: модель грузят воркеры."""
+        adapter_factory = Mock()
+        parallel_service = Mock()
+        parallel_service.transcribe.return_value = iter([])
+
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=adapter_factory,
+            transcript_writer_factory=Mock(return_value=Mock(spec=ITranscriptSegmentWriter)),
+            parallel_service_factory=Mock(return_value=parallel_service),
+        )
+
+        handler.execute(ScribeCommandOptions(
+            input_path="audio.mp3", output_path="out.txt", model="faster:small", verbose=False, workers=2
+        ))
+
+        adapter_factory.assert_not_called()
+        assert parallel_service.transcribe.call_args.kwargs["model_name"] == "small"
+
+    def test_execute_audio_cache_rejects_parallel_mode(self):
+        """Кэш декодированного аудио несовместим с параллельной транскрипцией."""
+        audio_cache_factory = Mock()
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=Mock(), audio_cache_factory=audio_cache_factory
+        )
+
+        with pytest.raises(ValueError, match="--audio-cache"):
+            handler.execute(ScribeCommandOptions(
+                input_path="audio.mp3", output_path="out.txt", workers=2, audio_cache_dir="cache"
+            ))
+        audio_cache_factory.assert_not_called()
+
+    def test_execute_resume_rejects_parallel_mode(self):
+        """Возобновление несовместимо с параллельной транскрипцией."""
+        handler = ScribeCommandHandler(transcription_adapter_factory=Mock())
+
+        with pytest.raises(ValueError, match="--resume"):
+            handler.execute(ScribeCommandOptions(
+                input_path="audio.mp3", output_path="out.txt", workers=2, resume=True
+            ))
+
+    def test_execute_passes_stream_window_to_service(self):
+        """Длина окна потокового режима передаётся в сервис транскрипции."""
+        service = Mock()
+        service.transcribe.return_value = iter([])
+
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=Mock(return_value=(Mock(), "small")),
+            transcription_service_factory=Mock(return_value=service),
+            transcript_writer_factory=Mock(return_value=Mock(spec=ITranscriptSegmentWriter)),
+            checkpoint_store_factory=Mock(),
+        )
+
+        handler.execute(ScribeCommandOptions(
+            input_path="audio.mp3", output_path="out.txt", verbose=False, stream_window=300.0
+        ))
+
+        assert service.transcribe.call_args.kwargs["stream_window"] == 300.0
+
+    def test_execute_creates_adapter_with_audio_cache(self):
+        """При заданном каталоге кэша адаптер создаётся с кэшем декодированного аудио."""
+        service = Mock()
+        service.transcribe.return_value = iter([])
+        audio_cache = Mock()
+        audio_cache_factory = Mock(return_value=audio_cache)
+        adapter_factory = Mock(return_value=(Mock(), "small"))
+
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=adapter_factory,
+            transcription_service_factory=Mock(return_value=service),
+            transcript_writer_factory=Mock(return_value=Mock(spec=ITranscriptSegmentWriter)),
+            checkpoint_store_factory=Mock(),
+            audio_cache_factory=audio_cache_factory,
+        )
+
+        handler.execute(ScribeCommandOptions(
+            input_path="audio.mp3", output_path="out.txt", verbose=False,
+            audio_cache_dir="cache", audio_cache_size=1024,
+        ))
+
+        audio_cache_factory.assert_called_once_with("cache", 1024)
+        adapter_factory.assert_called_once_with("small", "int8", audio_cache)
+
+    def test_execute_passes_flush_policy_to_writer(self):
+        """Параметры пакетного сброса превращаются в FlushPolicy для writer'а."""
+        service = Mock()
+        service.transcribe.return_value = iter([])
+        writer_factory = Mock(return_value=Mock(spec=ITranscriptSegmentWriter))
+
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=Mock(return_value=(Mock(), "small")),
+            transcription_service_factory=Mock(return_value=service),
+            transcript_writer_factory=writer_factory,
+            checkpoint_store_factory=Mock(),
+        )
+
+        handler.execute(ScribeCommandOptions(
+            input_path="audio.mp3", output_path="out.txt", verbose=False, flush_every=20, flush_interval=5.0
+        ))
+
+        writer_factory.assert_called_once_with(
+            "out.txt", False, flush_policy=FlushPolicy(every_segments=20, interval=5.0)
+        )
+
+    def test_execute_wraps_writer_into_queue(self):
+        """При write_queue сервис получает writer с фоновой записью."""
+        service = Mock()
+        service.transcribe.return_value = iter([])
+
+        handler = ScribeCommandHandler(
+            transcription_adapter_factory=Mock(return_value=(Mock(), "small")),
+            transcription_service_factory=Mock(return_value=service),
+            transcript_writer_factory=Mock(return_value=Mock(spec=ITranscriptSegmentWriter)),
+            checkpoint_store_factory=Mock(),
+        )
 
+        handler.execute(ScribeCommandOptions(
+            input_path="audio.mp3", output_path="out.txt", verbose=False, write_queue=10
+        ))
 
+        writer = service.transcribe.call_args.kwargs["output_writer"]
+        assert isinstance(writer, QueuedSegmentWriter)
+        writer.close()
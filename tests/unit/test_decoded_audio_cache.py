@@ -0,0 +1,101 @@
+"""Тесты для DecodedAudioCache."""
+
+import os
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.adapters.output.audio import DecodedAudioCache
+from app.adapters.output.whisper import FasterWhisperAdapter, WhisperAdapter
+
+
+def _source(tmp_path, name: str, content: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def _decoder(samples_count: int = 100):
+    return Mock(side_effect=lambda path, sample_rate: np.linspace(-1, 1, samples_count, dtype=np.float32))
+
+
+@pytest.mark.unit
+class TestDecodedAudioCache:
+    """Тесты для DecodedAudioCache."""
+
+    def test_second_load_is_served_from_cache_as_memmap(self, tmp_path):
+        decoder = _decoder()
+        cache = DecodedAudioCache(str(tmp_path / "cache"), decoder=decoder)
+        source = _source(tmp_path, "a.mp3", b"audio")
+
+        first = cache.load(source)
+        second = cache.load(source)
+
+        decoder.assert_called_once()
+        assert isinstance(second, np.memmap)
+        assert not second.flags.writeable
+        np.testing.assert_array_equal(first, second)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_content_not_path(self, tmp_path):
+        decoder = _decoder()
+        cache = DecodedAudioCache(str(tmp_path / "cache"), decoder=decoder)
+
+        cache.load(_source(tmp_path, "a.mp3", b"same"))
+        cache.load(_source(tmp_path, "copy.mp3", b"same"))
+        cache.load(_source(tmp_path, "other.mp3", b"different"))
+
+        assert decoder.call_count == 2
+
+    def test_evicts_least_recently_used_entries(self, tmp_path):
+        entry_size = 100 * 4 + 128
+        cache = DecodedAudioCache(str(tmp_path / "cache"), max_bytes=entry_size * 2, decoder=_decoder())
+        first = _source(tmp_path, "1.mp3", b"1")
+        second = _source(tmp_path, "2.mp3", b"2")
+        third = _source(tmp_path, "3.mp3", b"3")
+
+        cache.load(first)
+        cache.load(second)
+        # Делаем первую запись самой старой явно, не полагаясь на разрешение mtime
+        old = time.time() - 100
+        os.utime(cache._entry_path(cache.content_key(first)), (old, old))
+        cache.load(third)
+
+        assert not os.path.exists(cache._entry_path(cache.content_key(first)))
+        assert os.path.exists(cache._entry_path(cache.content_key(second)))
+        assert os.path.exists(cache._entry_path(cache.content_key(third)))
+        assert cache.size() <= entry_size * 2
+
+    def test_corrupted_entry_is_decoded_again(self, tmp_path):
+        decoder = _decoder()
+        cache = DecodedAudioCache(str(tmp_path / "cache"), decoder=decoder)
+        source = _source(tmp_path, "a.mp3", b"audio")
+        cache.load(source)
+        with open(cache._entry_path(cache.content_key(source)), "wb") as f:
+            f.write(b"garbage")
+
+        audio = cache.load(source)
+
+        assert decoder.call_count == 2
+        assert len(audio) == 100
+        assert not [name for name in os.listdir(cache.cache_dir) if name.endswith(".tmp")]
+
+
+@pytest.mark.unit
+def test_adapters_read_audio_from_cache(tmp_path):
+    cache = DecodedAudioCache(str(tmp_path / "cache"), decoder=_decoder())
+    source = _source(tmp_path, "a.mp3", b"audio")
+
+    faster_model = Mock()
+    faster_model.transcribe.return_value = (iter([]), Mock(language="ru", language_probability=1.0))
+    list(FasterWhisperAdapter(Mock(), audio_cache=cache).transcribe(faster_model, source, "ru"))
+
+    whisper_model = Mock()
+    whisper_model.transcribe.return_value = {"segments": []}
+    list(WhisperAdapter(Mock(), audio_cache=cache).transcribe(whisper_model, source, "ru"))
+
+    assert isinstance(faster_model.transcribe.call_args.args[0], np.memmap)
+    assert isinstance(whisper_model.transcribe.call_args.args[0], np.memmap)
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -6,6 +6,7 @@ import pytest
 import requests
 
 from app.adapters.output.api import DeepSeekProtocolClient
+from app.adapters.output.api.sse import iter_sse_data
 from app.domain.models.protocol import ProtocolConfig, ProtocolRequest
 from app.domain.exceptions import ProtocolClientError
 
@@ -49,6 +50,16 @@ class TestDeepSeekProtocolClient:
         assert response.content == "Готовый протокол"
         assert "choices" in response.provider_raw
 
+    def test_request_timeout_overrides_client_timeout(self):
+        http_client = Mock()
+        http_client.post.return_value.json.return_value = {"choices": [{"message": {"content": "Протокол"}}]}
+        config = ProtocolConfig(api_key="key", request_timeout=7)
+
+        client = DeepSeekProtocolClient(api_key="key", http_client=http_client, timeout=300)
+        client.generate_protocol(ProtocolRequest("Инструкции", "Стенограмма", config))
+
+        assert http_client.post.call_args.kwargs["timeout"] == 7
+
     def test_generate_protocol_merges_extra_params(self):
         config = ProtocolConfig(
             provider="deepseek",
@@ -121,5 +132,115 @@ class TestDeepSeekProtocolClient:
         with pytest.raises(ProtocolClientError, match="не содержит контент"):
             client.generate_protocol(request)
 
+    def _create_stream_response(self, lines):
+        response = Mock(ok=True)
+        response.iter_lines.return_value = iter(lines)
+        return response
+
+    def test_generate_protocol_streams_tokens(self):
+        config = ProtocolConfig(provider="deepseek", api_key="key", stream=True)
+        request = ProtocolRequest(instructions="Инструкции", transcript="Стенограмма", config=config)
+        lines = [
+            b": keep-alive",
+            b"",
+            'data: {"id": "1", "model": "deepseek-chat", "choices": [{"delta": {"role": "assistant"}}]}'.encode(),
+            b"",
+            'data: {"id": "1", "choices": [{"delta": {"content": "Гото"}}]}'.encode(),
+            b"",
+            'data: {"id": "1", "choices": [{"delta": {"content": "вый протокол"}, "finish_reason": "stop"}]}'.encode(),
+            b"",
+            b"data: [DONE]",
+            b"",
+        ]
+        http_client = Mock()
+        http_client.post.return_value = self._create_stream_response(lines)
+        tokens = []
+
+        client = DeepSeekProtocolClient(api_key="key", http_client=http_client)
+        response = client.generate_protocol(request, on_token=tokens.append)
+
+        kwargs = http_client.post.call_args.kwargs
+        assert kwargs["json"]["stream"] is True
+        assert kwargs["stream"] is True
+        assert tokens == ["Гото", "вый протокол"]
+        assert response.content == "Готовый протокол"
+        assert response.provider_raw["choices"][0]["message"]["content"] == "Готовый протокол"
+        assert response.provider_raw["choices"][0]["finish_reason"] == "stop"
+        assert response.provider_raw["model"] == "deepseek-chat"
+        http_client.post.return_value.close.assert_called_once()
+
+    def test_generate_protocol_stream_handles_broken_event(self):
+        config = ProtocolConfig(provider="deepseek", api_key="key", stream=True)
+        request = ProtocolRequest(instructions="Инструкции", transcript="Стенограмма", config=config)
+        http_client = Mock()
+        http_client.post.return_value = self._create_stream_response([b"data: {oops", b""])
+
+        client = DeepSeekProtocolClient(api_key="key", http_client=http_client)
+
+        with pytest.raises(ProtocolClientError, match="Некорректное событие"):
+            client.generate_protocol(request)
+
+    def test_generate_protocol_stream_handles_interrupted_connection(self):
+        config = ProtocolConfig(provider="deepseek", api_key="key", stream=True)
+        request = ProtocolRequest(instructions="Инструкции", transcript="Стенограмма", config=config)
 
+        def lines():
+            yield 'data: {"choices": [{"delta": {"content": "Начало"}}]}'.encode()
+            yield b""
+            raise requests.ConnectionError("reset")
 
+        http_client = Mock()
+        http_client.post.return_value = self._create_stream_response(lines())
+
+        client = DeepSeekProtocolClient(api_key="key", http_client=http_client)
+
+        with pytest.raises(ProtocolClientError, match="прерван"):
+            client.generate_protocol(request)
+
+    def test_client_owns_pooled_session(self):
+        with DeepSeekProtocolClient(api_key="key", pool_size=4) as client:
+            session = client._http_client
+            assert isinstance(session, requests.Session)
+            assert session.get_adapter("https://api.deepseek.com")._pool_maxsize == 4
+            session.close = Mock()
+        session.close.assert_called_once()
+
+    def test_close_leaves_external_http_client_open(self):
+        http_client = Mock()
+
+        with DeepSeekProtocolClient(api_key="key", http_client=http_client):
+            pass
+
+        http_client.close.assert_not_called()
+
+    def test_stream_is_read_to_the_end_after_done(self):
+        config = ProtocolConfig(provider="deepseek", api_key="key", stream=True)
+        request = ProtocolRequest(instructions="Инструкции", transcript="Стенограмма", config=config)
+        consumed = []
+
+        def lines():
+            yield 'data: {"choices": [{"delta": {"content": "Текст"}}]}'.encode()
+            yield b""
+            yield b"data: [DONE]"
+            yield b""
+            consumed.append(True)
+
+        http_client = Mock()
+        http_client.post.return_value = self._create_stream_response(lines())
+
+        client = DeepSeekProtocolClient(api_key="key", http_client=http_client)
+
+        assert client.generate_protocol(request).content == "Текст"
+        assert consumed == [True]
+
+
+@pytest.mark.unit
+def test_iter_sse_data_joins_multiline_events_and_skips_comments():
+    lines = [": ping", "event: message", "data: первая", "data:вторая", "", "id: 7", "data: {}", ""]
+
+    assert list(iter_sse_data(lines)) == ["первая\nвторая", "{}"]
+
+
+@pytest.mark.unit
+def test_iter_sse_data_decodes_bytes_as_utf8_and_flushes_tail():
+    assert list(iter_sse_data(["data: хвост".encode("utf-8")])) == ["хвост"]
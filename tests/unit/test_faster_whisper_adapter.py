@@ -349,3 +349,14 @@ class TestFasterWhisperAdapter:
         assert "⚠️  ПРЕДУПРЕЖДЕНИЕ: Проверьте результат faster-whisper" in stderr
         assert "⚠️  ПРЕДУПРЕЖДЕНИЕ: Проверьте результат faster-whisper" in stderr
 
+
+    def test_transcribe_decoded_samples_skip_long_recording_warning(self, capsys):
+        """Окна и фрагменты (декодированные отсчёты) не повторяют предупреждение о длинных записях."""
+        adapter = FasterWhisperAdapter(Mock())
+        segment = MagicMock(start=0.0, end=1.0, text=" окно ")
+        mock_model = Mock()
+        mock_model.transcribe.return_value = (iter([segment]), MagicMock())
+
+        list(adapter.transcribe(model=mock_model, audio_path=[0.0] * 16000, language="ru"))
+
+        assert "Проверьте результат faster-whisper" not in capsys.readouterr().err
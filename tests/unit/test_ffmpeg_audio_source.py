@@ -0,0 +1,143 @@
+"""Тесты для FFmpegAudioSource."""
+
+import io
+import shutil
+
+import numpy as np
+import pytest
+
+from app.adapters.output.audio import FFmpegAudioSource
+from app.adapters.output.file_writer import FileOutputWriter
+from app.application.ports import ITranscriptionEngine
+from app.application.services import TranscriptionService
+from app.domain.models.transcript import Segment
+
+RATE = 10
+
+
+class _FakeProcess:
+    """Процесс ffmpeg, отдающий заранее подготовленные PCM-отсчёты."""
+
+    def __init__(self, samples, returncode=0):
+        self.stdout = io.BytesIO(np.asarray(samples, dtype=np.int16).tobytes())
+        self.returncode = returncode
+        self.killed = False
+
+    def wait(self):
+        return self.returncode
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+
+
+def _source(samples, returncode=0):
+    processes = []
+
+    def factory(command, **kwargs):
+        processes.append(command)
+        return _FakeProcess(samples, returncode)
+
+    return FFmpegAudioSource(sample_rate=RATE, process_factory=factory), processes
+
+
+@pytest.mark.unit
+class TestFFmpegAudioSource:
+    """Тесты для FFmpegAudioSource."""
+
+    def test_windows_cover_recording_with_overlap(self):
+        source, _ = _source(np.arange(250))
+
+        windows = list(source.windows("a.wav", window_duration=10, overlap=1))
+
+        chunks = [chunk for chunk, _ in windows]
+        assert [(c.own_start, c.own_end) for c in chunks] == [(0, 10), (10, 20), (20, 25)]
+        assert [(c.start, c.end) for c in chunks] == [(0, 11), (9, 21), (19, 25)]
+        assert [len(samples) for _, samples in windows] == [110, 120, 60]
+        # Отсчёты окна соответствуют своему месту в записи
+        assert windows[1][1][0] == pytest.approx(90 / 32768.0)
+
+    def test_start_offset_shifts_window_times(self):
+        source, processes = _source(np.zeros(50))
+
+        chunks = [chunk for chunk, _ in source.windows("a.wav", window_duration=10, start=60)]
+
+        assert "-ss" in processes[0]
+        assert [(c.own_start, c.own_end) for c in chunks] == [(60, 65)]
+
+    def test_empty_recording_yields_nothing(self):
+        source, _ = _source([])
+
+        assert list(source.windows("a.wav", window_duration=10)) == []
+
+    def test_ffmpeg_failure_raises_runtime_error(self):
+        source, _ = _source(np.zeros(5), returncode=1)
+
+        with pytest.raises(RuntimeError, match="не смог декодировать"):
+            list(source.windows("a.wav", window_duration=10))
+
+    def test_rejects_non_positive_window(self):
+        source, _ = _source([])
+
+        with pytest.raises(ValueError):
+            list(source.windows("a.wav", window_duration=0))
+
+
+@pytest.mark.unit
+def test_transcription_service_streams_windows_and_stitches_segments(tmp_path):
+    """В потоковом режиме движок получает окна, а сегменты сшиваются в абсолютном времени."""
+    source, _ = _source(np.zeros(250))
+
+    # Сегменты каждого окна во времени относительно начала окна
+    window_segments = [
+        [Segment(start=1.0, end=2.0, text="первое"), Segment(start=9.5, end=10.3, text="на стыке")],
+        [Segment(start=0.6, end=1.4, text="на стыке"), Segment(start=5.0, end=6.0, text="второе")],
+        [Segment(start=2.0, end=3.0, text="третье")],
+    ]
+
+    class _Engine(ITranscriptionEngine):
+        def __init__(self):
+            self.window_lengths = []
+
+        def load_model(self, model_name, **kwargs):
+            return "model"
+
+        def transcribe(self, model, audio_path, language, **kwargs):
+            self.window_lengths.append(len(audio_path))
+            return iter(window_segments[len(self.window_lengths) - 1])
+
+    engine = _Engine()
+    service = TranscriptionService(engine=engine, audio_source=source, stream_overlap=1)
+    result = list(service.transcribe(
+        "a.wav", FileOutputWriter(str(tmp_path / "out.txt"), verbose=False), "small", stream_window=10
+    ))
+
+    assert engine.window_lengths == [110, 120, 60]
+    assert [(s.start, s.text) for s in result] == [
+        (1.0, "первое"),
+        (9.5, "на стыке"),
+        (14.0, "второе"),
+        (21.0, "третье"),
+    ]
+
+
+@pytest.mark.integration
+def test_ffmpeg_audio_source_streams_real_file(tmp_path):
+    if not shutil.which("ffmpeg"):
+        pytest.skip("ffmpeg не установлен")
+    import subprocess
+
+    path = tmp_path / "tone.wav"
+    subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-f", "lavfi",
+         "-i", "sine=frequency=440:duration=5:sample_rate=16000", str(path)],
+        check=True,
+    )
+
+    windows = list(FFmpegAudioSource().windows(str(path), window_duration=2, overlap=0.5))
+
+    assert len(windows) == 3
+    assert windows[-1][0].own_end == pytest.approx(5.0, abs=0.05)
+    assert all(samples.dtype.name == "float32" for _, samples in windows)
@@ -1,7 +1,7 @@
 """Тесты для FileOutputWriter."""
 
 import pytest
-from app.adapters.output.file_writer import FileOutputWriter
+from app.adapters.output.file_writer import FileOutputWriter, FlushPolicy
 from app.domain.models.transcript import Segment
 from app.application.ports.output_port import ITranscriptSegmentWriter
 
@@ -157,3 +157,92 @@ class TestFileOutputWriter:
         assert "[0:00 - 0:01] \n" in content
 
 
+    
+    def test_file_output_writer_checkpoint_returns_offset(self, tmp_path):
+        """checkpoint() сбрасывает данные на диск и возвращает смещение в файле."""
+        output_file = tmp_path / "test_output.txt"
+        writer = FileOutputWriter(str(output_file), verbose=False)
+        
+        writer.write_segment(Segment(start=0.0, end=1.0, text="Тест"))
+        offset = writer.checkpoint()
+        
+        assert offset == len(output_file.read_bytes())
+        writer.close()
+    
+    def test_file_output_writer_resume_truncates_and_appends(self, tmp_path):
+        """При resume_offset файл обрезается до смещения и дописывается."""
+        output_file = tmp_path / "test_output.txt"
+        writer = FileOutputWriter(str(output_file), verbose=False)
+        writer.write_segment(Segment(start=0.0, end=1.0, text="Первое"))
+        offset = writer.checkpoint()
+        writer.write_segment(Segment(start=1.0, end=2.0, text="Незафиксированное"))
+        writer.close()
+        
+        resumed = FileOutputWriter(str(output_file), verbose=False, resume_offset=offset)
+        resumed.write_segment(Segment(start=1.0, end=2.0, text="Второе"))
+        resumed.close()
+        
+        content = output_file.read_text(encoding='utf-8')
+        assert content == "[0:00 - 0:01] Первое\n[0:01 - 0:02] Второе\n"
+
+
+@pytest.mark.unit
+class TestFileOutputWriterFlushPolicy:
+    """Тесты пакетного сброса FileOutputWriter."""
+    
+    def test_flushes_every_n_segments(self, tmp_path):
+        """Данные попадают в файл пакетами по N сегментов."""
+        output_file = tmp_path / "test_output.txt"
+        writer = FileOutputWriter(str(output_file), flush_policy=FlushPolicy(every_segments=2))
+        
+        writer.write_segment(Segment(start=0.0, end=1.0, text="Первое"))
+        assert output_file.read_text(encoding='utf-8') == ""
+        writer.write_segment(Segment(start=1.0, end=2.0, text="Второе"))
+        assert output_file.read_text(encoding='utf-8').count("\n") == 2
+        writer.close()
+    
+    def test_flushes_by_interval(self, tmp_path):
+        """Буфер сбрасывается, если с прошлого сброса прошло больше interval секунд."""
+        now = [0.0]
+        output_file = tmp_path / "test_output.txt"
+        writer = FileOutputWriter(
+            str(output_file), flush_policy=FlushPolicy(interval=5.0), clock=lambda: now[0]
+        )
+        
+        writer.write_segment(Segment(start=0.0, end=1.0, text="Первое"))
+        assert output_file.read_text(encoding='utf-8') == ""
+        now[0] = 6.0
+        writer.write_segment(Segment(start=1.0, end=2.0, text="Второе"))
+        assert "Второе" in output_file.read_text(encoding='utf-8')
+        writer.close()
+    
+    def test_console_output_is_batched(self, tmp_path, capsys):
+        """Вывод в консоль выполняется при сбросе, одним блоком."""
+        writer = FileOutputWriter(
+            str(tmp_path / "out.txt"), verbose=True, flush_policy=FlushPolicy(every_segments=10)
+        )
+        writer.write_segment(Segment(start=0.0, end=1.0, text="Первое"))
+        assert capsys.readouterr().out == ""
+        
+        writer.close()
+        
+        assert capsys.readouterr().out == "[0:00 - 0:01] Первое\n"
+    
+    def test_close_and_checkpoint_flush_pending_segments(self, tmp_path):
+        """checkpoint() и close() сбрасывают накопленные сегменты независимо от политики."""
+        output_file = tmp_path / "test_output.txt"
+        writer = FileOutputWriter(str(output_file), flush_policy=FlushPolicy())
+        writer.write_segment(Segment(start=0.0, end=1.0, text="Первое"))
+        
+        assert writer.checkpoint() == len(output_file.read_bytes()) > 0
+        writer.write_segment(Segment(start=1.0, end=2.0, text="Второе"))
+        writer.close()
+        
+        assert "Второе" in output_file.read_text(encoding='utf-8')
+    
+    def test_invalid_policy_is_rejected(self):
+        """Некорректные параметры политики отклоняются."""
+        with pytest.raises(ValueError):
+            FlushPolicy(every_segments=0)
+        with pytest.raises(ValueError):
+            FlushPolicy(interval=0)
@@ -0,0 +1,70 @@
+"""Тесты для кэша лемм и его файлового хранилища."""
+
+import pytest
+
+from app.adapters.output.storage import JsonLemmaCacheStore
+from app.application.services import LemmaCache
+from app.domain.models.word_analysis import LemmaInfo
+
+INFO = LemmaInfo(pos="NOUN", grammemes=frozenset({"Sing", "nomn"}), normal_form="работа")
+
+
+@pytest.mark.unit
+class TestLemmaCache:
+    """Тесты для LemmaCache."""
+
+    def test_evicts_least_recently_used_word(self):
+        cache = LemmaCache(max_size=2)
+        cache.get_or_compute("а", lambda word: INFO)
+        cache.get_or_compute("б", lambda word: INFO)
+        cache.get_or_compute("а", lambda word: INFO)
+        cache.get_or_compute("в", lambda word: INFO)
+
+        assert list(cache.items()) == ["а", "в"]
+        assert cache.stats().evictions == 1
+
+    def test_update_does_not_count_as_hits(self):
+        cache = LemmaCache()
+
+        cache.update([("работы", INFO)])
+
+        assert cache.get_or_compute("работы", lambda word: pytest.fail("не должен вызываться")) == INFO
+        assert cache.stats().misses == 0
+        assert "попаданий 1" in cache.stats().to_text()
+
+    def test_put_parsed_counts_first_lookup_as_miss(self):
+        cache = LemmaCache()
+        cache.get_or_compute("работа", lambda word: INFO)
+
+        cache.put_parsed([("работы", INFO), ("работа", INFO)])
+        for _ in range(2):
+            cache.get_or_compute("работы", lambda word: pytest.fail("не должен вызываться"))
+        cache.get_or_compute("работа", lambda word: INFO)
+
+        assert (cache.stats().hits, cache.stats().misses) == (2, 2)
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(ValueError):
+            LemmaCache(max_size=0)
+
+
+@pytest.mark.unit
+class TestJsonLemmaCacheStore:
+    """Тесты для JsonLemmaCacheStore."""
+
+    def test_roundtrip(self, tmp_path):
+        store = JsonLemmaCacheStore(str(tmp_path / "cache" / "lemmas.json"))
+
+        store.save({"работы": INFO, "и": LemmaInfo(pos=None, grammemes=frozenset(), normal_form="и")})
+
+        assert store.load() == {"работы": INFO, "и": LemmaInfo(None, frozenset(), "и")}
+
+    def test_missing_or_corrupted_file_gives_empty_cache(self, tmp_path):
+        path = tmp_path / "lemmas.json"
+        assert JsonLemmaCacheStore(str(path)).load() == {}
+
+        path.write_text("{broken", encoding="utf-8")
+        assert JsonLemmaCacheStore(str(path)).load() == {}
+
+        path.write_text('{"version": 999, "entries": {}}', encoding="utf-8")
+        assert JsonLemmaCacheStore(str(path)).load() == {}
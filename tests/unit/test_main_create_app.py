@@ -29,7 +29,7 @@ def test_create_app_tag_handler_uses_shared_morph():
     service_instance_1._morph = morph_instance
     service_instance_2._morph = morph_instance
 
-    with patch("pymorphy3.MorphAnalyzer", return_value=morph_instance), \
+    with patch("pymorphy3.MorphAnalyzer", return_value=morph_instance) as morph_class_mock, \
          patch("app.adapters.input.cli.TagCommandHandler", return_value=tag_handler_instance) as tag_handler_mock, \
          patch("app.factories.create_word_analysis_service") as word_service_mock:
         word_service_mock.side_effect = [service_instance_1, service_instance_2]
@@ -50,6 +50,9 @@ def test_create_app_tag_handler_uses_shared_morph():
 
     first_call_kwargs = word_service_mock.call_args_list[0].kwargs
     second_call_kwargs = word_service_mock.call_args_list[1].kwargs
-    assert first_call_kwargs["dependencies"]["morph"] is morph_instance
-    assert second_call_kwargs["dependencies"]["morph"] is morph_instance
+    # Анализатор общий для сервисов и не загружается, пока не понадобится лемматизация
+    shared_morph = first_call_kwargs["dependencies"]["morph"]
+    assert second_call_kwargs["dependencies"]["morph"] is shared_morph
+    assert not shared_morph.loaded
+    morph_class_mock.assert_not_called()
 
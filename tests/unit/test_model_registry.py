@@ -0,0 +1,121 @@
+"""Тесты для ModelRegistry."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters.output.whisper import (
+    FasterWhisperAdapter,
+    ModelKey,
+    ModelRegistry,
+    WhisperAdapter,
+    get_default_model_registry,
+)
+from app.adapters.output.whisper.model_registry import estimate_model_size
+
+
+def _key(name: str, compute_type: str = "int8") -> ModelKey:
+    return ModelKey(engine="faster-whisper", model_name=name, compute_type=compute_type, device="auto")
+
+
+@pytest.mark.unit
+class TestModelRegistry:
+    """Тесты для ModelRegistry."""
+
+    def test_second_request_is_served_from_cache(self):
+        registry = ModelRegistry()
+        loader = Mock(return_value="model")
+
+        first = registry.get_or_load(_key("base"), loader)
+        second = registry.get_or_load(_key("base"), loader)
+
+        assert first == second == "model"
+        loader.assert_called_once_with()
+        stats = registry.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+        assert stats.total_load_time >= 0.0
+
+    def test_different_compute_type_is_different_model(self):
+        registry = ModelRegistry()
+
+        registry.get_or_load(_key("base", "int8"), lambda: "int8")
+        result = registry.get_or_load(_key("base", "float16"), lambda: "float16")
+
+        assert result == "float16"
+        assert registry.stats().misses == 2
+
+    def test_evicts_least_recently_used_model(self):
+        registry = ModelRegistry(max_models=2)
+        registry.get_or_load(_key("tiny"), lambda: "tiny")
+        registry.get_or_load(_key("base"), lambda: "base")
+        registry.get_or_load(_key("tiny"), lambda: "tiny")
+        registry.get_or_load(_key("small"), lambda: "small")
+
+        assert _key("tiny") in registry
+        assert _key("base") not in registry
+        assert _key("small") in registry
+        assert registry.stats().evictions == 1
+
+    def test_memory_budget_evicts_but_keeps_latest_model(self):
+        registry = ModelRegistry(max_models=None, memory_budget=100, size_estimator=lambda key: 80)
+        registry.get_or_load(_key("tiny"), lambda: "tiny")
+        registry.get_or_load(_key("base"), lambda: "base")
+
+        assert len(registry) == 1
+        assert _key("base") in registry
+        assert registry.stats().cached_bytes == 80
+
+    def test_concurrent_requests_load_model_once(self):
+        registry = ModelRegistry()
+        loader = Mock(return_value="model")
+        threads = [
+            threading.Thread(target=registry.get_or_load, args=(_key("base"), loader))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        loader.assert_called_once_with()
+        assert registry.stats().hits == 7
+
+    def test_clear_unloads_models(self):
+        registry = ModelRegistry()
+        registry.get_or_load(_key("base"), lambda: "model")
+
+        registry.clear()
+
+        assert len(registry) == 0
+        assert "промахов 1" in registry.stats().to_text()
+
+
+@pytest.mark.unit
+def test_estimate_model_size_depends_on_compute_type():
+    assert estimate_model_size(_key("small", "int8")) == 244_000_000
+    assert estimate_model_size(_key("large-v3", "float16")) == 3_100_000_000
+    assert estimate_model_size(_key("Systran/faster-whisper-base.en", "float32")) == 296_000_000
+
+
+@pytest.mark.unit
+def test_get_default_model_registry_is_shared():
+    assert get_default_model_registry() is get_default_model_registry()
+
+
+@pytest.mark.unit
+def test_adapters_reuse_models_from_registry():
+    registry = ModelRegistry()
+    faster_model_class = Mock()
+    whisper_module = Mock()
+
+    faster_adapter = FasterWhisperAdapter(faster_model_class, compute_type="int8", model_registry=registry)
+    whisper_adapter = WhisperAdapter(whisper_module, model_registry=registry)
+
+    assert faster_adapter.load_model("base") is faster_adapter.load_model("base")
+    assert whisper_adapter.load_model("base") is whisper_adapter.load_model("base")
+
+    faster_model_class.assert_called_once_with("base", compute_type="int8")
+    whisper_module.load_model.assert_called_once_with("base")
+    assert len(registry) == 2
@@ -0,0 +1,52 @@
+"""Тесты для NgramCounter."""
+
+import pytest
+
+from app.utils.ngrams import NgramCounter
+
+
+def _feed(counter, *segments):
+    for segment in segments:
+        for word in segment.split():
+            counter.add(word)
+        counter.reset()
+
+
+@pytest.mark.unit
+class TestNgramCounter:
+    def test_counts_rolling_window_for_each_size(self):
+        counter = NgramCounter((2, 3), min_count=1)
+        _feed(counter, "новый релиз сервиса", "новый релиз")
+
+        assert dict(counter.most_common(10)) == {
+            "новый релиз": 2,
+            "релиз сервиса": 1,
+            "новый релиз сервиса": 1,
+        }
+
+    def test_reset_breaks_ngrams(self):
+        counter = NgramCounter((2,), min_count=1)
+        _feed(counter, "код ревью", "ревью код")
+
+        assert "ревью ревью" not in dict(counter.most_common(10))
+        assert len(counter) == 2
+
+    def test_min_count_filters_result(self):
+        counter = NgramCounter((2,), min_count=2)
+        _feed(counter, "код ревью код ревью тест")
+
+        assert counter.most_common(10) == [("код ревью", 2)]
+
+    def test_pruning_bounds_memory_and_keeps_frequent(self):
+        counter = NgramCounter((2,), min_count=2, max_entries=20)
+        for i in range(200):
+            _feed(counter, "частый оборот", f"слово{i} шум{i}")
+
+        assert len(counter) <= 20
+        assert counter.pruned
+        assert counter.most_common(1)[0][0] == "частый оборот"
+
+    @pytest.mark.parametrize("sizes", [(), (1, 2)])
+    def test_rejects_invalid_sizes(self, sizes):
+        with pytest.raises(ValueError):
+            NgramCounter(sizes)
@@ -0,0 +1,152 @@
+"""Тесты для ParallelTranscriptionService и разбиения записи на фрагменты."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.ports import ITranscriptionEngine, ITranscriptSegmentWriter
+from app.application.services import ParallelTranscriptionService
+from app.application.services.parallel_transcription import plan_chunks, stitch_chunk_segments
+from app.domain.models.transcript import AudioChunk, Segment
+
+
+class FakeEngine(ITranscriptionEngine):
+    """Движок, возвращающий сегменты, заданные в абсолютном времени записи."""
+
+    def __init__(self, timeline):
+        self._timeline = timeline
+        self.loaded = []
+
+    def load_model(self, model_name, **kwargs):
+        self.loaded.append(model_name)
+        return model_name
+
+    def transcribe(self, model, audio_path, language, **kwargs):
+        # audio_path - это (start, duration), который вернул fake-загрузчик
+        start, duration = audio_path
+        for segment in self._timeline:
+            if segment.start >= start and segment.end <= start + duration:
+                yield Segment(segment.start - start, segment.end - start, segment.text)
+
+
+def fake_audio_loader(path, start=0.0, duration=None):
+    return (start, duration)
+
+
+@pytest.mark.unit
+class TestPlanChunks:
+    """Тесты для plan_chunks."""
+
+    def test_short_record_is_single_chunk(self):
+        chunks = plan_chunks(duration=100.0, silences=[], chunk_duration=600.0, overlap=5.0)
+
+        assert chunks == [AudioChunk(index=0, start=0.0, end=100.0, own_start=0.0, own_end=100.0)]
+
+    def test_cuts_at_longest_silence_near_target(self):
+        silences = [(95.0, 96.0), (104.0, 108.0), (300.0, 301.0)]
+        chunks = plan_chunks(duration=250.0, silences=silences, chunk_duration=100.0, overlap=2.0)
+
+        assert chunks[0].own_end == pytest.approx(106.0)
+        assert chunks[1].own_start == pytest.approx(106.0)
+        assert chunks[0].end == pytest.approx(108.0)
+        assert chunks[1].start == pytest.approx(104.0)
+        assert chunks[-1].own_end == 250.0
+
+    def test_cuts_at_target_without_silences(self):
+        chunks = plan_chunks(duration=250.0, silences=[], chunk_duration=100.0, overlap=0.0)
+
+        assert [(c.own_start, c.own_end) for c in chunks] == [(0.0, 100.0), (100.0, 200.0), (200.0, 250.0)]
+
+    def test_zero_duration_returns_no_chunks(self):
+        assert plan_chunks(duration=0.0, silences=[]) == []
+
+
+@pytest.mark.unit
+def test_stitch_chunk_segments_shifts_and_keeps_owned_segments():
+    chunk = AudioChunk(index=1, start=95.0, end=205.0, own_start=100.0, own_end=200.0)
+    segments = [
+        Segment(0.0, 4.0, "чужой"),
+        Segment(6.0, 10.0, "свой"),
+        Segment(106.0, 110.0, "следующий"),
+    ]
+
+    result = stitch_chunk_segments(chunk, segments)
+
+    assert result == [Segment(101.0, 105.0, "свой")]
+
+
+@pytest.mark.unit
+class TestParallelTranscriptionService:
+    """Тесты для ParallelTranscriptionService."""
+
+    def _create_service(self, engine, silences, duration):
+        return ParallelTranscriptionService(
+            engine_factory=lambda: (engine, "small"),
+            workers=2,
+            chunk_duration=10.0,
+            overlap=2.0,
+            silence_detector=Mock(return_value=(duration, silences)),
+            audio_loader=fake_audio_loader,
+            executor_factory=ThreadPoolExecutor,
+        )
+
+    def test_transcribe_stitches_segments_in_order(self):
+        timeline = [
+            Segment(0.0, 4.0, "один"),
+            Segment(4.5, 9.0, "два"),
+            Segment(10.5, 14.0, "три"),
+            Segment(15.0, 19.0, "четыре"),
+            Segment(21.0, 24.0, "пять"),
+        ]
+        engine = FakeEngine(timeline)
+        service = self._create_service(engine, silences=[(9.0, 10.5), (19.0, 21.0)], duration=24.0)
+        writer = Mock(spec=ITranscriptSegmentWriter)
+
+        result = list(service.transcribe(
+            input_path="audio.mp3",
+            output_writer=writer,
+            model_name="small",
+            language="ru",
+        ))
+
+        assert [segment.text for segment in result] == ["один", "два", "три", "четыре", "пять"]
+        assert [call.args[0] for call in writer.write_segment.call_args_list] == result
+        writer.close.assert_called_once_with()
+        assert set(engine.loaded) == {"small"}
+
+    def test_transcribe_drops_duplicates_from_overlap(self):
+        # Сегмент на стыке распознан обоими фрагментами с разными таймингами
+        chunk_segments = {
+            0.0: [Segment(0.0, 8.5, "начало"), Segment(8.5, 11.0, "стык")],
+            8.0: [Segment(2.2, 3.4, "стык"), Segment(5.0, 10.0, "конец")],
+        }
+
+        class OverlapEngine(FakeEngine):
+            def transcribe(self, model, audio_path, language, **kwargs):
+                return iter(chunk_segments[audio_path[0]])
+
+        service = self._create_service(OverlapEngine([]), silences=[], duration=18.0)
+
+        result = list(service.transcribe(
+            input_path="audio.mp3",
+            output_writer=Mock(spec=ITranscriptSegmentWriter),
+            model_name="small",
+        ))
+
+        assert [segment.text for segment in result] == ["начало", "стык", "конец"]
+
+    def test_transcribe_closes_writer_on_worker_error(self):
+        engine = Mock(spec=ITranscriptionEngine)
+        engine.transcribe.side_effect = RuntimeError("сбой воркера")
+        service = self._create_service(engine, silences=[], duration=5.0)
+        writer = Mock(spec=ITranscriptSegmentWriter)
+
+        with pytest.raises(RuntimeError, match="сбой воркера"):
+            list(service.transcribe(input_path="audio.mp3", output_writer=writer, model_name="small"))
+
+        writer.close.assert_called_once_with()
+
+    def test_requires_positive_workers(self):
+        with pytest.raises(ValueError):
+            ParallelTranscriptionService(engine_factory=Mock(), workers=0)
@@ -0,0 +1,133 @@
+"""Тесты для ParallelWordAnalysisService."""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pymorphy3
+import pytest
+
+from app.application.services import ParallelWordAnalysisService
+from app.application.services.word_analysis import WordAnalysisService
+from app.domain.models.word_analysis import WordAnalysisConfig
+
+LINES = [
+    "[00:00 - 00:05] Работы было много, работа шла",
+    "[00:05 - 00:10] Иванов делал работу, Петров делал тесты",
+    "",
+    "Тесты проверяют работу сервиса и тесты падают редко",
+    "[00:10 - 00:15] Сервис работал, сервисы работают",
+] * 7
+
+
+def _morph_factory():
+    return pymorphy3.MorphAnalyzer(lang="ru")
+
+
+@pytest.fixture(scope="module")
+def morph():
+    return _morph_factory()
+
+
+def _parallel(morph, workers=3, shard_lines=2, executor_factory=ThreadPoolExecutor):
+    return ParallelWordAnalysisService(
+        service=WordAnalysisService(morph_analyzer=morph),
+        morph_factory=lambda: morph,
+        workers=workers,
+        shard_lines=shard_lines,
+        executor_factory=executor_factory,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("lemmatize, exclude_names", [(False, False), (True, False), (True, True)])
+def test_parallel_result_matches_serial(morph, lemmatize, exclude_names):
+    config = WordAnalysisConfig(limit=100, lemmatize=lemmatize, exclude_names=exclude_names)
+    serial = WordAnalysisService(morph_analyzer=morph).analyze(LINES, ["было"], config)
+
+    result = _parallel(morph).analyze(iter(LINES), ["было"], config)
+
+    assert result.items == serial.items
+    assert result.to_text() == serial.to_text()
+
+
+@pytest.mark.unit
+def test_parsed_forms_are_stored_in_main_lemma_cache(morph):
+    service = _parallel(morph)
+
+    service.analyze(LINES, [], WordAnalysisConfig(limit=10, lemmatize=True))
+
+    assert "работы" in service.lemma_cache
+    assert service.lemma_cache.items()["работы"].normal_form == "работа"
+
+
+@pytest.mark.unit
+def test_lemma_cache_stats_match_serial(morph):
+    config = WordAnalysisConfig(limit=10, lemmatize=True)
+    serial = WordAnalysisService(morph_analyzer=morph)
+    parallel = _parallel(morph)
+
+    serial.analyze(LINES, [], config)
+    parallel.analyze(LINES, [], config)
+
+    assert parallel.lemma_cache.stats() == serial.lemma_cache.stats()
+
+
+@pytest.mark.unit
+def test_workers_use_service_tokenizer(morph, monkeypatch):
+    from app.application.services import parallel_word_analysis
+
+    used = []
+    original = parallel_word_analysis.get_tokenizer
+    monkeypatch.setattr(
+        parallel_word_analysis, "get_tokenizer", lambda name=None: used.append(name) or original(name)
+    )
+    service = ParallelWordAnalysisService(
+        service=WordAnalysisService(morph_analyzer=morph, tokenizer="translate"),
+        morph_factory=lambda: morph,
+        workers=2,
+        shard_lines=2,
+        executor_factory=ThreadPoolExecutor,
+    )
+
+    service.analyze(LINES, [], WordAnalysisConfig(limit=10))
+
+    assert used and set(used) == {"translate"}
+
+
+@pytest.mark.unit
+def test_raises_when_no_words(morph):
+    with pytest.raises(ValueError):
+        _parallel(morph).analyze(["[00:00 - 00:05] да", "ок"], [], WordAnalysisConfig())
+
+
+@pytest.mark.unit
+def test_rejects_invalid_settings(morph):
+    with pytest.raises(ValueError):
+        _parallel(morph, workers=0)
+    with pytest.raises(ValueError):
+        _parallel(morph, shard_lines=0)
+
+
+@pytest.mark.unit
+def test_process_pool_matches_serial(morph):
+    config = WordAnalysisConfig(limit=20, lemmatize=True)
+    serial = WordAnalysisService(morph_analyzer=morph).analyze(LINES, [], config)
+    service = ParallelWordAnalysisService(
+        service=WordAnalysisService(morph_analyzer=morph),
+        morph_factory=partial(pymorphy3.MorphAnalyzer, lang="ru"),
+        workers=2,
+        shard_lines=10,
+    )
+
+    assert service.analyze(LINES, [], config).items == serial.items
+
+
+@pytest.mark.unit
+def test_analyze_files_matches_serial(morph):
+    files = [("a.txt", LINES[:6]), ("b.txt", LINES[6:])]
+    config = WordAnalysisConfig(limit=30, lemmatize=True)
+    serial = WordAnalysisService(morph_analyzer=morph).analyze_files(files, [], config, per_file=True)
+
+    result = _parallel(morph).analyze_files(iter(files), [], config, per_file=True)
+
+    assert result.to_text() == serial.to_text()
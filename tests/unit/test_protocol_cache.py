@@ -0,0 +1,119 @@
+"""Тесты для кэша ответов LLM."""
+
+import os
+from dataclasses import replace
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters.output.storage import JsonProtocolResponseCache
+from app.application.services import CachingProtocolClient, protocol_cache_key
+from app.domain.models.protocol import ProtocolConfig, ProtocolRequest, ProtocolResponse
+
+
+def _request(**config_changes) -> ProtocolRequest:
+    config = replace(ProtocolConfig(api_key="key"), **config_changes)
+    return ProtocolRequest(instructions="Инструкции", transcript="Стенограмма", config=config)
+
+
+@pytest.mark.unit
+class TestProtocolCacheKey:
+    def test_key_depends_on_prompt_and_model_parameters(self):
+        base = protocol_cache_key(_request())
+
+        assert protocol_cache_key(_request()) == base
+        assert protocol_cache_key(_request(model="other")) != base
+        assert protocol_cache_key(_request(temperature=0.1)) != base
+        assert protocol_cache_key(_request(extra_params={"max_tokens": 10})) != base
+        assert protocol_cache_key(replace(_request(), transcript="Другая")) != base
+
+    def test_key_ignores_output_and_transport_settings(self):
+        base = protocol_cache_key(_request())
+
+        assert protocol_cache_key(_request(stream=True, request_timeout=5, max_parallel_requests=8)) == base
+
+
+@pytest.mark.unit
+class TestJsonProtocolResponseCache:
+    def test_put_and_get_round_trip(self, tmp_path):
+        cache = JsonProtocolResponseCache(str(tmp_path / "cache"))
+        cache.put("k", ProtocolResponse(content="Протокол", provider_raw={"id": "1"}))
+
+        assert cache.get("k") == ProtocolResponse(content="Протокол", provider_raw={"id": "1"})
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self, tmp_path):
+        now = [1000.0]
+        cache = JsonProtocolResponseCache(str(tmp_path), ttl_seconds=60, clock=lambda: now[0])
+        cache.put("k", ProtocolResponse(content="Протокол"))
+
+        now[0] += 61
+
+        assert cache.get("k") is None
+        assert not os.path.exists(tmp_path / "k.json")
+
+    def test_evicts_least_recently_used_over_size_limit(self, tmp_path):
+        entry_size = len('{"created_at": 0, "content": "' + "x" * 100 + '", "provider_raw": null}')
+        cache = JsonProtocolResponseCache(str(tmp_path), max_bytes=entry_size * 2 + 10, clock=lambda: 0)
+        cache.put("a", ProtocolResponse(content="x" * 100))
+        cache.put("b", ProtocolResponse(content="x" * 100))
+        os.utime(tmp_path / "a.json", (1, 1))
+        os.utime(tmp_path / "b.json", (2, 2))
+
+        cache.put("c", ProtocolResponse(content="x" * 100))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    def test_corrupted_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "k.json").write_text("{oops", encoding="utf-8")
+
+        assert JsonProtocolResponseCache(str(tmp_path)).get("k") is None
+        assert not (tmp_path / "k.json").exists()
+
+
+@pytest.mark.unit
+class TestCachingProtocolClient:
+    def test_second_identical_request_is_served_from_cache(self, tmp_path):
+        inner = Mock()
+        inner.generate_protocol.return_value = ProtocolResponse(content="Протокол")
+        client = CachingProtocolClient(inner, JsonProtocolResponseCache(str(tmp_path)))
+
+        first = client.generate_protocol(_request())
+        second = client.generate_protocol(_request())
+
+        inner.generate_protocol.assert_called_once()
+        assert first.content == second.content == "Протокол"
+        assert client.stats().hits == 1
+        assert client.stats().misses == 1
+        assert client.stats().to_text() == "Кэш ответов LLM: из кэша 1, запросов к провайдеру 1"
+
+    def test_cache_hit_is_replayed_to_stream(self, tmp_path):
+        cache = JsonProtocolResponseCache(str(tmp_path))
+        cache.put(protocol_cache_key(_request(stream=True)), ProtocolResponse(content="Протокол"))
+        inner = Mock()
+        tokens = []
+
+        CachingProtocolClient(inner, cache).generate_protocol(_request(stream=True), on_token=tokens.append)
+
+        inner.generate_protocol.assert_not_called()
+        assert tokens == ["Протокол"]
+
+    def test_provider_errors_are_not_cached(self, tmp_path):
+        inner = Mock()
+        inner.generate_protocol.side_effect = [RuntimeError("сбой"), ProtocolResponse(content="Протокол")]
+        client = CachingProtocolClient(inner, JsonProtocolResponseCache(str(tmp_path)))
+
+        with pytest.raises(RuntimeError):
+            client.generate_protocol(_request())
+
+        assert client.generate_protocol(_request()).content == "Протокол"
+        assert inner.generate_protocol.call_count == 2
+
+    def test_close_closes_inner_client(self, tmp_path):
+        inner = Mock()
+
+        CachingProtocolClient(inner, JsonProtocolResponseCache(str(tmp_path))).close()
+
+        inner.close.assert_called_once()
@@ -59,3 +59,14 @@ def test_create_protocol_service_returns_protocol_service(monkeypatch):
     service = create_protocol_service(client)
     assert isinstance(service, DummyProtocolService)
 
+
+
+def test_deepseek_client_pool_covers_parallel_requests():
+    config = ProtocolConfig(provider="deepseek", api_key="key", max_parallel_requests=32)
+
+    client = create_protocol_client(config)
+    try:
+        adapter = client._http_client.get_adapter("https://api.deepseek.com")
+        assert adapter._pool_maxsize == 32
+    finally:
+        client.close()
@@ -82,6 +82,7 @@ class TestProtocolCommandHandlerUnit:
             config=config,
         )
         output_writer.assert_called_once_with(str(tmp_path / "out.txt"), "RESULT")
+        service.close.assert_called_once()
 
     def test_execute_raises_when_provider_section_missing(self, tmp_path):
         transcript_file = tmp_path / "input.txt"
@@ -137,4 +138,75 @@ class TestProtocolCommandHandlerUnit:
         with pytest.raises(FileNotFoundError, match="Файл с инструкциями не найден"):
             handler.execute(options)
 
+    def test_execute_streams_tokens_to_writer(self, tmp_path):
+        transcript_file = tmp_path / "transcript.txt"
+        transcript_file.write_text("raw transcript", encoding="utf-8")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("placeholder", encoding="utf-8")
+        output_file = tmp_path / "out.md"
+
+        def generate_protocol(instructions, transcript, config, on_token=None):
+            assert config.stream is True
+            for token in ("Про", "токол"):
+                on_token(token)
+            return ProtocolResponse(content="Протокол")
+
+        service = Mock()
+        service.generate_protocol.side_effect = generate_protocol
+        output_writer = Mock()
+
+        handler = ProtocolCommandHandler(
+            config_loader=Mock(return_value={"provider": "deepseek", "deepseek": {"api_key": "key"}}),
+            transcript_reader=Mock(return_value="TRANS"),
+            protocol_client_factory=Mock(),
+            protocol_service_factory=Mock(return_value=service),
+            output_writer=output_writer,
+        )
+
+        handler.execute(ProtocolCommandOptions(
+            transcript_path=str(transcript_file),
+            output_path=str(output_file),
+            config_path=str(config_file),
+            stream=True,
+        ))
+
+        assert output_file.read_text(encoding="utf-8") == "Протокол"
+        output_writer.assert_not_called()
+
+    def test_default_config_parser_reads_stream_flag(self):
+        config = ProtocolCommandHandler._default_config_parser(
+            "deepseek", {"api_key": "key", "stream": True, "max_tokens": 10}, None
+        )
+
+        assert config.stream is True
+        assert config.extra_params == {"max_tokens": 10}
+
+    def test_execute_wraps_client_with_response_cache(self, tmp_path):
+        transcript_file = tmp_path / "transcript.txt"
+        transcript_file.write_text("raw transcript", encoding="utf-8")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("placeholder", encoding="utf-8")
+        provider_client = Mock()
+        provider_client.generate_protocol.return_value = ProtocolResponse(content="Протокол")
+        output_writer = Mock()
+
+        handler = ProtocolCommandHandler(
+            config_loader=Mock(return_value={"provider": "deepseek", "deepseek": {"api_key": "key"}}),
+            transcript_reader=Mock(return_value="TRANS"),
+            protocol_client_factory=Mock(return_value=provider_client),
+            output_writer=output_writer,
+        )
+        options = ProtocolCommandOptions(
+            transcript_path=str(transcript_file),
+            output_path=None,
+            config_path=str(config_file),
+            use_cache=True,
+            cache_dir=str(tmp_path / "cache"),
+        )
+
+        handler.execute(options)
+        handler.execute(options)
 
+        provider_client.generate_protocol.assert_called_once()
+        assert output_writer.call_count == 2
+        output_writer.assert_called_with(None, "Протокол")
@@ -0,0 +1,61 @@
+"""Тесты для доменных моделей протокола."""
+
+import pytest
+
+from app.domain.models.protocol import ProtocolConfig, ProtocolRequest, split_transcript
+
+TRANSCRIPT = "\n".join([
+    "[0:00 - 0:05] Открываем встречу",
+    "[0:05 - 0:09] Обсуждаем релиз",
+    "продолжение реплики",
+    "[0:09 - 0:12] Итоги",
+])
+
+
+@pytest.mark.unit
+def test_split_transcript_keeps_segments_whole():
+    chunks = split_transcript(TRANSCRIPT, max_chars=90)
+
+    assert [chunk.text for chunk in chunks] == [
+        "[0:00 - 0:05] Открываем встречу\n[0:05 - 0:09] Обсуждаем релиз\nпродолжение реплики",
+        "[0:09 - 0:12] Итоги",
+    ]
+    assert (chunks[0].start, chunks[0].end) == ("0:00", "0:09")
+    assert chunks[1].title(len(chunks)) == "Часть 2 из 2 (0:09 - 0:12)"
+
+
+@pytest.mark.unit
+def test_split_transcript_returns_single_chunk_when_fits():
+    chunks = split_transcript(TRANSCRIPT, max_chars=len(TRANSCRIPT))
+
+    assert len(chunks) == 1
+    assert chunks[0].text == TRANSCRIPT
+
+
+@pytest.mark.unit
+def test_split_transcript_splits_oversized_segment_by_words():
+    chunks = split_transcript("[0:00 - 1:00] " + "слово " * 20, max_chars=30)
+
+    assert all(len(chunk.text) <= 30 for chunk in chunks)
+    assert " ".join(chunk.text for chunk in chunks).split()[3:] == ["слово"] * 20
+    assert {chunk.start for chunk in chunks} == {"0:00"}
+
+
+@pytest.mark.unit
+def test_render_prompt_uses_transcript_title():
+    request = ProtocolRequest(
+        instructions="Инструкции",
+        transcript="Протоколы",
+        config=ProtocolConfig(),
+        transcript_title="Частичные протоколы",
+    )
+
+    assert request.render_prompt() == "Инструкции\n\n**Частичные протоколы:**\n\nПротоколы"
+
+
+@pytest.mark.unit
+def test_protocol_config_rejects_invalid_chunking():
+    with pytest.raises(ValueError):
+        ProtocolConfig(max_chunk_chars=0)
+    with pytest.raises(ValueError):
+        ProtocolConfig(max_parallel_requests=0)
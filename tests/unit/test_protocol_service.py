@@ -1,5 +1,6 @@
 """Тесты для ProtocolService."""
 
+import threading
 from unittest.mock import Mock
 
 import pytest
@@ -50,5 +51,90 @@ class TestProtocolService:
                 config=config,
             )
 
+    def test_long_transcript_is_summarized_by_chunks_and_reduced(self):
+        config = ProtocolConfig(api_key="key", max_chunk_chars=200, max_parallel_requests=2)
+        transcript = "\n".join(f"[0:{i:02d} - 0:{i + 1:02d}] реплика номер {i} " + "слово " * 20 for i in range(4))
+        requests = []
+        lock = threading.Lock()
 
+        def generate(request):
+            with lock:
+                requests.append(request)
+            if request.transcript_title == "Расшифровка":
+                return ProtocolResponse(content="итог " + request.transcript.split()[5])
+            return ProtocolResponse(content="ПРОТОКОЛ")
 
+        client = Mock()
+        client.generate_protocol.side_effect = generate
+        service = ProtocolService(client=client)
+
+        response = service.generate_protocol("Инструкции", transcript, config)
+
+        assert response.content == "ПРОТОКОЛ"
+        chunk_requests = [r for r in requests if r.transcript_title == "Расшифровка"]
+        assert len(chunk_requests) == 4
+        assert all(r.instructions.startswith("Инструкции") for r in chunk_requests)
+        reduce_request = requests[-1]
+        assert reduce_request.transcript_title == "Частичные протоколы"
+        # Частичные протоколы сводятся в порядке частей
+        assert [line for line in reduce_request.transcript.split("\n") if line.startswith("итог")] == [
+            "итог 0", "итог 1", "итог 2", "итог 3",
+        ]
+        assert "## Часть 1 из 4 (0:00 - 0:01)" in reduce_request.transcript
+
+    def test_partials_exceeding_limit_are_reduced_in_levels(self):
+        config = ProtocolConfig(api_key="key", max_chunk_chars=60)
+        transcript = "\n".join(f"[0:{i:02d} - 0:{i + 1:02d}] реплика номер {i}" for i in range(8))
+        client = Mock()
+        client.generate_protocol.side_effect = lambda request: ProtocolResponse(content="x" * 20)
+        service = ProtocolService(client=client)
+
+        service.generate_protocol("", transcript, config)
+
+        prompts = [call.args[0] for call in client.generate_protocol.call_args_list]
+        reduce_requests = [r for r in prompts if r.transcript_title == "Частичные протоколы"]
+        # 4 части -> 2 промежуточных свода -> итоговый
+        assert len(prompts) == 4 + 2 + 1
+        assert len(reduce_requests) == 3
+        assert reduce_requests[-1].transcript.startswith("## Части 1-2 из 4 (0:00 - 0:04)")
+
+    def test_short_transcript_is_sent_in_one_request(self):
+        config = ProtocolConfig(api_key="key", max_chunk_chars=1000)
+        client = Mock()
+        client.generate_protocol.return_value = ProtocolResponse(content="result")
+        service = ProtocolService(client=client, executor_factory=Mock())
+
+        service.generate_protocol("Инструкции", "[0:00 - 0:05] коротко", config)
+
+        client.generate_protocol.assert_called_once()
+
+    def test_on_token_receives_only_final_protocol(self):
+        config = ProtocolConfig(api_key="key", max_chunk_chars=40, stream=True)
+        transcript = "\n".join(f"[0:{i:02d} - 0:{i + 1:02d}] реплика номер {i}" for i in range(2))
+        calls = []
+        lock = threading.Lock()
+
+        def generate(request, on_token=None):
+            with lock:
+                calls.append((request, on_token))
+            return ProtocolResponse(content="готово")
+
+        client = Mock()
+        client.generate_protocol.side_effect = generate
+        service = ProtocolService(client=client)
+        on_token = Mock()
+
+        service.generate_protocol("Инструкции", transcript, config, on_token=on_token)
+
+        *inner, (final_request, final_on_token) = calls
+        assert final_on_token is on_token
+        assert final_request.config.stream is True
+        assert all(token is None and not request.config.stream for request, token in inner)
+
+    def test_context_manager_closes_client(self):
+        client = Mock()
+
+        with ProtocolService(client=client) as service:
+            assert isinstance(service, ProtocolService)
+
+        client.close.assert_called_once()
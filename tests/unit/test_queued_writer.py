@@ -0,0 +1,78 @@
+"""Тесты для QueuedSegmentWriter."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters.output import FileOutputWriter, QueuedSegmentWriter
+from app.application.ports import ITranscriptSegmentWriter
+from app.domain.models.transcript import Segment
+
+
+def _segment(index: int) -> Segment:
+    return Segment(start=float(index), end=float(index + 1), text=f"Сегмент {index}")
+
+
+@pytest.mark.unit
+class TestQueuedSegmentWriter:
+    """Тесты для QueuedSegmentWriter."""
+
+    def test_writes_all_segments_in_order(self, tmp_path):
+        output_file = tmp_path / "out.txt"
+        writer = QueuedSegmentWriter(FileOutputWriter(str(output_file)), max_queue=2)
+
+        for index in range(50):
+            writer.write_segment(_segment(index))
+        writer.close()
+
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 50
+        assert lines[0].endswith("Сегмент 0") and lines[-1].endswith("Сегмент 49")
+
+    def test_write_blocks_when_queue_is_full(self):
+        release = threading.Event()
+        inner = Mock(spec=ITranscriptSegmentWriter)
+        inner.write_segment.side_effect = lambda segment: release.wait(5)
+        writer = QueuedSegmentWriter(inner, max_queue=1)
+
+        writer.write_segment(_segment(0))  # забирает фоновый поток и блокируется
+        writer.write_segment(_segment(1))  # заполняет очередь
+        producer = threading.Thread(target=writer.write_segment, args=(_segment(2),))
+        producer.start()
+        producer.join(0.2)
+
+        assert producer.is_alive()
+        release.set()
+        producer.join(5)
+        writer.close()
+        assert inner.write_segment.call_count == 3
+
+    def test_error_is_raised_on_close(self):
+        inner = Mock(spec=ITranscriptSegmentWriter)
+        inner.write_segment.side_effect = OSError("диск заполнен")
+        writer = QueuedSegmentWriter(inner)
+
+        writer.write_segment(_segment(0))
+        with pytest.raises(OSError, match="диск заполнен"):
+            writer.close()
+        inner.close.assert_called_once_with()
+
+    def test_checkpoint_waits_for_queue(self, tmp_path):
+        output_file = tmp_path / "out.txt"
+        writer = QueuedSegmentWriter(FileOutputWriter(str(output_file)))
+        for index in range(10):
+            writer.write_segment(_segment(index))
+
+        offset = writer.checkpoint()
+
+        assert offset == len(output_file.read_bytes())
+        assert output_file.read_text(encoding="utf-8").count("\n") == 10
+        writer.close()
+
+    def test_write_after_close_is_rejected(self):
+        writer = QueuedSegmentWriter(Mock(spec=ITranscriptSegmentWriter))
+        writer.close()
+
+        with pytest.raises(ValueError):
+            writer.write_segment(_segment(0))
@@ -0,0 +1,49 @@
+"""Тесты для SpaceSavingCounter."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from app.utils.space_saving import SpaceSavingCounter
+
+
+@pytest.mark.unit
+class TestSpaceSavingCounter:
+    def test_exact_while_items_fit(self):
+        counter = SpaceSavingCounter(capacity=10)
+        for item in "абвгбвбв":
+            counter.add(item)
+
+        assert counter.most_common(3) == Counter("абвгбвбв").most_common(3)
+        assert counter.error_bound == 0
+        assert counter.total == 8
+
+    def test_memory_is_bounded_and_estimates_respect_error_bound(self):
+        rng = random.Random(7)
+        stream = [f"w{min(int(rng.paretovariate(1.2)), 5000)}" for _ in range(20_000)]
+        exact = Counter(stream)
+        counter = SpaceSavingCounter(capacity=100)
+        for item in stream:
+            counter.add(item)
+
+        assert len(counter) == 100
+        bound = counter.error_bound
+        assert 0 < bound <= len(stream) / 100
+        for item, estimate in counter.most_common(100):
+            assert exact[item] <= estimate <= exact[item] + bound
+        # Всё, что встречалось чаще погрешности, гарантированно осталось в таблице
+        tracked = {item for item, _ in counter.most_common(100)}
+        assert {item for item, count in exact.items() if count > bound} <= tracked
+
+    def test_new_item_inherits_minimum_count(self):
+        counter = SpaceSavingCounter(capacity=2)
+        for item in ["a", "a", "b", "c"]:
+            counter.add(item)
+
+        assert counter.most_common(2) == [("a", 2), ("c", 2)]
+        assert counter.error_bound == 2
+
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            SpaceSavingCounter(capacity=0)
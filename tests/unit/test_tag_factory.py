@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock
 
+from app.adapters.output import morph_analyzer
+from app.adapters.output.morph_analyzer import LazyMorphAnalyzer
 from app.factories.tag_factory import create_word_analysis_service
 
 
@@ -11,24 +13,25 @@ def test_create_word_analysis_service_with_dependencies():
     assert service._morph is morph
 
 
-def test_create_word_analysis_service_creates_default_analyzer(monkeypatch):
+def test_create_word_analysis_service_defers_default_analyzer(monkeypatch):
     created = {}
 
     class FakeMorph:
-        pass
+        def parse(self, word):
+            return [word]
 
     def fake_morph_analyzer(lang):
         created["lang"] = lang
         return FakeMorph()
 
-    monkeypatch.setattr(
-        create_word_analysis_service.__globals__["pymorphy3"],
-        "MorphAnalyzer",
-        fake_morph_analyzer,
-    )
+    monkeypatch.setattr("pymorphy3.MorphAnalyzer", fake_morph_analyzer)
+    monkeypatch.setattr(morph_analyzer, "_shared_analyzers", {})
 
     service = create_word_analysis_service()
-    assert isinstance(service._morph, FakeMorph)
-    assert created["lang"] == "ru"
-
+    assert isinstance(service._morph, LazyMorphAnalyzer)
+    assert not service._morph.loaded
+    assert created == {}
 
+    assert service._morph.parse("слово") == ["слово"]
+    assert created["lang"] == "ru"
+    assert morph_analyzer.get_shared_morph_analyzer("ru") is service._morph._analyzer
@@ -1,11 +1,13 @@
 """Тесты для TagCommandHandler."""
 
+from collections import Counter
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 from app.adapters.input.cli import TagCommandHandler, TagCommandOptions
+from app.application.services.word_analysis import WordAnalysisService
 from app.domain.models.word_analysis import WordFrequencyResult
 
 
@@ -62,3 +64,194 @@ class TestTagCommandHandler:
         with pytest.raises(FileNotFoundError):
             handler.execute(options)
 
+    def test_execute_loads_and_saves_lemma_cache(self, tmp_path: Path):
+        transcript = tmp_path / "transcript.txt"
+        transcript.write_text("foo", encoding="utf-8")
+        service = Mock()
+        service.analyze.return_value = WordFrequencyResult(items=[("foo", 1)])
+        service.lemma_cache.items.return_value = {"foo": "cached"}
+        store = Mock()
+        store.load.return_value = {"bar": "stored"}
+        store_factory = Mock(return_value=store)
+
+        handler = TagCommandHandler(
+            file_reader=Mock(return_value=["foo"]),
+            stopwords_loader=Mock(return_value=[]),
+            analysis_service_factory=Mock(return_value=service),
+            output_writer=Mock(),
+            lemma_cache_store_factory=store_factory,
+        )
+
+        handler.execute(TagCommandOptions(
+            transcript_path=str(transcript),
+            output_path=None,
+            lemmatize=True,
+            lemma_cache_path="lemmas.json",
+        ))
+
+        store_factory.assert_called_once_with("lemmas.json")
+        service.lemma_cache.update.assert_called_once()
+        assert list(service.lemma_cache.update.call_args.args[0]) == [("bar", "stored")]
+        store.save.assert_called_once_with({"foo": "cached"})
+
+    def test_default_file_reader_streams_lines(self, tmp_path: Path):
+        transcript = tmp_path / "transcript.txt"
+        transcript.write_text("первая\nвторая\n", encoding="utf-8")
+
+        lines = TagCommandHandler._default_file_reader(str(transcript))
+
+        assert not isinstance(lines, list)
+        assert list(lines) == ["первая\n", "вторая\n"]
+
+    def test_execute_wraps_service_for_workers(self, tmp_path: Path):
+        transcript = tmp_path / "transcript.txt"
+        transcript.write_text("foo bar", encoding="utf-8")
+        service = Mock()
+        parallel_service = Mock()
+        parallel_service.analyze.return_value = WordFrequencyResult(items=[("foo", 1)])
+        parallel_factory = Mock(return_value=parallel_service)
+
+        handler = TagCommandHandler(
+            stopwords_loader=Mock(return_value=[]),
+            analysis_service_factory=Mock(return_value=service),
+            output_writer=Mock(),
+            parallel_analysis_factory=parallel_factory,
+        )
+        handler.execute(TagCommandOptions(transcript_path=str(transcript), output_path=None, workers=4))
+
+        parallel_factory.assert_called_once_with(service, 4)
+        parallel_service.analyze.assert_called_once()
+        service.analyze.assert_not_called()
+
+    def test_execute_aggregates_globs_directories_and_manifest(self, tmp_path: Path):
+        meetings = tmp_path / "meetings"
+        meetings.mkdir()
+        for name in ("01.txt", "02.txt", "notes.md"):
+            (meetings / name).write_text(name, encoding="utf-8")
+        extra = tmp_path / "extra.txt"
+        extra.write_text("extra", encoding="utf-8")
+        manifest = tmp_path / "manifest.txt"
+        manifest.write_text("# квартал\nextra.txt\nmeetings/01.txt\n", encoding="utf-8")
+
+        analyzed = []
+
+        def analyze_files(files, **kwargs):
+            analyzed.extend(name for name, lines in files)
+            return WordFrequencyResult(items=[("text", len(analyzed))])
+
+        service = Mock()
+        service.analyze_files.side_effect = analyze_files
+        read = []
+
+        def file_reader(path):
+            read.append(path)
+            return ["text"]
+
+        analysis_factory = Mock(return_value=service)
+        handler = TagCommandHandler(
+            file_reader=file_reader,
+            stopwords_loader=Mock(return_value=[]),
+            analysis_service_factory=analysis_factory,
+            output_writer=Mock(),
+        )
+        handler.execute(TagCommandOptions(
+            transcript_path=None,
+            output_path=None,
+            transcript_paths=(str(meetings / "*.txt"),),
+            input_dir=str(meetings),
+            manifest_path=str(manifest),
+            per_file=True,
+        ))
+
+        analysis_factory.assert_called_once_with()
+        expected = [str(meetings / "01.txt"), str(meetings / "02.txt"), str(extra)]
+        assert analyzed == read == expected
+        assert service.analyze_files.call_args.kwargs["per_file"] is True
+
+    def test_execute_raises_when_glob_matches_nothing(self, tmp_path: Path):
+        handler = TagCommandHandler(analysis_service_factory=Mock())
+
+        with pytest.raises(FileNotFoundError):
+            handler.execute(TagCommandOptions(
+                transcript_path=None,
+                output_path=None,
+                transcript_paths=(str(tmp_path / "*.txt"),),
+            ))
+
+    def test_execute_uses_frequency_index(self, tmp_path: Path):
+        transcript = tmp_path / "transcript.txt"
+        transcript.write_text("раз два раз", encoding="utf-8")
+        index = Mock()
+        index.content_hash.return_value = "hash"
+        index.load.return_value = Counter({"раз": 2, "два": 1})
+        output_writer = Mock()
+        file_reader = Mock()
+
+        handler = TagCommandHandler(
+            file_reader=file_reader,
+            stopwords_loader=Mock(return_value=["два"]),
+            analysis_service_factory=Mock(return_value=WordAnalysisService(morph_analyzer=Mock())),
+            output_writer=output_writer,
+            word_index_factory=Mock(return_value=index),
+        )
+        handler.execute(TagCommandOptions(
+            transcript_path=str(transcript), output_path=None, index_path=str(tmp_path / "tags.sqlite")
+        ))
+
+        file_reader.assert_not_called()
+        index.load.assert_called_once_with("hash", "forms")
+        index.close.assert_called_once_with()
+        output_writer.assert_called_once_with(None, "раз: 2")
+
+    def test_execute_passes_ngram_options_to_config(self, tmp_path: Path):
+        transcript = tmp_path / "transcript.txt"
+        transcript.write_text("foo bar", encoding="utf-8")
+        service = Mock()
+        service.analyze.return_value = WordFrequencyResult(items=[("foo", 1)], ngrams=[("foo bar", 2)])
+        output_writer = Mock()
+
+        handler = TagCommandHandler(
+            file_reader=Mock(return_value=["foo bar"]),
+            stopwords_loader=Mock(return_value=[]),
+            analysis_service_factory=Mock(return_value=service),
+            output_writer=output_writer,
+        )
+
+        handler.execute(TagCommandOptions(
+            transcript_path=str(transcript),
+            output_path=None,
+            ngram_sizes=(2, 3),
+            ngram_min_count=5,
+        ))
+
+        config = service.analyze.call_args.kwargs["config"]
+        assert config.ngram_sizes == (2, 3)
+        assert config.ngram_min_count == 5
+        output_writer.assert_called_once_with(None, "foo: 1\n\n# Словосочетания\nfoo bar: 2")
+
+    def test_execute_rejects_ngrams_with_index(self, tmp_path: Path):
+        handler = TagCommandHandler(file_reader=Mock(), stopwords_loader=Mock(), output_writer=Mock())
+
+        with pytest.raises(ValueError):
+            handler.execute(TagCommandOptions(
+                transcript_path=str(tmp_path / "a.txt"),
+                output_path=None,
+                ngram_sizes=(2,),
+                index_path=str(tmp_path / "index.sqlite"),
+            ))
+
+    def test_execute_passes_tokenizer_to_service_factory(self, tmp_path: Path):
+        transcript = tmp_path / "meeting.txt"
+        transcript.write_text("text", encoding="utf-8")
+        service = Mock()
+        service.analyze.return_value = WordFrequencyResult(items=[("text", 1)])
+        analysis_factory = Mock(return_value=service)
+        handler = TagCommandHandler(
+            stopwords_loader=Mock(return_value=[]),
+            analysis_service_factory=analysis_factory,
+            output_writer=Mock(),
+        )
+
+        handler.execute(TagCommandOptions(transcript_path=str(transcript), output_path=None, tokenizer="translate"))
+
+        analysis_factory.assert_called_once_with(tokenizer="translate")
@@ -0,0 +1,37 @@
+"""Тесты для токенизаторов text_analysis."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from app.utils.text_analysis import TOKENIZERS, WORD_PATTERN, get_tokenizer
+
+TRICKY_TEXT = (
+    "Привет, мир! abc1 éabc Ёлки-палки под_чёрк рус123 ok python слово #abc €xyz 中文abc "
+    "«цитата» — тире №5 ёжик ЁЖИК naïve café Ђорђе іван 😀смайл смайл😀 tab\tnew\nline nbsp"
+)
+ALPHABET = list("абвгдеёжзийклмнопрстуфхцчшщъыьэюяАЯЁabcxyzABZ") + list("0_-.,!? \n\t#«»—éі中😀 ")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", sorted(TOKENIZERS))
+def test_tokenizers_match_word_pattern(name):
+    tokenizer = get_tokenizer(name)
+    rng = random.Random(name)
+    samples = [TRICKY_TEXT, TRICKY_TEXT.lower(), ""] + [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 200))) for _ in range(300)
+    ]
+
+    for text in samples:
+        expected = WORD_PATTERN.findall(text)
+        assert tokenizer.tokenize(text) == expected
+        counts = Counter({"старое": 1})
+        tokenizer.count(text, counts)
+        assert list(counts.items()) == list((Counter({"старое": 1}) + Counter(expected)).items())
+
+
+@pytest.mark.unit
+def test_get_tokenizer_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        get_tokenizer("simd")
@@ -0,0 +1,83 @@
+"""Тесты для доменных моделей транскрипции."""
+
+import pytest
+
+from app.domain.models import ColumnarTranscript, Segment, Transcript
+
+
+def _transcript() -> Transcript:
+    return Transcript(
+        segments=[
+            Segment(start=0.0, end=1.5, text="Первый"),
+            Segment(start=1.5, end=65.0, text=""),
+            Segment(start=65.0, end=3700.0, text="Третий сегмент"),
+            Segment(start=3700.0, end=3701.0, text="Последний"),
+        ],
+        language="ru",
+        model="small",
+    )
+
+
+@pytest.mark.unit
+def test_segment_has_no_instance_dict():
+    segment = Segment(start=0.0, end=1.0, text="Тест")
+
+    assert not hasattr(segment, "__dict__")
+    assert segment == Segment(start=0.0, end=1.0, text="Тест")
+
+
+@pytest.mark.unit
+class TestColumnarTranscript:
+    """Тесты для ColumnarTranscript."""
+
+    def test_to_text_matches_transcript(self):
+        transcript = _transcript()
+
+        columnar = ColumnarTranscript.from_transcript(transcript)
+
+        assert columnar.to_text() == transcript.to_text()
+        assert columnar.to_transcript() == transcript
+
+    def test_views_expose_segment_fields(self):
+        columnar = ColumnarTranscript.from_transcript(_transcript())
+
+        view = columnar[2]
+
+        assert (view.start, view.end, view.text) == (65.0, 3700.0, "Третий сегмент")
+        assert columnar[-1].to_segment() == Segment(start=3700.0, end=3701.0, text="Последний")
+        assert not hasattr(view, "__dict__")
+        with pytest.raises(IndexError):
+            columnar[10]
+
+    def test_slice_time_selects_segments_by_start(self):
+        columnar = ColumnarTranscript.from_transcript(_transcript())
+
+        part = columnar.slice_time(1.0, 3700.0)
+
+        assert [view.text for view in part] == ["", "Третий сегмент"]
+        assert part.to_text() == "[0:01 - 1:05] \n[1:05 - 1:01:40] Третий сегмент"
+        assert len(columnar.slice_time(start=3700.0)) == 1
+        assert len(columnar.slice_time(end=0.0)) == 0
+
+    def test_slice_time_on_unsorted_segments(self):
+        columnar = ColumnarTranscript.from_segments(
+            [Segment(5.0, 6.0, "б"), Segment(1.0, 2.0, "а"), Segment(9.0, 10.0, "в")],
+            language="ru",
+            model="small",
+        )
+
+        assert [view.text for view in columnar.slice_time(0.0, 6.0)] == ["б", "а"]
+
+    def test_index_slice_rebases_text_offsets(self):
+        columnar = ColumnarTranscript.from_transcript(_transcript())
+
+        tail = columnar[2:]
+
+        assert [view.text for view in tail] == ["Третий сегмент", "Последний"]
+        assert len(columnar[3:1]) == 0
+
+    def test_rejects_inconsistent_columns(self):
+        from array import array
+
+        with pytest.raises(ValueError):
+            ColumnarTranscript(array('d', [0.0]), array('d'), "", array('q', [0]), "ru", "small")
@@ -180,6 +180,23 @@ class TestTranscriptionService:
         # Writer должен быть закрыт даже при ошибке
         assert output_writer._file.closed
     
+    def test_transcription_service_transcribe_closes_writer_on_load_error(self, tmp_path):
+        """Тест закрытия writer при ошибке загрузки модели."""
+        mock_engine = Mock(spec=ITranscriptionEngine)
+        mock_engine.load_model.side_effect = RuntimeError("Модель не найдена")
+        
+        service = TranscriptionService(engine=mock_engine)
+        output_writer = FileOutputWriter(str(tmp_path / "output.txt"), verbose=False)
+        
+        with pytest.raises(RuntimeError, match="Модель не найдена"):
+            list(service.transcribe(
+                input_path="test.mp3",
+                output_writer=output_writer,
+                model_name="small"
+            ))
+        
+        assert output_writer._file.closed
+    
     def test_transcription_service_transcribe_returns_iterator(self, tmp_path):
         """Тест возврата итератора сегментов."""
         mock_engine = Mock(spec=ITranscriptionEngine)
@@ -439,3 +456,57 @@ class TestTranscriptionService:
             call_kwargs = mock_engine.transcribe.call_args[1]
             assert call_kwargs['language'] == language
 
+
+
+@pytest.mark.unit
+class TestTranscriptionServiceStreaming:
+    """Тесты потоковой выдачи сегментов TranscriptionService."""
+    
+    def test_segments_are_yielded_as_they_are_written(self):
+        """Сегмент отдаётся сразу после записи, до получения следующего от движка."""
+        events = []
+        
+        def engine_segments():
+            for index in range(3):
+                events.append(f"engine {index}")
+                yield Segment(start=float(index), end=float(index + 1), text=str(index))
+        
+        mock_engine = Mock(spec=ITranscriptionEngine)
+        mock_engine.transcribe.return_value = engine_segments()
+        writer = Mock(spec=ITranscriptSegmentWriter)
+        writer.write_segment.side_effect = lambda segment: events.append(f"write {segment.text}")
+        service = TranscriptionService(engine=mock_engine)
+        
+        for segment in service.transcribe("test.mp3", writer, "small"):
+            events.append(f"yield {segment.text}")
+        
+        assert events[:4] == ["engine 0", "write 0", "yield 0", "engine 1"]
+        writer.close.assert_called_once_with()
+    
+    def test_early_stop_closes_writer(self):
+        """Если вызывающий код прекращает итерацию, writer всё равно закрывается."""
+        mock_engine = Mock(spec=ITranscriptionEngine)
+        mock_engine.transcribe.return_value = iter(
+            [Segment(start=float(i), end=float(i + 1), text=str(i)) for i in range(5)]
+        )
+        writer = Mock(spec=ITranscriptSegmentWriter)
+        service = TranscriptionService(engine=mock_engine)
+        
+        stream = service.transcribe("test.mp3", writer, "small")
+        next(stream)
+        stream.close()
+        
+        assert writer.write_segment.call_count == 1
+        writer.close.assert_called_once_with()
+    
+    def test_transcribe_to_list_collects_all_segments(self, tmp_path):
+        """transcribe_to_list возвращает весь результат списком."""
+        mock_engine = Mock(spec=ITranscriptionEngine)
+        mock_engine.transcribe.return_value = iter([Segment(start=0.0, end=1.0, text="Один")])
+        service = TranscriptionService(engine=mock_engine)
+        
+        result = service.transcribe_to_list(
+            "test.mp3", FileOutputWriter(str(tmp_path / "out.txt")), "small"
+        )
+        
+        assert result == [Segment(start=0.0, end=1.0, text="Один")]
@@ -93,3 +93,205 @@ def test_analyze_raises_after_filters(service):
     with pytest.raises(ValueError):
         service.analyze(lines=lines, stopwords=[], config=config)
 
+
+
+class CountingMorph(FakeMorph):
+    def __init__(self, mapping: dict):
+        super().__init__(mapping)
+        self.calls = 0
+
+    def parse(self, word: str) -> List[FakeParsed]:
+        self.calls += 1
+        return super().parse(word)
+
+
+def test_lemmatize_parses_each_word_form_once():
+    morph = CountingMorph({"работы": ("работа", "NOUN", {"Sing"})})
+    service = WordAnalysisService(morph_analyzer=morph)
+    config = WordAnalysisConfig(lemmatize=True)
+
+    service.lemmatize_and_filter(["работы", "работы", "работы"], config)
+    result = service.lemmatize_and_filter(["работы"], config)
+
+    assert result == ["работа"]
+    assert morph.calls == 1
+    stats = service.lemma_cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (3, 1, 1)
+    assert stats.hit_rate == 0.75
+
+
+def _token_stream_analysis(service, lines, stopwords, config):
+    """Эталон: прежний подсчёт по полному потоку токенов."""
+    from collections import Counter
+
+    words = service.extract_words(service.extract_text(lines))
+    words = service.lemmatize_and_filter(words, config)
+    words = service.filter_stopwords(words, stopwords)
+    return Counter(words).most_common(config.limit)
+
+
+@pytest.mark.parametrize("lemmatize", [False, True])
+def test_count_first_pipeline_matches_token_stream(lemmatize):
+    mapping = {
+        "работы": ("работа", "NOUN", set()),
+        "работу": ("работа", "NOUN", set()),
+        "иванов": ("иванов", "NOUN", {"Name"}),
+        "для": ("для", "PREP", set()),
+    }
+    lines = [
+        "[0:00 - 0:05] работу делать для проекта",
+        "проекта работы иванов делать",
+        "работы проекта тест тест",
+    ]
+    config = WordAnalysisConfig(lemmatize=lemmatize, exclude_names=True, limit=10)
+    service = WordAnalysisService(morph_analyzer=CountingMorph(mapping))
+
+    result = service.analyze(lines, ["тест"], config)
+
+    expected = _token_stream_analysis(WordAnalysisService(FakeMorph(mapping)), lines, ["тест"], config)
+    assert result.items == expected
+
+
+def test_count_first_pipeline_parses_distinct_forms_only():
+    morph = CountingMorph({})
+    service = WordAnalysisService(morph_analyzer=morph)
+
+    service.analyze(["слово слово слово другое"], [], WordAnalysisConfig(lemmatize=True))
+
+    assert morph.calls == 2
+
+
+def test_count_words_in_lines_consumes_lines_lazily(service):
+    consumed = []
+
+    def lines():
+        for line in ["[00.00 - 00.05] Слово слово", "другое СЛОВО"]:
+            consumed.append(line)
+            yield line
+
+    counts = service.count_words_in_lines(lines())
+
+    assert counts == {"слово": 3, "другое": 1}
+    assert service.count_words(service.extract_text(consumed)) == counts
+
+
+def test_analyze_files_total_matches_analyze_of_all_lines(service):
+    first = ["[00:00 - 00:05] Работы много", "делать работы"]
+    second = ["Иванов делать", "много работы"]
+    config = WordAnalysisConfig(limit=10, lemmatize=True)
+
+    result = service.analyze_files([("a.txt", iter(first)), ("b.txt", iter(second))], [], config, per_file=True)
+
+    assert result.total.items == service.analyze(first + second, [], config).items
+    assert [name for name, _ in result.files] == ["a.txt", "b.txt"]
+    assert result.files[1][1].items == [("иванов", 1), ("делать", 1), ("много", 1), ("работа", 1)]
+
+
+def test_analyze_files_without_breakdown_formats_like_single_result(service):
+    result = service.analyze_files([("a.txt", ["раз два"]), ("b.txt", ["раз"])], [], WordAnalysisConfig())
+
+    assert result.files == []
+    assert result.to_text() == "раз: 2\nдва: 1"
+
+
+def test_corpus_result_text_contains_file_sections(service):
+    result = service.analyze_files(
+        [("a.txt", ["раз два"]), ("b.txt", ["[00:00 - 00:01] ок"])],
+        ["два"],
+        WordAnalysisConfig(),
+        per_file=True,
+    )
+
+    assert result.to_text() == "# Все файлы (2)\nраз: 1\n\n# a.txt\nраз: 1\n\n# b.txt"
+
+
+def test_approximate_mode_matches_exact_when_vocabulary_fits(service):
+    lines = ["Работы делать Иванов работы", "[00.00 - 00.05] делать раз два работы"]
+    exact = service.analyze(lines, ["два"], WordAnalysisConfig(limit=10, lemmatize=True))
+
+    result = service.analyze(lines, ["два"], WordAnalysisConfig(limit=10, lemmatize=True, approximate=True))
+
+    assert result.items == exact.items
+    assert result.error_bound == 0
+    assert result.to_text() == exact.to_text()
+
+
+def test_approximate_mode_reports_error_bound(service):
+    lines = ["частое " * 10 + " ".join(f"шум{chr(1072 + i)}" for i in range(20))]
+    config = WordAnalysisConfig(limit=1, approximate=True, max_counters=5)
+
+    result = service.analyze(lines, [], config)
+
+    assert result.items[0][0] == "частое"
+    assert result.error_bound > 0
+    assert "завышены не более чем на" in result.to_text()
+
+
+def test_counter_capacity_follows_error_rate_and_ceiling():
+    assert WordAnalysisConfig(error_rate=0.01).counter_capacity == 100
+    assert WordAnalysisConfig(error_rate=0.000001, max_counters=500).counter_capacity == 500
+    assert WordAnalysisConfig(error_rate=0.000001, max_counters=None).counter_capacity == 1_000_000
+
+
+def test_tokenizer_choice_does_not_change_result(morph):
+    lines = ["[00.00 - 00.05] Работы, делать: Иванов-работы", "python3 кафе café делать"] * 700
+    config = WordAnalysisConfig(limit=10, lemmatize=True)
+
+    results = [
+        WordAnalysisService(morph_analyzer=morph, tokenizer=name).analyze(lines, [], config).items
+        for name in ("regex", "translate")
+    ]
+
+    assert results[0] == results[1]
+
+
+def test_regex_tokenizer_is_default(morph):
+    assert WordAnalysisService(morph_analyzer=morph).tokenizer_name == "regex"
+    assert WordAnalysisService(morph_analyzer=morph, tokenizer="translate").tokenizer_name == "translate"
+
+
+def test_ngrams_follow_lemmas_and_break_on_filtered_words(service):
+    lines = [
+        "[00.00 - 00.05] делать работы два делать работы",
+        "делать работы",
+        "работы делать",
+    ]
+    config = WordAnalysisConfig(limit=10, lemmatize=True, ngram_sizes=(2,))
+
+    result = service.analyze(lines, ["два"], config)
+
+    # "работа два делать" и граница строки разрывают словосочетания
+    assert result.ngrams == [("делать работа", 3)]
+    assert result.to_text().endswith("\n\n# Словосочетания\nделать работа: 3")
+
+
+def test_ngrams_do_not_change_word_counts(service):
+    lines = ["Работы делать Иванов работы", "делать раз два работы"]
+    config = WordAnalysisConfig(limit=10, lemmatize=True)
+
+    plain = service.analyze(lines, [], config)
+    with_ngrams = service.analyze(lines, [], WordAnalysisConfig(limit=10, lemmatize=True, ngram_sizes=(2, 3)))
+
+    assert with_ngrams.items == plain.items
+    assert plain.ngrams == []
+
+
+def test_ngrams_report_pruning(service):
+    lines = ["раз два три четыре пять шесть раз два"]
+
+    exact = service.analyze(lines, [], WordAnalysisConfig(limit=10, ngram_sizes=(2,), ngram_min_count=1))
+    pruned = service.analyze(
+        lines, [], WordAnalysisConfig(limit=10, ngram_sizes=(2,), ngram_min_count=1, max_ngrams=2)
+    )
+
+    assert not exact.ngrams_pruned
+    assert "обрезался по памяти" not in exact.to_text()
+    assert pruned.ngrams_pruned
+    assert "обрезался по памяти" in pruned.to_text()
+
+
+def test_ngrams_across_files_reject_per_file(service):
+    config = WordAnalysisConfig(ngram_sizes=(2,))
+
+    with pytest.raises(ValueError):
+        service.analyze_files([("a.txt", ["раз раз"])], [], config, per_file=True)
@@ -0,0 +1,134 @@
+"""Тесты для индекса частот слов."""
+
+import os
+from collections import Counter
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters.output.storage import SqliteWordFrequencyIndex
+from app.application.services import IndexedWordAnalysisService
+from app.application.services.indexed_word_analysis import index_variant
+from app.application.services.word_analysis import WordAnalysisService
+from app.domain.models.word_analysis import WordAnalysisConfig
+
+
+class FakeTag:
+    def __init__(self, pos):
+        self.POS = pos
+        self.grammemes = set()
+
+
+class FakeParsed:
+    def __init__(self, normal_form, pos="NOUN"):
+        self.normal_form = normal_form
+        self.tag = FakeTag(pos)
+
+
+class FakeMorph:
+    MAPPING = {"работы": "работа", "работу": "работа", "делал": "делать"}
+
+    def parse(self, word):
+        return [FakeParsed(self.MAPPING.get(word, word))]
+
+
+@pytest.fixture
+def index(tmp_path: Path):
+    with SqliteWordFrequencyIndex(str(tmp_path / "index" / "tags.sqlite")) as index:
+        yield index
+
+
+def _read(path: str):
+    return Path(path).read_text(encoding="utf-8").splitlines()
+
+
+def _write(path: Path, text: str) -> str:
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.unit
+class TestSqliteWordFrequencyIndex:
+    def test_roundtrip_preserves_first_appearance_order(self, index):
+        counts = Counter({"бета": 2, "альфа": 2, "гамма": 5})
+
+        index.save("hash", "lemmas", counts)
+        loaded = index.load("hash", "lemmas")
+
+        assert list(loaded.items()) == list(counts.items())
+        assert index.load("hash", "forms") is None
+
+    def test_empty_counts_are_indexed(self, index):
+        index.save("hash", "forms", Counter())
+
+        assert index.load("hash", "forms") == Counter()
+
+    def test_save_replaces_previous_counts(self, index):
+        index.save("hash", "forms", Counter({"раз": 1, "два": 1}))
+        index.save("hash", "forms", Counter({"три": 3}))
+
+        assert index.load("hash", "forms") == Counter({"три": 3})
+
+    def test_content_hash_follows_content(self, index, tmp_path: Path):
+        first = _write(tmp_path / "a.txt", "одинаковый текст")
+        second = _write(tmp_path / "b.txt", "одинаковый текст")
+        digest = index.content_hash(first)
+
+        assert index.content_hash(second) == digest
+        _write(tmp_path / "a.txt", "другой текст")
+        os.utime(first, ns=(0, 0))
+        assert index.content_hash(first) != digest
+
+    def test_persists_between_connections(self, tmp_path: Path):
+        path = str(tmp_path / "tags.sqlite")
+        with SqliteWordFrequencyIndex(path) as index:
+            index.save("hash", "forms", Counter({"раз": 1}))
+
+        with SqliteWordFrequencyIndex(path) as index:
+            assert index.load("hash", "forms") == Counter({"раз": 1})
+
+
+@pytest.mark.unit
+class TestIndexedWordAnalysisService:
+    def test_result_matches_full_analysis_and_reuses_index(self, index, tmp_path: Path):
+        paths = [
+            _write(tmp_path / "a.txt", "[00:00 - 00:05] Работы много\nтесты делал\n"),
+            _write(tmp_path / "b.txt", "Делал работу, тесты тесты\nмного работы\n"),
+        ]
+        config = WordAnalysisConfig(limit=10, lemmatize=True)
+        service = WordAnalysisService(morph_analyzer=FakeMorph())
+        expected = service.analyze_files([(path, _read(path)) for path in paths], ["много"], config, per_file=True)
+        reader = Mock(side_effect=_read)
+
+        first = IndexedWordAnalysisService(service, index)
+        first_result = first.analyze_paths(paths, reader, ["много"], config, per_file=True)
+        second = IndexedWordAnalysisService(service, index)
+        second_result = second.analyze_paths(paths, reader, ["много"], config, per_file=True)
+
+        assert first_result.to_text() == second_result.to_text() == expected.to_text()
+        assert reader.call_count == 2
+        assert (first.stats().misses, second.stats().hits) == (2, 2)
+
+    def test_changed_transcript_is_reindexed(self, index, tmp_path: Path):
+        path = _write(tmp_path / "a.txt", "раз два")
+        service = IndexedWordAnalysisService(WordAnalysisService(morph_analyzer=FakeMorph()), index)
+        service.analyze_paths([path], _read, [], WordAnalysisConfig())
+
+        _write(tmp_path / "a.txt", "три три")
+        os.utime(path, ns=(0, 0))
+        result = service.analyze_paths([path], _read, [], WordAnalysisConfig())
+
+        assert result.total.items == [("три", 2)]
+        assert service.stats().misses == 2
+
+
+@pytest.mark.unit
+def test_index_variant_depends_on_analysis_options():
+    variants = {
+        index_variant(WordAnalysisConfig()),
+        index_variant(WordAnalysisConfig(lemmatize=True)),
+        index_variant(WordAnalysisConfig(lemmatize=True, exclude_names=True)),
+    }
+    assert len(variants) == 3
+    assert index_variant(WordAnalysisConfig(limit=5, stopwords=["раз"])) == index_variant(WordAnalysisConfig())